@@ -0,0 +1,96 @@
+# bench_roaring_set.py
+# 对比内置 set 与 RoaringSet 的内存占用和集合运算速度。
+#
+# 用法：python bench_roaring_set.py [每个集合的元素个数]
+#   默认 2000000；需求里的规模是几千万，例如 python bench_roaring_set.py 20000000
+#   (内置 set 在这个规模下需要好几 GB 内存)。
+#
+# 三种数据分布：
+#   dense     —— 从 0 ~ 2N 中随机取 N 个 (密度 50%，主要是位图容器)
+#   sparse    —— 从 0 ~ 2**32 中随机取 N 个 (每个桶只有少量元素，主要是数组容器)
+#   clustered —— 由长度 1000 左右的连续区间组成 (主要是游程容器)
+# 内存用 tracemalloc 统计构建完成后仍然占用的字节数 (不含构建时的临时对象)。
+# 参考结果 (2000000 个元素)：dense / clustered 的运算比 set 快 5~80 倍，内存不到 1 MB；
+# sparse 的内存约为 set 的 1/7，但 65536 个小数组逐个运算，速度比 set 慢 3~8 倍。
+
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+
+from roaring_set import RoaringSet
+
+def make_ids(kind, n, rng):
+    if kind == "dense":
+        ids = rng.sample(range(2 * n), n)
+    elif kind == "sparse":
+        ids = rng.sample(range(1 << 32), n)
+    else:
+        ids = []
+        start = rng.randrange(1000)
+        while len(ids) < n:
+            length = rng.randint(500, 1500)
+            ids.extend(range(start, start + length))
+            start += length + rng.randint(100, 3000)
+        del ids[n:]
+    ids.sort()
+    return array('I', ids)
+
+def retained_bytes(build, ids):
+    tracemalloc.start()
+    obj = build(ids)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, size
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+def check_results_are_independent():
+    # 修改运算结果不能影响两个操作数 (只在一边出现的容器会原样进入结果)
+    for op in ("__or__", "__and__", "__sub__", "__xor__"):
+        a, b = RoaringSet([1, 3, 1 << 16]), RoaringSet([3, 5, 2 << 16])
+        before_a, before_b = list(a), list(b)
+        result = getattr(a, op)(b)
+        for value in (2, 4, (1 << 16) + 1, (2 << 16) + 1):
+            result.add(value)
+        result.discard(3)
+        assert list(a) == before_a and list(b) == before_b, f"{op} 的结果和操作数共用了容器"
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000000
+    check_results_are_independent()
+    rng = random.Random(42)
+    print(f"每个集合 {n} 个元素\n")
+    for kind in ("dense", "sparse", "clustered"):
+        ids_a, ids_b = make_ids(kind, n, rng), make_ids(kind, n, rng)
+
+        set_a, set_mem = retained_bytes(set, ids_a)
+        roaring_a, roaring_mem = retained_bytes(RoaringSet.from_sorted, ids_a)
+        set_b = set(ids_b)
+        roaring_b = RoaringSet.from_sorted(ids_b)
+        _, set_build = timed(set, ids_a)
+        _, roaring_build = timed(RoaringSet.from_sorted, ids_a)
+
+        print(f"[{kind}] 容器: {roaring_a.container_counts()}")
+        print(f"  {'':<12}{'set':>14}{'RoaringSet':>14}")
+        print(f"  {'内存':<10}{set_mem / 2**20:>12.1f} MB{roaring_mem / 2**20:>11.2f} MB"
+              f"   (每个元素 {set_mem / n:.1f} B vs {roaring_mem / n:.2f} B)")
+        print(f"  {'构建':<10}{set_build * 1000:>12.0f} ms{roaring_build * 1000:>11.0f} ms")
+        for label, op in (("并集 |", "__or__"), ("交集 &", "__and__"), ("差集 -", "__sub__")):
+            expected, t_set = timed(getattr(set_a, op), set_b)
+            result, t_roaring = timed(getattr(roaring_a, op), roaring_b)
+            assert len(result) == len(expected), "结果与内置 set 不一致"
+            print(f"  {label:<10}{t_set * 1000:>12.0f} ms{t_roaring * 1000:>11.0f} ms"
+                  f"   ({t_set / t_roaring:.1f}x)")
+        probes = rng.sample(list(ids_a[:100000]), 10000)
+        _, t_set = timed(lambda: sum(1 for x in probes if x in set_a))
+        _, t_roaring = timed(lambda: sum(1 for x in probes if x in roaring_a))
+        print(f"  {'成员检查':<8}{t_set / len(probes) * 1e9:>12.0f} ns{t_roaring / len(probes) * 1e9:>11.0f} ns\n")
+        set_a = set_b = None # 下一种数据分布开始前释放这两个大集合
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,412 @@
+# ============================================
+#   roaring_set.py：压缩的大整数集合 (Roaring Bitmap 风格)
+# ============================================
+# A02_data_type.py 演示了 set 的并集、交集、差集。set 里每个整数都是一个独立的 int 对象，
+# 再加上哈希表的槽位，每个元素要占 30~70 字节：几千万个 ID 就是好几 GB。
+#
+# RoaringSet 只存 0 ~ 2**32-1 的非负整数，按高 16 位把整数分桶，每个桶叫一个“容器”，
+# 容器里只存低 16 位，并根据数据的疏密自动选择最省空间的表示：
+# * 数组容器 (array)：元素较少 (<= 4096) 时，用 array('H') 有序存放，每个元素 2 字节；
+# * 位图容器 (bitmap)：元素较多时，用 8 KB 的 bytes 表示 65536 个位 (查找单个元素只需读一个字节)；
+# * 游程容器 (run)：连续的区间 (如 1000~5000) 只记录起点和终点，每段 4 字节。
+#
+# 集合运算按桶进行：容器临时转换成 65536 位的 Python int，& | ^ 就是大整数的位运算，在 C 里按机器字批量完成；
+# 两个小数组之间则借助临时的小 set 计算。每个结果容器再重新挑选最省空间的表示。
+# 注意：每个容器的运算都有固定的解释器开销。数据极稀疏 (每个桶只有几十个元素) 时，
+# 集合运算会比内置 set 慢几倍，但内存仍然只有 set 的几分之一；数据越密集、越连续，优势越大。
+#
+# 序列化格式可以直接 mmap：RoaringSet.from_file() 只解析一个小的目录，
+# 各容器直接引用映射的内存 (memoryview)，用到时才读取，修改时才复制。
+
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import chain
+
+_ARRAY, _BITMAP, _RUN = 0, 1, 2
+_ARRAY_MAX = 4096           # 数组容器最多的元素个数 (超过后位图更省空间)
+_BITMAP_BYTES = 65536 // 8  # 位图容器固定 8 KB
+
+_MAGIC = b"RSET"
+_HEADER = struct.Struct('<4sI')   # 魔数、容器个数
+_ENTRY = struct.Struct('<HBxII')  # 高 16 位、容器类型、元素 / 游程个数、数据偏移
+
+# ---------- 容器之间的转换 ----------
+
+def _positions(bits):
+    # 找出 int 中所有为 1 的位 (与 course_index.py 相同的 bin + find 技巧)
+    text = bin(bits)[:1:-1]
+    result = array('H')
+    pos = text.find('1')
+    while pos != -1:
+        result.append(pos)
+        pos = text.find('1', pos + 1)
+    return result
+
+def _array_to_int(lows):
+    buffer = bytearray(_BITMAP_BYTES)
+    for low in lows:
+        buffer[low >> 3] |= 1 << (low & 7)
+    return int.from_bytes(buffer, 'little')
+
+def _runs_to_int(runs):
+    starts, lasts = runs
+    bits = 0
+    for start, last in zip(starts, lasts):
+        bits |= ((1 << (last - start + 1)) - 1) << start
+    return bits
+
+def _to_int(kind, data):
+    if kind == _BITMAP:
+        return int.from_bytes(data, 'little')
+    if kind == _ARRAY:
+        return _array_to_int(data)
+    return _runs_to_int(data)
+
+def _from_int(bits):
+    """按基数和游程个数挑选最省空间的容器；空容器返回 None"""
+    cardinality = bits.bit_count()
+    if not cardinality:
+        return None
+    starts = bits & ~(bits << 1) # 每段连续 1 的起点
+    run_count = starts.bit_count()
+    if run_count * 4 < min(cardinality * 2, _BITMAP_BYTES):
+        lasts = bits & ~(bits >> 1) # 每段连续 1 的终点
+        return _RUN, (_positions(starts), _positions(lasts))
+    if cardinality <= _ARRAY_MAX:
+        return _ARRAY, _positions(bits)
+    return _BITMAP, bits.to_bytes(_BITMAP_BYTES, 'little')
+
+def _from_lows(lows):
+    """由有序、不重复的低 16 位数组构造容器"""
+    if len(lows) <= _ARRAY_MAX:
+        return _ARRAY, lows
+    return _from_int(_array_to_int(lows))
+
+def _cardinality(kind, data):
+    if kind == _ARRAY:
+        return len(data)
+    if kind == _BITMAP:
+        return _to_int(kind, data).bit_count()
+    starts, lasts = data
+    return sum(lasts) - sum(starts) + len(starts)
+
+def _contains(kind, data, low):
+    if kind == _ARRAY:
+        i = bisect_left(data, low)
+        return i < len(data) and data[i] == low
+    if kind == _BITMAP:
+        return bool(data[low >> 3] >> (low & 7) & 1)
+    starts, lasts = data
+    i = bisect_right(starts, low) - 1
+    return i >= 0 and low <= lasts[i]
+
+def _iter_lows(kind, data):
+    if kind == _ARRAY:
+        return iter(data)
+    if kind == _BITMAP:
+        return iter(_positions(_to_int(kind, data)))
+    starts, lasts = data
+    return chain.from_iterable(map(range, starts, [last + 1 for last in lasts]))
+
+def _nbytes(kind, data):
+    if kind == _ARRAY:
+        return len(data) * 2
+    if kind == _BITMAP:
+        return _BITMAP_BYTES
+    return len(data[0]) * 4
+
+# ---------- 容器级别的集合运算 ----------
+
+_SET_OPS = {
+    "and": set.intersection,
+    "or": set.union,
+    "sub": set.difference,
+    "xor": set.symmetric_difference,
+}
+_INT_OPS = {
+    "and": int.__and__,
+    "or": int.__or__,
+    "sub": lambda a, b: a & ~b,
+    "xor": int.__xor__,
+}
+
+def _copy(container):
+    # add() 会原地修改数组容器：运算结果里原样保留的容器要复制一份，不能和操作数共用
+    kind, data = container
+    if kind == _ARRAY and isinstance(data, array):
+        return _ARRAY, array('H', data)
+    return container
+
+def _combine(op, left, right):
+    (kind1, data1), (kind2, data2) = left, right
+    if kind1 == _ARRAY and kind2 == _ARRAY and (op in ("and", "sub") or len(data1) + len(data2) <= _ARRAY_MAX):
+        # 两个小数组：借助临时 set 计算，结果仍是小数组
+        lows = sorted(_SET_OPS[op](set(data1), data2))
+        return (_ARRAY, array('H', lows)) if lows else None
+    return _from_int(_INT_OPS[op](_to_int(kind1, data1), _to_int(kind2, data2)))
+
+
+class RoaringSet:
+    """
+    压缩的非负整数集合 (0 ~ 2**32-1)，支持 | & - ^ 运算。
+
+    Args:
+        values: 可迭代的整数；传入 range 时直接构造游程容器，不逐个处理。
+    """
+
+    def __init__(self, values=()):
+        self._containers = {} # 高 16 位 -> (类型, 数据)
+        self._keepalive = None # from_file 时保存 mmap 对象
+        if isinstance(values, range) and values.step == 1:
+            self._add_range(values.start, values.stop)
+        else:
+            values = sorted(set(values))
+            if values:
+                self._add_sorted(values)
+
+    @staticmethod
+    def _check(value):
+        if not 0 <= value < 1 << 32:
+            raise ValueError(f"RoaringSet 只能存放 0 ~ 2**32-1 的整数: {value}")
+
+    def _add_range(self, start, stop):
+        if start >= stop:
+            return
+        self._check(start)
+        self._check(stop - 1)
+        for key in range(start >> 16, ((stop - 1) >> 16) + 1):
+            base = key << 16
+            low_start = max(start, base) - base
+            low_last = min(stop, base + 65536) - 1 - base
+            self._containers[key] = (_RUN, (array('H', [low_start]), array('H', [low_last])))
+
+    def _add_sorted(self, values):
+        self._check(values[0])
+        self._check(values[-1])
+        i = 0
+        while i < len(values):
+            key = values[i] >> 16
+            j = bisect_left(values, (key + 1) << 16, i)
+            lows = array('H', map((key << 16).__rsub__, values[i:j]))
+            self._containers[key] = _from_lows(lows)
+            i = j
+
+    @classmethod
+    def from_sorted(cls, values):
+        """
+        由已排序、不重复的整数序列 (如 array('I')) 构造，省去去重和排序的临时内存。
+        """
+        result = cls()
+        if len(values):
+            result._add_sorted(values)
+        return result
+
+    @classmethod
+    def _wrap(cls, containers):
+        result = cls()
+        result._containers = containers
+        return result
+
+    # ---------- 单个元素 ----------
+
+    def __contains__(self, value):
+        container = self._containers.get(value >> 16) if 0 <= value < 1 << 32 else None
+        return container is not None and _contains(container[0], container[1], value & 0xFFFF)
+
+    def add(self, value):
+        """添加一个整数"""
+        self._check(value)
+        key, low = value >> 16, value & 0xFFFF
+        container = self._containers.get(key)
+        if container is None:
+            self._containers[key] = (_ARRAY, array('H', [low]))
+            return
+        kind, data = container
+        if kind == _ARRAY:
+            i = bisect_left(data, low)
+            if i < len(data) and data[i] == low:
+                return
+            if len(data) < _ARRAY_MAX:
+                if not isinstance(data, array): # 映射的内存是只读的：修改前先复制
+                    data = array('H', data)
+                data.insert(i, low)
+                self._containers[key] = (_ARRAY, data)
+                return
+        self._containers[key] = _from_int(_to_int(kind, data) | 1 << low)
+
+    def discard(self, value):
+        """删除一个整数，不存在时什么也不做"""
+        if value not in self:
+            return
+        key, low = value >> 16, value & 0xFFFF
+        kind, data = self._containers[key]
+        container = _from_int(_to_int(kind, data) & ~(1 << low))
+        if container is None:
+            del self._containers[key]
+        else:
+            self._containers[key] = container
+
+    def __len__(self):
+        return sum(_cardinality(kind, data) for kind, data in self._containers.values())
+
+    def __iter__(self):
+        for key in sorted(self._containers):
+            kind, data = self._containers[key]
+            yield from map((key << 16).__add__, _iter_lows(kind, data))
+
+    def __eq__(self, other):
+        if not isinstance(other, RoaringSet):
+            return NotImplemented
+        if self._containers.keys() != other._containers.keys():
+            return False
+        return all(
+            _to_int(*self._containers[key]) == _to_int(*other._containers[key])
+            for key in self._containers
+        )
+
+    def __repr__(self):
+        return f"RoaringSet(<{len(self)} 个元素, {len(self._containers)} 个容器>)"
+
+    # ---------- 集合运算 ----------
+
+    def __and__(self, other):
+        mine, theirs = self._containers, other._containers
+        result = {}
+        for key in mine.keys() & theirs.keys():
+            container = _combine("and", mine[key], theirs[key])
+            if container is not None:
+                result[key] = container
+        return self._wrap(result)
+
+    def _merge(self, other, op):
+        mine, theirs = self._containers, other._containers
+        result = {}
+        for key, container in mine.items():
+            if key in theirs:
+                container = _combine(op, container, theirs[key])
+                if container is None:
+                    continue
+            else:
+                container = _copy(container)
+            result[key] = container
+        if op != "sub":
+            for key, container in theirs.items():
+                if key not in mine:
+                    result[key] = _copy(container)
+        return self._wrap(result)
+
+    def __or__(self, other):
+        return self._merge(other, "or")
+
+    def __sub__(self, other):
+        return self._merge(other, "sub")
+
+    def __xor__(self, other):
+        return self._merge(other, "xor")
+
+    union = __or__
+    intersection = __and__
+    difference = __sub__
+    symmetric_difference = __xor__
+
+    # ---------- 统计信息 ----------
+
+    def optimize(self):
+        """
+        重新为每个容器挑选最省空间的表示。
+        逐个 add 或由有序数据构造时，小数组不会检查能否改成游程容器，批量写入之后可以调用一次。
+        """
+        for key, (kind, data) in list(self._containers.items()):
+            self._containers[key] = _from_int(_to_int(kind, data))
+
+    @property
+    def nbytes(self):
+        """所有容器数据占用的字节数 (也约等于序列化后的大小)"""
+        return sum(_nbytes(kind, data) for kind, data in self._containers.values())
+
+    def container_counts(self):
+        """各类容器的个数，如 {"array": 3, "bitmap": 1, "run": 0}"""
+        counts = {"array": 0, "bitmap": 0, "run": 0}
+        names = ("array", "bitmap", "run")
+        for kind, _ in self._containers.values():
+            counts[names[kind]] += 1
+        return counts
+
+    # ---------- 序列化 ----------
+
+    def to_bytes(self):
+        """
+        序列化为小端字节串：
+        头部 (魔数 + 容器个数)、每个容器一条目录 (高 16 位、类型、个数、偏移)，然后是各容器的数据。
+        """
+        keys = sorted(self._containers)
+        offset = _HEADER.size + _ENTRY.size * len(keys)
+        entries, payloads = [], []
+        for key in keys:
+            kind, data = self._containers[key]
+            if kind == _ARRAY:
+                count, payload = len(data), _le_bytes(data)
+            elif kind == _BITMAP:
+                count, payload = _cardinality(kind, data), bytes(data)
+            else:
+                count, payload = len(data[0]), _le_bytes(data[0]) + _le_bytes(data[1])
+            entries.append(_ENTRY.pack(key, kind, count, offset))
+            payloads.append(payload)
+            offset += len(payload)
+        return b"".join([_HEADER.pack(_MAGIC, len(keys))] + entries + payloads)
+
+    def write(self, path):
+        """写入文件，之后可以用 from_file 映射回来"""
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def from_buffer(cls, buffer):
+        """
+        从 to_bytes() 的结果 (bytes、mmap 等) 构造集合。
+        数组、游程和位图容器都只是指向 buffer 的 memoryview，不复制数据；
+        小端机器上才能零拷贝读取 'H' 数组，大端机器会先转换一份。
+        """
+        view = memoryview(buffer).cast('B')
+        magic, count = _HEADER.unpack_from(view, 0)
+        if magic != _MAGIC:
+            raise ValueError("不是 RoaringSet 的序列化数据")
+        containers = {}
+        for i in range(count):
+            key, kind, n, offset = _ENTRY.unpack_from(view, _HEADER.size + i * _ENTRY.size)
+            if kind == _ARRAY:
+                data = _le_view(view[offset:offset + 2 * n])
+            elif kind == _BITMAP:
+                data = view[offset:offset + _BITMAP_BYTES]
+            else:
+                data = (_le_view(view[offset:offset + 2 * n]),
+                        _le_view(view[offset + 2 * n:offset + 4 * n]))
+            containers[key] = (kind, data)
+        return cls._wrap(containers)
+
+    @classmethod
+    def from_file(cls, path):
+        """用 mmap 映射 write() 写出的文件：打开几乎不花时间，数据按需由操作系统读入"""
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        result = cls.from_buffer(mapped)
+        result._keepalive = mapped
+        return result
+
+
+def _le_bytes(lows):
+    if sys.byteorder == 'little':
+        return lows.tobytes() if isinstance(lows, array) else bytes(lows)
+    swapped = array('H', lows)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+def _le_view(raw):
+    if sys.byteorder == 'little':
+        return raw.cast('H')
+    swapped = array('H', raw.tobytes())
+    swapped.byteswap()
+    return swapped
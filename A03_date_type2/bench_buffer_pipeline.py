@@ -0,0 +1,124 @@
+# bench_buffer_pipeline.py
+# 对比两种解析长度前缀消息的方式：
+#   1. 朴素写法：f.read() 读出 bytes，再用切片取出消息头和消息体 (每次切片都复制出一个新的 bytes)
+#   2. BufferPipeline：readinto 复用同一块 bytearray，消息体以 memoryview 交出 (run) 或只交出偏移量 (scan)
+#
+# 用法：python bench_buffer_pipeline.py [消息条数] [消息大小]
+#
+# “每条消息”：处理函数被调用时，tracemalloc 的当前占用比运行开始前多出的字节数 (前 200 条的平均值)，
+# 不含从文件读入内存的那一次复制 (几种方式都有)，但包含每次运行只创建一次的少量状态 (约 100 字节)。
+# * f.read() / 切片：每条消息新建消息头和消息体两个 bytes，字节数随消息大小增长；
+# * BufferPipeline.run：消息体不复制，但每条消息新建一个 memoryview 切片 (约 184 字节)；
+# * BufferPipeline.scan：只把 (缓冲区, 起点, 终点) 交给处理函数，除了表示偏移量的几个整数以外不新建对象。
+# 参考结果 (256 字节的消息)：f.read() 约 530 MB/s、336 字节；run 约 350 MB/s、629 字节；scan 约 570 MB/s、213 字节。
+# 消息很小 (16 字节) 时 scan 的偏移量整数和 bytes 差不多大，两者相当；消息越大，省下的越多。
+# 缓冲区要比消息大若干倍，否则每次读到末尾都要搬移半条消息 (见“每条消息搬移”)；这里取消息大小的 16 倍。
+
+import io
+import os
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+
+from buffer_pipeline import DEFAULT_CAPACITY, HEADER, BufferPipeline, encode_frame
+
+def naive_parse(f, handler):
+    # 每条消息：读头 (新 bytes) + 读消息体 (新 bytes)
+    count = 0
+    while True:
+        header = f.read(HEADER.size)
+        if not header:
+            return count
+        (length,) = HEADER.unpack(header)
+        handler(f.read(length))
+        count += 1
+
+def naive_slice(data, handler):
+    # 一次性读入整个文件，再对 bytes 切片 (每条消息的切片都是一次复制)
+    count = 0
+    offset = 0
+    while offset < len(data):
+        (length,) = HEADER.unpack(data[offset:offset + HEADER.size])
+        offset += HEADER.size
+        handler(data[offset:offset + length])
+        offset += length
+        count += 1
+    return count
+
+def first_byte(message):
+    return message[0]
+
+def first_byte_at(buffer, start, stop):
+    return buffer[start]
+
+def bytes_per_message(run_with, samples=200):
+    """
+    处理前 samples 条消息时，tracemalloc 记录的“当前占用”比运行开始前多出多少字节，取平均值：
+    也就是处理这条消息时仍然存活的新对象 (消息头、消息体、切片……)，包括解析循环本身的状态。
+    """
+    used = array('q', [0]) * samples
+    seen = array('q', [0])
+
+    def handler(message, start=None, stop=None): # 用默认参数兼容两种签名，不为 *args 新建元组
+        i = seen[0]
+        if i < samples:
+            used[i] = tracemalloc.get_traced_memory()[0]
+            seen[0] = i + 1
+
+    run = run_with(handler)
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    run()
+    tracemalloc.stop()
+    return sum(used) / samples - base
+
+def measure(label, run_with, total_bytes, count, handler=None):
+    # 先单独计时 (tracemalloc 会拖慢每次内存分配，不能同时开)，再单独测峰值内存和每条消息的占用
+    handler = handler or first_byte
+    start = time.perf_counter()
+    handled = run_with(handler)()
+    elapsed = time.perf_counter() - start
+    assert handled == count
+
+    run = run_with(handler)
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<22} {total_bytes / 1024 / 1024 / elapsed:>8.1f} MB/s "
+          f"{count / elapsed:>12,.0f} 条/秒  峰值内存 {peak / 1024:>7.1f} KB  "
+          f"每条消息 {bytes_per_message(run_with):>8.1f} 字节")
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 256
+
+    payloads = [os.urandom(random.randint(size // 2, size * 3 // 2)) for _ in range(1000)]
+    data = b"".join(encode_frame(payloads[i % 1000]) for i in range(count))
+    total = len(data)
+
+    print(f"--- {count} 条消息，平均 {size} 字节，共 {total / 1024 / 1024:.1f} MB ---")
+    def naive_parse_run_with(handler):
+        f = io.BytesIO(data) # 在计时 / 启动 tracemalloc 之前创建
+        return lambda: naive_parse(f, handler)
+    measure("f.read() 逐条读取", naive_parse_run_with, total, count)
+    measure("bytes 切片", lambda handler: lambda: naive_slice(data, handler), total, count)
+
+    # 缓冲区取消息大小的 16 倍 (至少 64KB)：不用扩大，读到末尾时要搬移的半条消息也只占一小部分
+    capacity = max(DEFAULT_CAPACITY, 16 * (size * 3 // 2 + HEADER.size))
+    pipelines = []
+    def pipeline_run_with(handler):
+        pipeline = BufferPipeline(io.BytesIO(data), capacity)
+        pipelines.append(pipeline)
+        return lambda: pipeline.run(handler)
+    measure("BufferPipeline.run", pipeline_run_with, total, count)
+    def scan_run_with(handler):
+        pipeline = BufferPipeline(io.BytesIO(data), capacity)
+        return lambda: pipeline.scan(handler)
+    measure("BufferPipeline.scan", scan_run_with, total, count, first_byte_at)
+    # 流水线只有缓冲区末尾“半条消息”被搬到开头时才复制消息数据
+    print(f"  BufferPipeline 统计: {pipelines[0].stats}  "
+          f"(每条消息搬移 {pipelines[0].stats['bytes_moved'] / count:.1f} 字节)")
+    print("-" * 30)
@@ -0,0 +1,96 @@
+# bench_byte_stats.py
+# 在一个大文件上对比“逐字节 for 循环”与 byte_stats 的批量统计。
+#
+# 用法：python bench_byte_stats.py [文件大小MB]
+#   需求里的规模是 1 GB：python bench_byte_stats.py 1024
+#   逐字节循环太慢，只在前 LOOP_SAMPLE_MB 上运行，再按比例外推到整个文件。
+
+import os
+import sys
+import tempfile
+import time
+
+import byte_stats
+
+LOOP_SAMPLE_MB = 16
+
+def loop_delimiters(data):
+    # 与 A03_date_type2.py 相同的思路：逐个字节地处理
+    count = 0
+    for byte in data:
+        if byte == 10: # b"\n"
+            count += 1
+    return count
+
+def loop_sum(data):
+    total = 0
+    for byte in data:
+        total += byte
+    return total
+
+def loop_histogram(data):
+    counts = [0] * 256
+    for byte in data:
+        counts[byte] += 1
+    return counts
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+def check_chunk_boundaries(path):
+    # 分块统计的分隔符个数必须和整块 count 一致，包括会自身重叠的分隔符和很小的块
+    with open(path, 'rb') as f:
+        data = f.read(4096)
+    with tempfile.NamedTemporaryFile(delete=False) as f:
+        f.write(data.replace(b"\x00", b"aaaa")) # 制造一些连续的 b"a"
+        small = f.name
+    try:
+        with open(small, 'rb') as f:
+            data = f.read()
+        for delimiter in (b"\n", b"aa", b"aba", b"\r\n"):
+            for chunk_size in (3, 7, 64):
+                stats = byte_stats.file_stats(small, delimiter, chunk_size, with_histogram=False)
+                assert stats["delimiters"] == data.count(delimiter), (delimiter, chunk_size)
+    finally:
+        os.remove(small)
+
+if __name__ == "__main__":
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+    block = os.urandom(1024 * 1024)
+
+    with tempfile.NamedTemporaryFile(delete=False) as f:
+        for _ in range(size_mb):
+            f.write(block)
+        path = f.name
+    try:
+        check_chunk_boundaries(path)
+        print(f"--- {size_mb} MB 文件，numpy: {'已安装' if byte_stats.np is not None else '未安装'} ---")
+        sample_mb = min(size_mb, LOOP_SAMPLE_MB)
+        scale = size_mb / sample_mb
+        with open(path, 'rb') as f:
+            sample = f.read(sample_mb * 1024 * 1024)
+
+        print(f"{'操作':<10} {'for 循环(外推)':>14} {'批量':>10} {'加速比':>8}")
+        operations = [
+            ("分隔符计数", loop_delimiters, byte_stats.count_delimiter),
+            ("字节和", loop_sum, byte_stats.byte_sum),
+            ("直方图", loop_histogram, byte_stats.histogram),
+        ]
+        for label, loop_func, bulk_func in operations:
+            expected, loop_time = timed(loop_func, sample)
+            result, bulk_time = timed(bulk_func, sample)
+            assert result == expected # 在同一个样本上核对结果
+            print(f"{label:<10} {loop_time * scale:>13.2f}秒 {bulk_time * scale:>9.3f}秒 "
+                  f"{loop_time / bulk_time:>7.0f}x")
+        del sample
+
+        for with_histogram in (False, True):
+            stats, elapsed = timed(byte_stats.file_stats, path, b"\n", byte_stats.DEFAULT_CHUNK_SIZE, with_histogram)
+            label = "含直方图" if with_histogram else "不含直方图"
+            print(f"  file_stats 整个文件 ({label})  {elapsed:>7.2f} 秒  {size_mb / elapsed:>7.0f} MB/s")
+        print(f"  分隔符: {stats['delimiters']}，字节和: {stats['byte_sum']}，crc32: {stats['crc32']:#010x}")
+        print("-" * 30)
+    finally:
+        os.remove(path)
@@ -0,0 +1,73 @@
+# bench_course_index.py
+# 在几十万个课程组合上对比“逐个比较 frozenset”与 CourseIndex 的子集 / 超集查询。
+#
+# 用法：python bench_course_index.py [组合数]
+#   默认 200000 个组合，课程从 COURSE_COUNT 门课里随机抽 1~MAX_PER_COMBO 门。
+
+import random
+import sys
+import time
+
+from course_index import CourseIndex
+
+COURSE_COUNT = 60
+MAX_PER_COMBO = 6
+QUERIES = 50
+
+def make_combos(n, seed=42):
+    rng = random.Random(seed)
+    courses = [f"Course{i:02d}" for i in range(COURSE_COUNT)]
+    combos = {}
+    while len(combos) < n:
+        combo = frozenset(rng.sample(courses, rng.randint(1, MAX_PER_COMBO)))
+        combos[combo] = f"Stream{len(combos)}"
+    return courses, combos
+
+def brute_supersets(combos, query):
+    return [(c, v) for c, v in combos.items() if query <= c]
+
+def brute_subsets(combos, query):
+    return [(c, v) for c, v in combos.items() if c <= query]
+
+def timed(func, queries):
+    start = time.perf_counter()
+    total = 0
+    for query in queries:
+        total += len(func(query))
+    return (time.perf_counter() - start) / len(queries), total
+
+def report(label, brute, indexed):
+    (t_brute, n_brute), (t_index, n_index) = brute, indexed
+    assert n_brute == n_index, "结果数量不一致"
+    print(f"{label:<28}{t_brute * 1000:>12.2f} ms{t_index * 1000:>12.2f} ms"
+          f"{t_brute / t_index:>9.1f}x   (平均每次 {n_index / QUERIES:.0f} 条结果)")
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    courses, combos = make_combos(n)
+
+    start = time.perf_counter()
+    index = CourseIndex(combos)
+    print(f"{n} 个组合，{COURSE_COUNT} 门课；建立索引耗时 {time.perf_counter() - start:.2f} s\n")
+
+    rng = random.Random(7)
+    print(f"{'查询 (每次平均)':<26}{'逐个比较':>14}{'CourseIndex':>15}{'加速':>10}")
+    for size in (1, 2):
+        queries = [frozenset(rng.sample(courses, size)) for _ in range(QUERIES)]
+        report(f"超集：包含 {size} 门课",
+               timed(lambda q: brute_supersets(combos, q), queries),
+               timed(index.supersets, queries))
+    for size in (8, 20, 40):
+        queries = [frozenset(rng.sample(courses, size)) for _ in range(QUERIES)]
+        report(f"子集：我选了 {size} 门课",
+               timed(lambda q: brute_subsets(combos, q), queries),
+               timed(index.subsets, queries))
+
+    # 精确查找：两者都是一次哈希查找，只确认 CourseIndex 没有变慢太多
+    keys = list(combos)[:QUERIES]
+    report("精确查找",
+           timed(lambda q: [combos[q]], keys),
+           timed(lambda q: [index[q]], keys))
+
+if __name__ == "__main__":
+    main()
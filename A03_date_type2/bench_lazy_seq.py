@@ -0,0 +1,74 @@
+# bench_lazy_seq.py
+# 惰性流水线的峰值内存 (RSS) 与耗时。每条流水线在单独的子进程里运行，互不干扰。
+#
+# 用法：python bench_lazy_seq.py [元素个数]
+#   默认 10**9：纯线性变换 + 求和会被融合成公式，瞬间完成；
+#   带 filter / map 的流水线必须逐个元素遍历，在 10**9 上需要几分钟，所以它们默认只跑前 FILTER_LIMIT 个元素。
+#   resource 模块仅在 Unix 上可用。
+
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+from array import array
+
+from lazy_seq import LazySeq
+
+FILTER_LIMIT = 10 ** 7
+
+def pipeline_affine(n, _path):
+    # (x * 3 + 1) 的后一半求和：切片和线性变换都被融合进一个 range，求和用公式
+    seq = (LazySeq(range(n)) * 3 + 1)[n // 2:]
+    return seq.sum()
+
+def pipeline_filter(n, _path):
+    # 先变换再过滤：逐元素遍历，但只有一次遍历，没有中间列表
+    seq = (LazySeq(range(n)) * 3 + 1).filter(lambda x: x % 7 == 0)
+    return seq.count()
+
+def pipeline_list(n, _path):
+    # 对照组：用列表推导式一步步物化 (与 LazySeq 的 filter 流水线做同样的事)
+    values = [x * 3 + 1 for x in range(n)]
+    kept = [x for x in values if x % 7 == 0]
+    return len(kept)
+
+def pipeline_mmap(n, path):
+    # 内存映射文件：数据不读进 Python 堆，由操作系统按需换入页面
+    seq = LazySeq.from_file(path, 'q')
+    return (seq * 2).sum()
+
+def run(name, func, n, path, queue):
+    start = time.perf_counter()
+    result = func(n, path)
+    elapsed = time.perf_counter() - start
+    rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024 # Linux 上单位是 KB
+    queue.put((result, elapsed, rss_mb))
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 9
+    small = min(n, FILTER_LIMIT)
+
+    with tempfile.NamedTemporaryFile(delete=False) as f:
+        array('q', range(small)).tofile(f)
+        path = f.name
+    try:
+        print("--- 峰值 RSS (整个子进程，含解释器本身约 10MB) ---")
+        cases = [
+            ("线性变换 + 切片 + 求和", pipeline_affine, n),
+            ("线性变换 + filter + 计数", pipeline_filter, small),
+            ("列表推导式 (对照)", pipeline_list, small),
+            ("mmap 文件 * 2 + 求和", pipeline_mmap, small),
+        ]
+        for name, func, size in cases:
+            queue = multiprocessing.Queue()
+            proc = multiprocessing.Process(target=run, args=(name, func, size, path, queue))
+            proc.start()
+            result, elapsed, rss_mb = queue.get()
+            proc.join()
+            print(f"  {name:<22} n={size:<12} {elapsed:>8.3f} 秒  峰值 RSS {rss_mb:>8.1f} MB  结果 {result}")
+        print("  (mmap 映射进来的文件页面也计入 RSS，但它们属于页缓存，内存紧张时系统可以直接丢弃)")
+        print("-" * 30)
+    finally:
+        os.remove(path)
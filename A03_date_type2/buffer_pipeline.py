@@ -0,0 +1,161 @@
+# ============================================
+#   buffer_pipeline.py：基于 bytearray + memoryview 的零拷贝数据管道
+# ============================================
+# A03_date_type2.py 演示了 bytearray (可变的字节缓冲区) 和 memoryview (零拷贝视图)。
+# 这里把它们组合成一个可以复用的工具：
+#
+# * 整个管道只有一块 bytearray 缓冲区，数据用 readinto() / recv_into() 直接读进去，
+#   不会像 f.read(n) 那样每次都新建一个 bytes 对象；
+# * 消息格式是“长度前缀帧”：4 字节大端无符号整数表示长度，后面跟着相应长度的消息体；
+# * 每条消息以 memoryview 切片的形式交给处理函数——只是“指向缓冲区某一段”的视图，没有复制；
+# * 缓冲区读到末尾时，把还没处理完的半条消息挪到开头 (memoryview 之间的整段搬移)，
+#   然后继续往后读，所以同一块内存被循环使用。
+#
+# * scan(handler) 连切片都不创建：只把 (整个缓冲区的视图, 起点, 终点) 交给处理函数，
+#   每条消息不新建任何对象。
+#
+# ⚠️ 交出去的 memoryview 只在处理这条消息期间有效，下一次读取可能覆盖它指向的内存。
+#    需要长期保存的话，请调用 view.tobytes() 复制一份。
+
+import struct
+
+HEADER = struct.Struct('>I') # 4 字节大端无符号整数：消息长度
+DEFAULT_CAPACITY = 64 * 1024
+
+def encode_frame(payload):
+    """给一条消息加上长度前缀"""
+    return HEADER.pack(len(payload)) + payload
+
+
+class BufferPipeline:
+    """
+    从文件或 socket 中读取长度前缀帧。
+
+    Args:
+        source: 有 readinto() 的二进制文件，或有 recv_into() 的 socket。
+        capacity (int): 缓冲区初始大小；遇到更大的消息时会自动扩大。
+    """
+
+    def __init__(self, source, capacity=DEFAULT_CAPACITY):
+        if hasattr(source, "recv_into"):
+            self._read_into = source.recv_into
+        elif hasattr(source, "readinto"):
+            self._read_into = source.readinto
+        else:
+            raise TypeError("source 必须支持 readinto() 或 recv_into()")
+        self._buffer = bytearray(capacity)
+        self._view = memoryview(self._buffer)
+        self._start = 0 # 未处理数据的起点
+        self._end = 0   # 已读入数据的终点
+        self.stats = {"reads": 0, "compactions": 0, "bytes_moved": 0, "grows": 0}
+
+    def _fill(self, need):
+        """保证缓冲区里至少有 need 字节未处理的数据，读到文件末尾时返回 False"""
+        while self._end - self._start < need:
+            if len(self._buffer) - self._start < need:
+                self._make_room(need)
+            n = self._read_into(self._view[self._end:])
+            self.stats["reads"] += 1
+            if not n:
+                return False
+            self._end += n
+        return True
+
+    def _make_room(self, need):
+        pending = self._end - self._start
+        if need > len(self._buffer):
+            # 消息比整个缓冲区还大：换一块更大的缓冲区
+            new_size = max(need, len(self._buffer) * 2)
+            new_buffer = bytearray(new_size)
+            new_buffer[:pending] = self._view[self._start:self._end]
+            self._buffer = new_buffer
+            self._view = memoryview(new_buffer)
+            self.stats["grows"] += 1
+        else:
+            # 把剩下的半条消息挪到缓冲区开头，腾出后面的空间
+            self._view[:pending] = self._view[self._start:self._end]
+            self.stats["compactions"] += 1
+        self.stats["bytes_moved"] += pending
+        self._start = 0
+        self._end = pending
+
+    def frames(self):
+        """
+        逐条产出消息体的 memoryview。
+
+        Raises:
+            EOFError: 数据在一条消息的中间结束。
+        """
+        header_size = HEADER.size
+        unpack_from = HEADER.unpack_from
+        while True:
+            # 快速路径：缓冲区里已经有完整的消息时，不调用 _fill
+            start = self._start
+            if self._end - start < header_size:
+                if not self._fill(header_size):
+                    if self._end > self._start:
+                        raise EOFError("数据在消息头中间结束")
+                    return
+                start = self._start
+            (length,) = unpack_from(self._buffer, start)
+            stop = start + header_size + length
+            if stop > self._end:
+                if not self._fill(header_size + length):
+                    raise EOFError("数据在消息体中间结束")
+                start = self._start # _fill 可能搬移或更换了缓冲区
+                stop = start + header_size + length
+            self._start = stop
+            yield self._view[start + header_size:stop]
+
+    def scan(self, handler):
+        """
+        逐条调用 handler(buffer, start, stop)：buffer 是整个缓冲区的 memoryview，消息体是 buffer[start:stop]。
+        与 frames() 不同，每条消息不创建任何切片对象，也没有生成器的开销；
+        处理函数自己决定怎么读 (如 HEADER.unpack_from(buffer, start)、buffer[start])。
+        buffer 在缓冲区扩大后会换成新的对象，不要在两次调用之间保存它。
+
+        Returns:
+            int: 处理的消息条数。
+
+        Raises:
+            EOFError: 数据在一条消息的中间结束。
+        """
+        header_size = HEADER.size
+        unpack_from = HEADER.unpack_from
+        count = 0
+        while True:
+            start = self._start
+            if self._end - start < header_size:
+                if not self._fill(header_size):
+                    if self._end > self._start:
+                        raise EOFError("数据在消息头中间结束")
+                    return count
+                start = self._start
+            (length,) = unpack_from(self._buffer, start)
+            stop = start + header_size + length
+            if stop > self._end:
+                if not self._fill(header_size + length):
+                    raise EOFError("数据在消息体中间结束")
+                start = self._start
+                stop = start + header_size + length
+            self._start = stop
+            handler(self._view, start + header_size, stop)
+            count += 1
+
+    def run(self, *stages):
+        """
+        把每条消息 (memoryview 切片) 依次交给各个处理阶段：stage(view) 的返回值作为下一个阶段的输入。
+        每条消息会新建一个 memoryview 切片；不需要切片时用 scan() 更省。
+
+        Returns:
+            int: 处理的消息条数。
+        """
+        if len(stages) == 1:
+            stage = stages[0]
+            return self.scan(lambda buffer, start, stop: stage(buffer[start:stop]))
+
+        def handler(buffer, start, stop):
+            value = buffer[start:stop]
+            for stage in stages:
+                value = stage(value)
+        return self.scan(handler)
@@ -0,0 +1,156 @@
+# ============================================
+#   byte_stats.py：批量的字节统计 (直方图、分隔符查找、校验和)
+# ============================================
+# A03_date_type2.py 里用 for byte in bytes_data 一个字节一个字节地遍历：
+# 每个字节都要变成一个 Python int 对象、执行一轮解释器循环，几百 MB 的文件要跑好几分钟。
+#
+# 这里把同样的统计交给 C 层批量完成：
+# * histogram：安装了 numpy 就用 np.bincount(np.frombuffer(...))；
+#   否则用 memoryview.cast('H') 每次取两个字节，按 16 位的值计数后再拆回单字节，
+#   解释器循环次数减半 (纯 Python 后备方案，大约快 2 倍)；
+# * find_all / count_delimiter：bytes.find / bytes.count 在 C 里快速扫描，比逐字节比较快上百倍；
+# * byte_sum：numpy 时用 np.sum，否则用内置 sum()——迭代和累加都在 C 里完成；
+# * checksum：crc32 / adler32 交给 zlib；
+# * *_file 版本用 mmap 按块处理大文件，内存占用与文件大小无关。
+# 分隔符一律按 bytes.count 的规则计数：从左往右找，找到后从它的末尾继续，互不重叠
+# (b"aaa" 里只有 1 个 b"aa")；find_all 和分块的 file_stats 都遵守同一规则。
+
+import mmap
+import zlib
+
+try:
+    import numpy as np # 可选依赖
+except ImportError:
+    np = None
+
+DEFAULT_CHUNK_SIZE = 64 * 1024 * 1024
+
+def histogram(data):
+    """统计每个字节值 (0-255) 出现的次数，返回长度为 256 的列表"""
+    if np is not None:
+        return np.bincount(np.frombuffer(data, dtype=np.uint8), minlength=256).tolist()
+    view = memoryview(data).cast('B')
+    even = len(view) - len(view) % 2
+    pairs = [0] * 65536
+    for value in view[:even].cast('H'):
+        pairs[value] += 1
+    counts = [0] * 256
+    for value, n in enumerate(pairs):
+        if n:
+            counts[value & 0xFF] += n
+            counts[value >> 8] += n
+    if even < len(view): # 奇数长度：最后一个字节单独统计
+        counts[view[-1]] += 1
+    return counts
+
+def byte_sum(data):
+    """所有字节值之和"""
+    if np is not None:
+        return int(np.frombuffer(data, dtype=np.uint8).sum(dtype=np.uint64))
+    return sum(data)
+
+def _check_delimiter(delimiter):
+    if not delimiter:
+        raise ValueError("分隔符不能为空！")
+
+def count_delimiter(data, delimiter=b"\n"):
+    """统计分隔符出现的次数 (互不重叠)"""
+    _check_delimiter(delimiter)
+    return data.count(delimiter)
+
+def find_all(data, delimiter=b"\n"):
+    """返回分隔符所有出现位置的列表 (互不重叠，与 count_delimiter 的个数一致)"""
+    _check_delimiter(delimiter)
+    positions = []
+    find = data.find
+    step = len(delimiter)
+    pos = find(delimiter)
+    while pos != -1:
+        positions.append(pos)
+        pos = find(delimiter, pos + step)
+    return positions
+
+def checksum(data, algorithm="crc32"):
+    """计算 crc32 或 adler32 校验和"""
+    if algorithm == "crc32":
+        return zlib.crc32(data)
+    if algorithm == "adler32":
+        return zlib.adler32(data)
+    raise ValueError(f"不支持的校验算法: {algorithm}")
+
+
+# ---------- 大文件：mmap + 分块 ----------
+
+def _iter_file_chunks(path, chunk_size):
+    with open(path, 'rb') as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError: # 空文件无法映射
+            return
+        with mapped:
+            for start in range(0, len(mapped), chunk_size):
+                yield mapped[start:start + chunk_size]
+
+def _self_overlapping(delimiter):
+    """分隔符的开头和结尾有相同的部分 (如 b"aa"、b"abab")，两次出现可能重叠"""
+    return any(delimiter[:k] == delimiter[-k:] for k in range(1, len(delimiter)))
+
+def _count_from(chunk, delimiter, start, overlapping):
+    """从 start 开始按不重叠规则计数，返回 (个数, 最后一个匹配的末尾)"""
+    if not overlapping:
+        # 两次出现不可能重叠，每一次出现都会被计数：count 和 rfind 都在 C 里完成
+        last = chunk.rfind(delimiter, start)
+        return chunk.count(delimiter, start), start if last == -1 else last + len(delimiter)
+    count, end = 0, start
+    pos = chunk.find(delimiter, start)
+    while pos != -1:
+        count += 1
+        end = pos + len(delimiter)
+        pos = chunk.find(delimiter, end)
+    return count, end
+
+def file_stats(path, delimiter=b"\n", chunk_size=DEFAULT_CHUNK_SIZE, with_histogram=True):
+    """
+    一次扫描文件，得到分隔符个数、字节和、crc32 以及 (可选的) 直方图。
+    没有 numpy 时直方图是最慢的一项，不需要时可以传入 with_histogram=False。
+    分隔符个数与 count_delimiter(整个文件) 相同；像 b"aa" 这样会自身重叠的分隔符
+    要逐个匹配才能知道块末尾的状态，比普通分隔符慢。
+
+    Returns:
+        dict: {"size", "delimiters", "byte_sum", "crc32", "histogram"}
+    """
+    _check_delimiter(delimiter)
+    width = len(delimiter)
+    if chunk_size < width:
+        raise ValueError("chunk_size 不能小于分隔符的长度！")
+    overlapping = _self_overlapping(delimiter)
+    counts = [0] * 256 if with_histogram else None
+    delimiters = 0
+    total = 0
+    crc = 0
+    size = 0
+    # 跨越块边界的分隔符：tail 是上一块末尾、最后一个匹配之后的字节 (最多 width - 1 个)
+    tail = b""
+    for chunk in _iter_file_chunks(path, chunk_size):
+        size += len(chunk)
+        start = 0
+        if tail:
+            pos = (tail + chunk[:width - 1]).find(delimiter)
+            if pos != -1: # 最多只有一个匹配跨越边界，它伸进本块的部分不能再参与计数
+                delimiters += 1
+                start = pos + width - len(tail)
+        n, end = _count_from(chunk, delimiter, start, overlapping)
+        delimiters += n
+        tail = chunk[max(end, len(chunk) - width + 1):] if width > 1 else b""
+        total += byte_sum(chunk)
+        crc = zlib.crc32(chunk, crc)
+        if with_histogram:
+            for value, n in enumerate(histogram(chunk)):
+                counts[value] += n
+    return {
+        "size": size,
+        "delimiters": delimiters,
+        "byte_sum": total,
+        "crc32": crc,
+        "histogram": counts,
+    }
@@ -0,0 +1,134 @@
+# ============================================
+#   course_index.py：支持子集 / 超集查询的课程组合索引
+# ============================================
+# A03_date_type2.py 用 frozenset 作为字典的键：student_courses[my_courses] 只能做“完全相同”的查找。
+# 实际中常见的问题是：
+# * 哪些方向 (stream) 包含了这几门课？             -> 超集查询 supersets()
+# * 我选的课能满足哪些课程组合 (组合是我的子集)？   -> 子集查询 subsets()
+# 对几十万个组合逐个做 <= / >= 比较太慢，CourseIndex 用两种“位集 (bitset)”来加速：
+# 1. 每门课对应一个位，一个课程组合编码成一个整数掩码 (mask)，子集判断变成 mask & ~query == 0；
+# 2. 倒排表：每门课对应一个“组合位图”——第 i 位为 1 表示第 i 个组合包含这门课。
+#    Python 的 int 可以任意大，所以几十万位的位图就是一个大整数，& | ~ 都在 C 里按机器字批量完成。
+#    超集查询 = 这几门课的组合位图按位与；子集查询 = 排除“含有查询之外课程”的组合。
+#    每次位运算处理的是整条位图 (几十 KB)，课程门数不多时比逐个比较几十万个 frozenset 快得多。
+
+def _bitmap(positions, size):
+    # 把一组位编号变成大整数：先在 bytearray 里置位，再一次性转换
+    buffer = bytearray((size + 7) // 8)
+    for pos in positions:
+        buffer[pos >> 3] |= 1 << (pos & 7)
+    return int.from_bytes(buffer, 'little')
+
+class CourseIndex:
+    """以 frozenset(课程) 为键的字典，额外支持子集和超集查询"""
+
+    def __init__(self, mapping=None):
+        self._course_bits = {}   # 课程 -> 位编号
+        self._postings = []      # 位编号 -> 组合位图 (大整数)
+        self._combos = []        # 组合编号 -> (frozenset, 值)
+        self._by_mask = {}       # 课程掩码 -> 组合编号 (精确查找)
+        self._all = 0            # 所有组合的位图
+        if mapping:
+            self.update(mapping)
+
+    def _mask(self, courses, create=False):
+        mask = 0
+        for course in courses:
+            bit = self._course_bits.get(course)
+            if bit is None:
+                if not create:
+                    return None # 出现了从未见过的课程
+                bit = self._course_bits[course] = len(self._postings)
+                self._postings.append(0)
+            mask |= 1 << bit
+        return mask
+
+    def __setitem__(self, courses, value):
+        courses = frozenset(courses)
+        mask = self._mask(courses, create=True)
+        combo_id = self._by_mask.get(mask)
+        if combo_id is not None:
+            self._combos[combo_id] = (courses, value) # 已有的组合：只更新值
+            return
+        combo_id = len(self._combos)
+        self._combos.append((courses, value))
+        self._by_mask[mask] = combo_id
+        combo_bit = 1 << combo_id
+        self._all |= combo_bit
+        for course in courses:
+            self._postings[self._course_bits[course]] |= combo_bit
+
+    def update(self, mapping):
+        """
+        批量添加组合。
+        逐个 __setitem__ 时每次都要重写整条位图 (大整数不可变)，n 个组合是 O(n²)；
+        这里先收集每门课新增的组合编号，最后每条位图只用 int.from_bytes 构造一次。
+        """
+        new_bits = {} # 位编号 -> 新增组合编号的列表
+        first_new = len(self._combos)
+        for courses, value in mapping.items():
+            courses = frozenset(courses)
+            mask = self._mask(courses, create=True)
+            combo_id = self._by_mask.get(mask)
+            if combo_id is not None:
+                self._combos[combo_id] = (courses, value)
+                continue
+            combo_id = len(self._combos)
+            self._combos.append((courses, value))
+            self._by_mask[mask] = combo_id
+            for course in courses:
+                new_bits.setdefault(self._course_bits[course], []).append(combo_id)
+        total = len(self._combos)
+        if total == first_new:
+            return
+        for bit, combo_ids in new_bits.items():
+            self._postings[bit] |= _bitmap(combo_ids, total)
+        self._all |= ((1 << total) - 1) ^ ((1 << first_new) - 1)
+
+    def __getitem__(self, courses):
+        mask = self._mask(courses)
+        combo_id = self._by_mask.get(mask) if mask is not None else None
+        if combo_id is None:
+            raise KeyError(frozenset(courses))
+        return self._combos[combo_id][1]
+
+    def __contains__(self, courses):
+        mask = self._mask(courses)
+        return mask is not None and mask in self._by_mask
+
+    def __len__(self):
+        return len(self._combos)
+
+    @staticmethod
+    def _bit_positions(bitmap):
+        # 找出位图中所有为 1 的位：转成二进制字符串后用 str.find 跳着找 (C 实现)
+        bits = bin(bitmap)[:1:-1] # 反转，让第 i 个字符对应第 i 位
+        pos = bits.find('1')
+        while pos != -1:
+            yield pos
+            pos = bits.find('1', pos + 1)
+
+    def _results(self, bitmap):
+        return [self._combos[i] for i in self._bit_positions(bitmap)]
+
+    def supersets(self, courses):
+        """包含 courses 中所有课程的组合，返回 [(frozenset, 值), ...]"""
+        bitmap = self._all
+        for course in courses:
+            bit = self._course_bits.get(course)
+            if bit is None:
+                return []
+            bitmap &= self._postings[bit]
+            if not bitmap:
+                return []
+        return self._results(bitmap)
+
+    def subsets(self, courses):
+        """所有课程都在 courses 之内的组合，返回 [(frozenset, 值), ...]"""
+        query_bits = {self._course_bits[c] for c in courses if c in self._course_bits}
+        # 排除含有“查询之外的课程”的组合：只有大整数的按位或，不逐个检查组合
+        excluded = 0
+        for bit, posting in enumerate(self._postings):
+            if bit not in query_bits:
+                excluded |= posting
+        return self._results(self._all & ~excluded)
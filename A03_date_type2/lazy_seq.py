@@ -0,0 +1,165 @@
+# ============================================
+#   lazy_seq.py：惰性的数值序列 (range / array / 内存映射文件)
+# ============================================
+# A03_date_type2.py 用 sys.getsizeof 比较了 range(1000000) 和等效的列表：
+# range 只存起点、终点、步长，无论多长都只占几十字节。
+#
+# LazySeq 把这种“只描述、不生成”的思路推广到整条处理流水线：
+# * 数据源可以是 range、array.array，或者用 mmap 映射的二进制文件 (LazySeq.from_file)；
+# * 切片、map、filter 都只是记录下来，不会生成任何中间列表；
+# * 真正需要结果时 (迭代、sum、to_list...)，所有操作在一次遍历里完成 (融合成一个迭代器链)；
+# * 能提前算的尽量提前算：
+#   - 没有 filter 时，切片会被“下推”到数据源 (range 切片还是 range，数组切片是零拷贝的 memoryview)；
+#   - 连续的 +、-、* 常数会合并成一次 a*x+b；作用在 range 上的整数 a*x+b 结果仍然是一个 range；
+#   - range 的 sum / len 直接用公式算，10**9 个元素也是瞬间完成。
+
+import mmap
+from array import array
+from itertools import islice
+
+class LazySeq:
+    """
+    惰性序列。
+
+    Args:
+        source: range、array.array 或 memoryview。
+    """
+
+    def __init__(self, source, ops=()):
+        if isinstance(source, array):
+            source = memoryview(source) # 之后的切片都是零拷贝的
+        self._source = source
+        self._ops = tuple(ops) # ("map", f) / ("filter", p) / ("affine", a, b) / ("slice", start, stop, step)
+        self._keepalive = None # from_file 时保存 mmap 对象，防止被提前关闭
+
+    @classmethod
+    def from_file(cls, path, typecode='d'):
+        """把一个二进制数值文件映射成序列 (typecode 与 array 模块相同，如 'd'、'q'、'i')"""
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        seq = cls(memoryview(mapped).cast('B').cast(typecode))
+        seq._keepalive = mapped
+        return seq
+
+    def _derive(self, source=None, ops=None):
+        seq = LazySeq(self._source if source is None else source,
+                      self._ops if ops is None else ops)
+        seq._keepalive = self._keepalive
+        return seq
+
+    def _has_filter(self):
+        return any(op[0] in ("filter", "slice") for op in self._ops)
+
+    # ---------- 记录操作 ----------
+
+    def map(self, func):
+        """逐元素应用 func"""
+        return self._derive(ops=self._ops + (("map", func),))
+
+    def filter(self, predicate):
+        """只保留 predicate 为真的元素"""
+        return self._derive(ops=self._ops + (("filter", predicate),))
+
+    def _affine(self, a, b):
+        ops = self._ops
+        if ops and ops[-1][0] == "affine":
+            # 合并连续的线性变换：a2*(a1*x+b1)+b2 = (a1*a2)*x + (b1*a2+b2)
+            _, a1, b1 = ops[-1]
+            a, b = a1 * a, b1 * a + b
+            ops = ops[:-1]
+        if not ops and isinstance(self._source, range) and isinstance(a, int) and isinstance(b, int) and a != 0:
+            # 整数线性变换作用在 range 上，结果仍然是 range
+            r = self._source
+            return self._derive(source=range(r.start * a + b, r.stop * a + b, r.step * a), ops=())
+        return self._derive(ops=ops + (("affine", a, b),))
+
+    def __add__(self, k):
+        return self._affine(1, k)
+
+    def __sub__(self, k):
+        return self._affine(1, -k)
+
+    def __mul__(self, k):
+        return self._affine(k, 0)
+
+    def __rsub__(self, k):
+        return self._affine(-1, k)
+
+    __radd__ = __add__
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return self._affine(-1, 0)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            if not self._has_filter():
+                # map / affine 与切片可以交换顺序：先在数据源上切片 (range 和 memoryview 都不复制)
+                return self._derive(source=self._source[index])
+            start, stop, step = index.start, index.stop, index.step
+            if (start or 0) < 0 or (stop is not None and stop < 0) or (step or 1) < 0:
+                raise ValueError("filter 之后的切片只支持非负的起点、终点和步长")
+            return self._derive(ops=self._ops + (("slice", start, stop, step),))
+        if self._has_filter():
+            raise TypeError("filter 之后的序列不支持下标访问，请先迭代或切片")
+        return self._apply_maps(self._source[index])
+
+    def _apply_maps(self, value):
+        for op in self._ops:
+            if op[0] == "map":
+                value = op[1](value)
+            else:
+                value = op[1] * value + op[2]
+        return value
+
+    # ---------- 求值 ----------
+
+    def __iter__(self):
+        # 把所有操作串成一条迭代器链：一次遍历，没有中间列表
+        it = iter(self._source)
+        for op in self._ops:
+            kind = op[0]
+            if kind == "map":
+                it = map(op[1], it)
+            elif kind == "filter":
+                it = filter(op[1], it)
+            elif kind == "affine":
+                a, b = op[1], op[2]
+                it = map(lambda x, a=a, b=b: a * x + b, it)
+            else:
+                it = islice(it, op[1], op[2], op[3])
+        return it
+
+    def __len__(self):
+        if self._has_filter():
+            raise TypeError("filter 之后的长度只能通过 count() 遍历得到")
+        return len(self._source)
+
+    def count(self):
+        """元素个数 (有 filter 时需要遍历一次)"""
+        if not self._has_filter():
+            return len(self._source)
+        return sum(1 for _ in self)
+
+    def sum(self):
+        """所有元素之和"""
+        if not self._ops and isinstance(self._source, range):
+            r = self._source
+            n = len(r)
+            return 0 if n == 0 else n * (r[0] + r[-1]) // 2 # 等差数列求和公式
+        if len(self._ops) == 1 and self._ops[0][0] == "affine" and not isinstance(self._source, range):
+            _, a, b = self._ops[0]
+            return a * sum(self._source) + b * len(self._source) # 先求和再变换，少一次逐元素运算
+        return sum(self)
+
+    def to_list(self):
+        """物化成列表 (只在确实需要时调用)"""
+        return list(self)
+
+    def to_array(self, typecode):
+        """物化成紧凑的 array.array"""
+        return array(typecode, self)
+
+    def __repr__(self):
+        ops = " -> ".join(op[0] for op in self._ops) or "无操作"
+        return f"LazySeq({self._source!r}: {ops})"
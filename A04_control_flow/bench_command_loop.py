@@ -0,0 +1,103 @@
+# bench_command_loop.py
+# CommandLoop 的压力测试：命令循环在子进程里监听一个本地 TCP 端口 (代替真实的输入源)，
+# 主进程开很多个连接，每个连接流水线式地连续发送命令，统计每条命令的往返延迟。
+#
+# 用法：python bench_command_loop.py [每个连接的命令数] [worker 个数]
+#   worker 个数 (默认 64) 就是同时执行的处理函数个数的上限：io 命令的吞吐大约是 worker 数 / 1 ms，
+#   改成 8 再运行一次，可以看到命令在有界队列里排队、延迟变大。
+# 两种命令：
+#   echo —— 几乎不花时间，测的是事件循环和 socket 本身的开销
+#   io   —— 处理函数里 await asyncio.sleep(0.001)，模拟一次 1 ms 的 I/O 等待
+# 报告客户端测到的往返延迟 p50 / p99，以及服务端 latency_report() 的 p50 / p99。
+
+import asyncio
+import multiprocessing
+import sys
+import time
+
+from command_loop import CommandLoop
+
+WINDOW = 16 # 每个连接最多同时未收到回复的命令数
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(int(len(sorted_values) * fraction), len(sorted_values) - 1)]
+
+def run_server(port_queue, stats_queue, queue_size, workers):
+    async def main():
+        loop = CommandLoop(queue_size=queue_size, workers=workers)
+
+        @loop.command("io")
+        async def io(args):
+            await asyncio.sleep(0.001)
+            return args
+
+        @loop.command("report")
+        def report(args):
+            stats_queue.put(loop.latency_report())
+            return "ok"
+
+        port_queue.put(await loop.serve_tcp())
+        await loop.wait_stopped()
+
+    asyncio.run(main())
+
+async def client(port, command, count, latencies):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    sent_at = []
+    window = asyncio.Semaphore(WINDOW)
+
+    async def send():
+        for i in range(count):
+            await window.acquire()
+            sent_at.append(time.perf_counter())
+            writer.write(f"{command} {i}\n".encode())
+            await writer.drain()
+
+    sender = asyncio.create_task(send())
+    for i in range(count):
+        await reader.readline()
+        latencies.append(time.perf_counter() - sent_at[i])
+        window.release()
+    await sender
+    writer.write(b"quit\n")
+    await reader.readline()
+    writer.close()
+
+async def load(port, command, connections, count):
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(port, command, count, latencies) for _ in range(connections)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return len(latencies) / elapsed, latencies
+
+async def fetch_report(port):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(b"report\n")
+    await reader.readline()
+    writer.close()
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    port_queue, stats_queue = multiprocessing.Queue(), multiprocessing.Queue()
+    server = multiprocessing.Process(target=run_server, args=(port_queue, stats_queue, 1024, workers), daemon=True)
+    server.start()
+    port = port_queue.get()
+
+    print(f"每个连接 {count} 条命令，流水线窗口 {WINDOW}，{workers} 个 worker\n")
+    print(f"{'命令':<6}{'连接数':>6}{'吞吐 (条/秒)':>16}{'p50 (ms)':>12}{'p99 (ms)':>12}")
+    for command in ("echo", "io"):
+        for connections in (1, 16, 64):
+            throughput, latencies = asyncio.run(load(port, command, connections, count))
+            print(f"{command:<8}{connections:>6}{throughput:>16,.0f}"
+                  f"{percentile(latencies, 0.5) * 1000:>12.3f}{percentile(latencies, 0.99) * 1000:>12.3f}")
+
+    asyncio.run(fetch_report(port))
+    print("\n服务端统计 (从读到命令到写出回复，不含网络往返)：")
+    for name, stats in stats_queue.get().items():
+        print(f"  {name:<6} {stats['count']:>8} 条  p50 {stats['p50']:.3f} ms  p99 {stats['p99']:.3f} ms")
+    server.terminate()
+
+if __name__ == "__main__":
+    main()
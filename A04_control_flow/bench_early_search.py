@@ -0,0 +1,72 @@
+# bench_early_search.py
+# 对比 break 演示里的 for 循环与 early_search 的各种快速路径。
+#
+# 用法：python bench_early_search.py [元素个数]
+#   默认 10**7；目标元素分别放在序列的 1%、50%、99% 处，以及完全找不到的情况。
+# 测试项：
+#   for + break     —— A04_control_flow.py 的写法 (去掉了 print)
+#   有序 + 默认     —— first_where 默认不检测是否有序，直接按块搜索
+#   有序 + 二分     —— 已知有序，assume_sorted=True
+#   is_sorted       —— 检测一次有序要完整扫描 (所以 first_where 默认不检测)，只在反复查询同一个序列时值得
+#   无序 + 分块     —— 打乱后的 array('d')，按块用 max() 跳过 (块从 1024 个元素开始翻倍)；
+#                     命中很靠前 (1%) 时和 for 循环差不多 (参考：0.9 vs 0.6 ms)，越靠后优势越大
+#   无序 + 多进程   —— parallel_first_where (含把数据块 pickle 给子进程的开销)
+#                     单核机器上只有额外开销；多核时命中越靠后、每块的计算越重，收益越大
+
+import os
+import random
+import sys
+import time
+from array import array
+
+from early_search import first_where, is_sorted, parallel_first_where
+
+def loop_break(numbers, target):
+    for index, num in enumerate(numbers):
+        if num > target:
+            return index
+    return -1
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**7
+    rng = random.Random(42)
+    sorted_data = array('d', sorted(rng.random() for _ in range(n)))
+    shuffled = array('d', sorted_data[:-1])
+    rng.shuffle(shuffled)
+    shuffled.append(sorted_data[-1]) # 保证最大值在末尾，这样“99%”等位置才有意义
+    workers = os.cpu_count() or 1
+    print(f"{n} 个元素，{workers} 个 CPU\n")
+
+    _, t_check = timed(is_sorted, sorted_data)
+    print(f"is_sorted 检测一次: {t_check * 1000:.2f} ms\n")
+    header = f"{'目标位置':<10}{'for + break':>14}{'默认(有序)':>12}{'二分':>12}{'分块(无序)':>14}{'多进程(无序)':>14}"
+    print(header)
+    for label, fraction in (("1%", 0.01), ("50%", 0.5), ("99%", 0.99), ("找不到", None)):
+        # 有序数据：第一个大于 target 的元素恰好在 fraction 处
+        target = 2.0 if fraction is None else sorted_data[int(n * fraction)]
+        expected, t_loop = timed(loop_break, sorted_data, target)
+        result_auto, t_auto = timed(first_where, sorted_data, ">", target) # 默认：不检测，按块搜索
+        result_bisect, t_bisect = timed(first_where, sorted_data, ">", target, assume_sorted=True)
+        assert expected == result_auto == result_bisect
+
+        # 无序数据：让命中位置同样落在 fraction 附近 (把那个位置的值设成比 target 大的最大值)
+        data = array('d', shuffled)
+        if fraction is not None:
+            pos = int(n * fraction)
+            data[pos] = 1.5
+            target = 1.2
+        expected, _ = timed(loop_break, data, target)
+        result_chunk, t_chunk = timed(first_where, data, ">", target, assume_sorted=False)
+        result_parallel, t_parallel = timed(parallel_first_where, data, ">", target, workers=workers)
+        assert expected == result_chunk == result_parallel
+
+        print(f"{label:<12}{t_loop * 1000:>11.2f} ms{t_auto * 1000:>9.2f} ms{t_bisect * 1000:>9.4f} ms"
+              f"{t_chunk * 1000:>11.2f} ms{t_parallel * 1000:>11.2f} ms")
+
+if __name__ == "__main__":
+    main()
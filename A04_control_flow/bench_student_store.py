@@ -0,0 +1,70 @@
+# bench_student_store.py
+# 在 10**6 个学生上对比“遍历 .items()”与 StudentStore 的分数索引。
+#
+# 用法：python bench_student_store.py [学生人数]
+# 分数是 0~100 之间保留一位小数的随机数；“全表扫描”就是 A04_control_flow.py 里的写法：
+#   范围查询：[(name, score) for name, score in scores.items() if low <= score <= high]
+#   top-k：   heapq.nlargest(k, scores.items(), key=...) (已经比先排序再切片快)
+# 结果很多时 (如 80~90 分有 10 万人)，时间主要花在构造结果列表上，索引的优势会变小。
+
+import heapq
+import random
+import sys
+import time
+from operator import itemgetter
+
+from student_store import StudentStore
+
+REPEAT = 5
+
+def timed(func, repeat=REPEAT):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return result, (time.perf_counter() - start) / repeat
+
+def scan_between(scores, low, high):
+    return [(name, score) for name, score in scores.items() if low <= score <= high]
+
+def report(label, scan, indexed):
+    (expected, t_scan), (result, t_index) = scan, indexed
+    # 同分的学生可能以不同顺序入选 top-k，所以只比较分数
+    assert sorted(map(itemgetter(1), expected)) == sorted(map(itemgetter(1), result)), "结果与全表扫描不一致"
+    print(f"{label:<26}{t_scan * 1000:>12.3f} ms{t_index * 1000:>12.3f} ms{t_scan / t_index:>10.0f}x"
+          f"   ({len(result)} 条结果)")
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    rng = random.Random(42)
+    scores = {f"student{i:07d}": round(rng.uniform(0, 100), 1) for i in range(n)}
+
+    start = time.perf_counter()
+    store = StudentStore(scores)
+    print(f"{n} 个学生；建立索引耗时 {time.perf_counter() - start:.2f} s\n")
+
+    # 只数不取的 count_between 必须和 between 的结果条数一致，包括上下限颠倒的空区间
+    for low, high in ((80, 90), (90, 80), (50, 50), (-1, 101)):
+        assert store.count_between(low, high) == len(store.between(low, high)), (low, high)
+
+    print(f"{'查询':<24}{'遍历 .items()':>15}{'StudentStore':>15}{'加速':>9}")
+    for low, high in ((89.9, 90.0), (85, 86), (80, 90)):
+        report(f"分数在 {low}~{high} 之间",
+               timed(lambda: scan_between(scores, low, high)),
+               timed(lambda: store.between(low, high)))
+    for k in (10, 1000):
+        report(f"前 {k} 名",
+               timed(lambda: heapq.nlargest(k, scores.items(), key=itemgetter(1))),
+               timed(lambda: store.top(k)))
+
+    # 增量维护：修改分数只调整索引中的一项，不需要重新排序
+    names = rng.sample(list(scores), 10000)
+    start = time.perf_counter()
+    for name in names:
+        store[name] = round(rng.uniform(0, 100), 1)
+    per_update = (time.perf_counter() - start) / len(names)
+    _, rebuild = timed(lambda: StudentStore(store.items()), repeat=1)
+    print(f"\n修改一个学生的分数 (增量维护索引): {per_update * 1e6:.1f} us")
+    print(f"对比：每次修改后重建整个索引:        {rebuild * 1e6:.0f} us")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+# ============================================
+#   command_loop.py：基于 asyncio 的非阻塞命令循环
+# ============================================
+# A04_control_flow.py 里的 while command.lower() != "quit": command = input("> ")
+# 会卡在 input() 上，同一时间只能服务一个输入源。
+#
+# CommandLoop 用 asyncio 同时服务多个输入源：
+# * 输入源可以是标准输入、管道 (add_pipe)、本地 TCP / Unix socket (serve_tcp / serve_unix)，
+#   每个源一行一条命令，格式是 “命令名 参数...”，每条命令都回复一行；
+# * 命令处理函数用 @loop.command("名字") 注册，可以是普通函数，也可以是 async 函数；
+# * 所有命令进入同一个有界队列 (asyncio.Queue(maxsize))，由若干个 worker 协程处理。
+#   队列满了，读取端的 await queue.put() 就会暂停，不再从这个连接读数据——
+#   数据留在 socket 缓冲区里，TCP 流量控制会让对端也慢下来，这就是“背压 (backpressure)”；
+#   每个连接还有一个有界的“待回复”队列，限制单个连接最多能有多少条命令在处理中；
+# * 每条命令都记录延迟 (从读到这一行到回复写出)，latency_report() 给出 p50 / p99。
+# 和原来的循环一样，输入 quit 会结束当前这个输入源。
+
+import asyncio
+import inspect
+import sys
+import time
+from collections import deque
+
+DEFAULT_QUEUE_SIZE = 1024
+DEFAULT_PIPELINE = 64   # 单个连接最多同时处理中的命令数
+LATENCY_SAMPLES = 100000 # 每个命令最多保留这么多条延迟样本
+
+def _percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(int(len(sorted_values) * fraction), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+class CommandLoop:
+    """
+    多输入源的命令循环。
+
+    Args:
+        queue_size (int): 全局命令队列的容量，满了之后读取端会等待 (背压)。
+        workers (int): 处理命令的 worker 协程个数。
+        pipeline (int): 单个连接最多同时处理中的命令数。
+    """
+
+    def __init__(self, queue_size=DEFAULT_QUEUE_SIZE, workers=4, pipeline=DEFAULT_PIPELINE):
+        self._handlers = {}
+        self._queue_size = queue_size
+        self._workers = workers
+        self._pipeline = pipeline
+        self._queue = None        # 在事件循环中创建 (start())
+        self._worker_tasks = []
+        self._servers = []
+        self._connections = set() # 正在服务的连接：(读命令的 Task, 写回复的 Task)
+        self._closing = False
+        self._latencies = {}      # 命令名 -> deque[秒]
+        self._stopped = None
+        self.command("echo")(lambda args: args)
+
+    # ---------- 注册命令 ----------
+
+    def command(self, name):
+        """
+        装饰器：注册命令处理函数 handler(args)，args 是命令名后面的字符串，返回值作为回复。
+
+            @loop.command("add")
+            def add(args):
+                return str(sum(map(int, args.split())))
+        """
+        def decorator(handler):
+            self._handlers[name.lower()] = handler
+            return handler
+        return decorator
+
+    # ---------- 启动与停止 ----------
+
+    async def start(self):
+        """在当前事件循环里启动 worker，之后才能添加输入源"""
+        if self._queue is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=self._queue_size)
+        self._stopped = asyncio.Event()
+        self._worker_tasks = [asyncio.create_task(self._worker()) for _ in range(self._workers)]
+
+    async def serve_tcp(self, host="127.0.0.1", port=0):
+        """监听本地 TCP 端口 (port=0 表示由系统分配)，返回实际的端口号"""
+        await self.start()
+        server = await asyncio.start_server(self._serve_stream, host, port)
+        self._servers.append(server)
+        return server.sockets[0].getsockname()[1]
+
+    async def serve_unix(self, path):
+        """监听 Unix socket (仅 Unix 系统)"""
+        await self.start()
+        server = await asyncio.start_unix_server(self._serve_stream, path)
+        self._servers.append(server)
+
+    async def add_pipe(self, read_file=None, write_file=None):
+        """
+        把一对管道 / 文件 (默认是标准输入和标准输出) 作为输入源，返回处理它的 Task。
+        注意：事件循环只能监听管道、socket 和终端，不能监听普通文件。
+        """
+        await self.start()
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader()
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), read_file or sys.stdin)
+        transport, protocol = await loop.connect_write_pipe(
+            asyncio.streams.FlowControlMixin, write_file or sys.stdout)
+        writer = asyncio.StreamWriter(transport, protocol, reader, loop)
+        return asyncio.create_task(self._serve_stream(reader, writer))
+
+    def stop(self):
+        """让 wait_stopped() 返回 (例如在某个命令处理函数里调用)"""
+        self._stopped.set()
+
+    async def wait_stopped(self):
+        await self._stopped.wait()
+
+    async def close(self):
+        """关闭所有监听的 socket 和已连接的输入源，停止 worker；还在排队的命令不再执行"""
+        self._closing = True
+        for server in self._servers:
+            server.close() # 先停止接受新连接
+        connection_tasks = [task for task, _ in self._connections]
+        for task in connection_tasks:
+            task.cancel() # 写回复的任务退出时会关闭连接
+        await asyncio.gather(*connection_tasks, return_exceptions=True)
+        for server in self._servers:
+            await server.wait_closed() # Python 3.12 起要等所有连接都关闭才返回
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel() # 没人会再处理它们了
+        self._servers.clear()
+        self._worker_tasks.clear()
+        self._queue = None
+        self._closing = False
+
+    # ---------- 读取、处理、回复 ----------
+
+    async def _serve_stream(self, reader, writer):
+        replies = asyncio.Queue(maxsize=self._pipeline) # 按到达顺序排队等待回复
+        writer_task = asyncio.create_task(self._write_replies(replies, writer))
+        connection = (asyncio.current_task(), writer_task)
+        self._connections.add(connection)
+        try:
+            await self._read_commands(reader, replies)
+            await replies.put(None) # 告诉写回复的任务：没有更多命令了
+            await writer_task
+        except asyncio.CancelledError:
+            if not self._closing:
+                raise
+            # close() 取消的连接正常返回：start_server 在连接任务结束时会调用 task.exception()，
+            # 任务处于“已取消”状态时这一步会抛出 CancelledError 并打印到日志
+        finally:
+            # 无论怎样退出，写回复的任务都要结束 (它退出时会关闭连接)；
+            # 被取消或出错时不再等待还没完成的回复
+            if not writer_task.done():
+                writer_task.cancel()
+                await asyncio.gather(writer_task, return_exceptions=True)
+            self._connections.discard(connection)
+
+    async def _read_commands(self, reader, replies):
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # 一行超过了 StreamReader 的长度上限 (默认 64 KiB)：回复错误后断开这个连接，
+                    # 剩下的半行已经无法和下一条命令区分开了
+                    await replies.put((None, ("error", "错误: 命令太长"), time.perf_counter()))
+                    break
+                if not line:
+                    break
+                started = time.perf_counter()
+                text = line.decode("utf-8", errors="replace").strip()
+                if not text:
+                    continue
+                if text.lower() == "quit":
+                    await replies.put((None, ("quit", "bye"), started))
+                    break
+                future = asyncio.get_running_loop().create_future()
+                await replies.put((future, None, started)) # 这个连接在处理中的命令太多时在这里等待
+                await self._queue.put((text, future))       # 全局队列满时在这里等待
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+
+    async def _write_replies(self, replies, writer):
+        try:
+            while True:
+                item = await replies.get()
+                if item is None:
+                    break
+                future, immediate, started = item # immediate：不经过 worker、直接回复的 (命令名, 回复)
+                name, reply = immediate if future is None else await future
+                writer.write(reply.encode("utf-8") + b"\n")
+                if writer.transport.get_write_buffer_size() > 64 * 1024:
+                    await writer.drain() # 对端读得慢时在这里等待
+                self._record(name, time.perf_counter() - started)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _worker(self):
+        while True:
+            text, future = await self._queue.get()
+            name, _, args = text.partition(" ")
+            name = name.lower()
+            handler = self._handlers.get(name)
+            try:
+                if handler is None:
+                    reply = f"未知命令: {name}"
+                else:
+                    reply = handler(args)
+                    if inspect.isawaitable(reply):
+                        reply = await reply
+                    reply = "" if reply is None else str(reply)
+            except Exception as e: # 一条命令出错不能影响整个循环
+                reply = f"错误: {type(e).__name__}: {e}"
+            except asyncio.CancelledError: # close() 停止 worker 时，正在处理的命令也算失败
+                future.cancel()
+                raise
+            if not future.done():
+                future.set_result((name if handler else "unknown", reply.replace("\n", " ")))
+            self._queue.task_done()
+
+    # ---------- 延迟统计 ----------
+
+    def _record(self, name, seconds):
+        samples = self._latencies.get(name)
+        if samples is None:
+            samples = self._latencies[name] = deque(maxlen=LATENCY_SAMPLES)
+        samples.append(seconds)
+
+    def latency_report(self):
+        """
+        每个命令的延迟统计 (单位：毫秒)，统计的是最近 LATENCY_SAMPLES 条。
+
+        Returns:
+            dict: {命令名: {"count", "p50", "p99", "max"}}
+        """
+        report = {}
+        for name, samples in self._latencies.items():
+            values = sorted(samples)
+            report[name] = {
+                "count": len(values),
+                "p50": _percentile(values, 0.50) * 1000,
+                "p99": _percentile(values, 0.99) * 1000,
+                "max": (values[-1] if values else 0.0) * 1000,
+            }
+        return report
+
+
+async def _main():
+    # 直接运行本文件：同时监听标准输入和一个本地端口，用 nc 127.0.0.1 <端口> 也能输入命令
+    loop = CommandLoop()
+
+    @loop.command("stats")
+    def stats(args):
+        return loop.latency_report()
+
+    @loop.command("shutdown")
+    def shutdown(args):
+        loop.stop()
+        return "正在关闭..."
+
+    port = await loop.serve_tcp()
+    print(f"命令循环已启动，也可以连接 127.0.0.1:{port}；输入 quit 结束当前输入源，shutdown 关闭程序")
+    stdin_task = await loop.add_pipe()
+    await asyncio.wait([stdin_task, asyncio.create_task(loop.wait_stopped())],
+                       return_when=asyncio.FIRST_COMPLETED)
+    await loop.close()
+
+if __name__ == "__main__":
+    asyncio.run(_main())
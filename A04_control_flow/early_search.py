@@ -0,0 +1,184 @@
+# ============================================
+#   early_search.py：“找到第一个就停”的搜索工具
+# ============================================
+# A04_control_flow.py 的 break 演示：逐个检查 numbers，找到第一个大于 10 的数就 break。
+# 对几百万个元素的序列，这个写法有三个问题：
+# 1. 每个元素都要执行一轮解释器循环 (还要 print 一次)；
+# 2. 如果序列本来就是有序的，其实用二分查找 (bisect) 只要比较 log2(n) 次；
+# 3. 只能用一个 CPU 核。
+#
+# 这里的做法：
+# * first_where(seq, ">", 10)：默认按无序处理；调用者知道序列有序时传 assume_sorted=True，用 bisect，O(log n)；
+#   无序序列按块处理：先用 C 实现的 max()/min() 判断这一块里有没有可能命中，
+#   没有就整块跳过，有才在块内定位；装了 numpy 时直接用向量化的比较 + argmax；
+# * first_index(seq, predicate)：任意条件的线性搜索，用 compress + map 把循环放进 C 里；
+# * parallel_first_where：把序列切块交给进程池，某一块命中后，排在它后面的块立即取消；
+# * 逐个打印变成可选的 trace(index, value) 钩子，默认不调用，传入后才走逐个检查的慢路径。
+
+import operator
+import os
+from bisect import bisect_left, bisect_right
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import compress, count, islice, repeat
+
+try:
+    import numpy as np # 可选依赖
+except ImportError:
+    np = None
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+OPS = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+def is_sorted(seq):
+    """
+    序列是否从小到大有序。
+    在 C 里逐对比较，遇到第一个逆序就停止：无序数据通常很快返回 False，有序数据要完整扫一遍。
+    """
+    if isinstance(seq, range):
+        return seq.step > 0 or len(seq) <= 1
+    if np is not None and isinstance(seq, np.ndarray):
+        return bool((seq[:-1] <= seq[1:]).all())
+    return all(map(operator.le, seq, islice(seq, 1, None)))
+
+def first_index(seq, predicate, trace=None):
+    """
+    第一个满足 predicate(x) 的元素的下标，找不到返回 -1。
+
+    Args:
+        trace: 可选的钩子 trace(index, value)，每检查一个元素调用一次 (用于调试或教学演示)。
+    """
+    if trace is None:
+        # compress 只保留 predicate 为真的下标，next 拿到第一个就停：整个循环都在 C 里
+        return next(compress(count(), map(predicate, seq)), -1)
+    for index, value in enumerate(seq):
+        trace(index, value)
+        if predicate(value):
+            return index
+    return -1
+
+def _sorted_first(seq, op, value):
+    # 有序 (升序) 序列上的二分查找
+    n = len(seq)
+    if op == ">":
+        i = bisect_right(seq, value)
+    elif op == ">=":
+        i = bisect_left(seq, value)
+    elif op == "==":
+        i = bisect_left(seq, value)
+        if i < n and seq[i] != value:
+            i = n
+    elif op == "!=":
+        i = 0 if n and seq[0] != value else bisect_right(seq, value)
+    else: # "<" / "<=" 如果有命中，一定是第一个元素
+        i = 0 if n and OPS[op](seq[0], value) else n
+    return i if i < n else -1
+
+def _numpy_first(arr, op, value, chunk_size):
+    # 向量化比较：一次比较一整块，argmax 找到块内第一个 True
+    compare = OPS[op]
+    for start in range(0, len(arr), chunk_size):
+        mask = compare(arr[start:start + chunk_size], value)
+        i = int(mask.argmax())
+        if mask[i]:
+            return start + i
+    return -1
+
+def _chunked_first(seq, op, value, chunk_size):
+    # 对 > >= < <= ：先用 C 实现的 max() / min() 判断这一块能不能命中，不能就整块跳过
+    # 块从 1024 个元素开始、每次翻倍，直到 chunk_size：命中很靠前时不用先扫完一整个大块
+    compare = OPS[op]
+    bound = max if op in (">", ">=") else min
+    start, size = 0, min(1024, chunk_size)
+    while start < len(seq):
+        chunk = seq[start:start + size]
+        extreme = bound(chunk)
+        # 块里有 NaN 时 max() / min() 的结果取决于 NaN 的位置 (max([nan, 5.0]) 是 nan)，不能据此跳过，逐个比较
+        if extreme != extreme or compare(extreme, value):
+            hit = next(compress(count(), map(compare, chunk, repeat(value))), None)
+            if hit is not None:
+                return start + hit
+        start += size
+        size = min(size * 2, chunk_size)
+    return -1
+
+def first_where(seq, op, value, *, assume_sorted=False, trace=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    第一个满足 x <op> value 的元素的下标，找不到返回 -1。
+
+    Args:
+        seq: list、tuple、range、array.array 或 numpy 数组。
+        op (str): ">"、">="、"<"、"<="、"=="、"!=" 之一。
+        assume_sorted (bool or None): True 表示调用者保证序列升序，用二分查找；
+            默认 False，不做任何检测 (检测有序要把整个序列扫一遍，比命中靠前时的搜索本身还慢)；
+            None 表示先调用 is_sorted() 检测。对同一个序列反复查询时，检测一次后传入结果。
+        trace: 可选的钩子 trace(index, value)；传入后逐个检查元素，不走任何快速路径。
+    """
+    if op not in OPS:
+        raise ValueError(f"不支持的比较运算: {op}")
+    if trace is not None:
+        compare = OPS[op]
+        return first_index(seq, lambda x: compare(x, value), trace)
+    if assume_sorted is None:
+        assume_sorted = is_sorted(seq)
+    if assume_sorted:
+        return _sorted_first(seq, op, value)
+    if np is not None and isinstance(seq, np.ndarray):
+        return _numpy_first(seq, op, value, chunk_size)
+    if op in ("==", "!="):
+        return next(compress(count(), map(OPS[op], seq, repeat(value))), -1)
+    return _chunked_first(seq, op, value, chunk_size)
+
+
+# ---------- 多进程分块搜索 ----------
+
+def _search_chunk(chunk, op, value):
+    # 进程池里执行的函数必须在模块顶层 (才能被 pickle)
+    return first_where(chunk, op, value, assume_sorted=False)
+
+def parallel_first_where(seq, op, value, workers=None, chunk_size=DEFAULT_CHUNK_SIZE * 16):
+    """
+    用进程池分块搜索无序序列，返回第一个满足 x <op> value 的下标，找不到返回 -1。
+    块按顺序提交，同时在执行的最多 2 * workers 块；某一块命中后，
+    排在它后面的块不再提交，已提交但还没开始的会被取消，只等前面的块算完。
+    (每一块都要 pickle 后发给子进程，数据量不大或者命中很靠前时，单进程的 first_where 更快)
+    """
+    if op not in OPS:
+        raise ValueError(f"不支持的比较运算: {op}")
+    workers = workers or os.cpu_count() or 1
+    starts = iter(range(0, len(seq), chunk_size))
+    found = None # 已命中的块中最靠前的起点
+    result = -1
+    in_flight = {} # future -> 块的起点
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        while True:
+            while len(in_flight) < 2 * workers:
+                start = next(starts, None)
+                if start is None or (found is not None and start > found):
+                    break
+                in_flight[pool.submit(_search_chunk, seq[start:start + chunk_size], op, value)] = start
+            if not in_flight:
+                return result
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                start = in_flight.pop(future)
+                index = future.result()
+                if index >= 0 and (found is None or start < found):
+                    found, result = start, start + index
+            if found is not None:
+                # 排在命中块之后的块：能取消的取消，已经在跑的也不再等待它的结果
+                for future, start in list(in_flight.items()):
+                    if start > found:
+                        future.cancel()
+                        del in_flight[future]
+    finally:
+        # 没开始的块全部取消；正在运行的最多 workers 块，等它们结束后再关闭进程池
+        pool.shutdown(wait=True, cancel_futures=True)
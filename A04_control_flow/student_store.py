@@ -0,0 +1,187 @@
+# ============================================
+#   student_store.py：带分数索引的学生成绩表
+# ============================================
+# A04_control_flow.py 用 for name, score in student_scores.items() 遍历成绩字典。
+# 想找“80 到 90 分的学生”或者“前 10 名”，每次都要把整个字典扫一遍：100 万个学生就是 100 万次循环。
+#
+# StudentStore 在字典之外再维护一个按 (分数, 姓名) 排好序的“二级索引”：
+# * 范围查询 between(low, high)：用 bisect 二分找到起点，再顺序取出结果，O(log n + k)；
+# * top(k) / bottom(k)：有序索引的两端就是最高分和最低分，同样是 O(log n + k)；
+# * 修改分数时增量维护索引：二分找到旧位置删掉，再二分插入新位置，不需要重新排序。
+#
+# 索引不是一个大列表，而是若干个“桶” (每个最多 2 * _LOAD 项的有序小列表)：
+# 在 100 万项的大列表中间插入 / 删除要移动几十万个元素 (约 1 ms)，
+# 分桶之后只需移动桶内的几百个元素，每次修改只要几微秒。
+# 分数相同的学生按姓名排序，这样结果是确定的，删除时也能精确定位。
+
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from operator import itemgetter
+
+_LOAD = 1000
+_score = itemgetter(0)
+
+class _SortedIndex:
+    """分桶的有序列表，元素是 (分数, 姓名)"""
+
+    def __init__(self, pairs):
+        pairs = sorted(pairs)
+        self._buckets = [pairs[i:i + _LOAD] for i in range(0, len(pairs), _LOAD)]
+        self._maxes = [bucket[-1] for bucket in self._buckets] # 每个桶的最后一项
+
+    def _locate(self, item):
+        b = bisect_left(self._maxes, item)
+        if b == len(self._maxes):
+            b -= 1 # 比所有元素都大：放进最后一个桶
+        return b, bisect_left(self._buckets[b], item)
+
+    def insert(self, item):
+        if not self._buckets:
+            self._buckets.append([item])
+            self._maxes.append(item)
+            return
+        b, i = self._locate(item)
+        bucket = self._buckets[b]
+        bucket.insert(i, item)
+        self._maxes[b] = bucket[-1]
+        if len(bucket) > 2 * _LOAD: # 桶太大：一分为二
+            self._buckets.insert(b + 1, bucket[_LOAD:])
+            del bucket[_LOAD:]
+            self._maxes.insert(b, bucket[-1])
+
+    def remove(self, item):
+        b, i = self._locate(item)
+        bucket = self._buckets[b]
+        del bucket[i]
+        if bucket:
+            self._maxes[b] = bucket[-1]
+        else:
+            del self._buckets[b]
+            del self._maxes[b]
+
+    def index(self, item):
+        b, i = self._locate(item)
+        return sum(map(len, islice(self._buckets, b))) + i
+
+    def range(self, low, high):
+        """分数在 [low, high] 之间的项，按从小到大的顺序产出"""
+        b = bisect_left(self._maxes, low, key=_score)
+        for bucket in islice(self._buckets, b, None):
+            start = bisect_left(bucket, low, key=_score) if bucket[0][0] < low else 0
+            if bucket[-1][0] <= high:
+                yield from islice(bucket, start, None)
+            else:
+                yield from islice(bucket, start, bisect_right(bucket, high, key=_score))
+                return
+
+    def count_range(self, low, high):
+        if low > high: # 空区间，和 range() 返回空列表一致
+            return 0
+        b = bisect_left(self._maxes, low, key=_score)
+        count = 0
+        for bucket in islice(self._buckets, b, None):
+            start = bisect_left(bucket, low, key=_score)
+            if bucket[-1][0] <= high:
+                count += len(bucket) - start
+            else:
+                return count + bisect_right(bucket, high, key=_score) - start
+        return count
+
+    def largest(self, k):
+        """最大的 k 项，从大到小"""
+        for bucket in reversed(self._buckets):
+            if k <= 0:
+                return
+            yield from islice(reversed(bucket), k)
+            k -= len(bucket)
+
+    def smallest(self, k):
+        """最小的 k 项，从小到大"""
+        for bucket in self._buckets:
+            if k <= 0:
+                return
+            yield from islice(bucket, k)
+            k -= len(bucket)
+
+    def __len__(self):
+        return sum(map(len, self._buckets))
+
+
+class StudentStore:
+    """
+    学生成绩表。
+
+    Args:
+        scores (dict): 可选的初始数据 {姓名: 分数}。
+    """
+
+    def __init__(self, scores=None):
+        self._scores = dict(scores) if scores else {}
+        # 初始数据一次性排序建索引，比逐个插入快得多
+        self._index = _SortedIndex((score, name) for name, score in self._scores.items())
+
+    # ---------- 字典接口 ----------
+
+    def __setitem__(self, name, score):
+        old = self._scores.get(name)
+        if old is not None:
+            if old == score:
+                return
+            self._index.remove((old, name))
+        self._scores[name] = score
+        self._index.insert((score, name))
+
+    def __getitem__(self, name):
+        return self._scores[name]
+
+    def get(self, name, default=None):
+        return self._scores.get(name, default)
+
+    def __delitem__(self, name):
+        score = self._scores.pop(name)
+        self._index.remove((score, name))
+
+    def __contains__(self, name):
+        return name in self._scores
+
+    def __len__(self):
+        return len(self._scores)
+
+    def __iter__(self):
+        return iter(self._scores)
+
+    def items(self):
+        """(姓名, 分数) 对，按插入顺序，与 dict.items() 相同"""
+        return self._scores.items()
+
+    def update(self, scores):
+        """批量修改分数"""
+        for name, score in dict(scores).items():
+            self[name] = score
+
+    # ---------- 索引查询 ----------
+
+    def between(self, low, high):
+        """
+        分数在 [low, high] 之间的学生，按分数从低到高排列。
+
+        Returns:
+            list: [(姓名, 分数), ...]
+        """
+        return [(name, score) for score, name in self._index.range(low, high)]
+
+    def count_between(self, low, high):
+        """分数在 [low, high] 之间的人数 (只数不取，不创建结果列表)"""
+        return self._index.count_range(low, high)
+
+    def top(self, k):
+        """分数最高的 k 个学生，从高到低排列 (分数相同时按姓名倒序)"""
+        return [(name, score) for score, name in self._index.largest(k)]
+
+    def bottom(self, k):
+        """分数最低的 k 个学生，从低到高排列"""
+        return [(name, score) for score, name in self._index.smallest(k)]
+
+    def rank(self, name):
+        """名次 (1 表示最高分)；同分时按姓名倒序排在前面"""
+        return len(self._scores) - self._index.index((self._scores[name], name))
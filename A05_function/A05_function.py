@@ -140,8 +140,10 @@ print("-" * 30)
 print("--- 7. 任意数量的参数 ---")
 
 # a. 使用 *args 计算任意数字的和
-def sum_all(*numbers):
-    print(f"接收到的参数元组: {numbers}")
+# verbose 写在 *numbers 后面，所以它只能通过关键字传入 (仅限关键字参数)
+def sum_all(*numbers, verbose=True):
+    if verbose: # 数据量大时传入 verbose=False，省掉打印整个元组的开销
+        print(f"接收到的参数元组: {numbers}")
     total = 0
     for num in numbers:
         total += num
@@ -149,17 +151,22 @@ def sum_all(*numbers):
 
 print(f"1, 2, 3 的和是: {sum_all(1, 2, 3)}")
 print(f"10, 20, 30, 40 的和是: {sum_all(10, 20, 30, 40)}")
+print(f"不打印参数元组: {sum_all(*range(1000), verbose=False)}")
+# 更大的数据流请使用 sum_engine.reduce_sum (分块 + 多进程 + 补偿求和)
 
 # b. 使用 **kwargs 构建一个用户资料
-def build_profile(name, **user_info):
+# 开关叫 _verbose 而不是 verbose：**user_info 收的是任意资料项，verbose 也可能是一项资料，名字不能和它撞上
+def build_profile(name, *, _verbose=True, **user_info):
     profile = {'name': name}
-    print(f"接收到的关键字参数字典: {user_info}")
+    if _verbose:
+        print(f"接收到的关键字参数字典: {user_info}")
     for key, value in user_info.items():
         profile[key] = value
     return profile
 
 user1 = build_profile("Alice", age=28, city="New York", occupation="Developer", hobby="编程")
 print(f"构建的用户资料: {user1}")
+# 用户数量很大时，每人一个字典太占内存，请使用 profile_store.ProfileStore (按列存储)
 print("-" * 30)
 
 
@@ -199,19 +206,21 @@ print("-" * 30)
 print("--- 9. 文档字符串 ---")
 
 def power(base, exponent):
-    f"""
+    """
     计算一个数的幂。
 
     Args:
         base (int or float): 基数。
         exponent (int or float): 指数。
-        {base ** exponent}
+
     Returns:
         int or float: base 的 exponent 次幂的结果。
     """
     return base ** exponent
 
-# 使用 help() 函数可以查看一个函数的文档字符串,是静态的如果向上面这样打印不出来
+# 使用 help() 函数可以查看一个函数的文档字符串。
+# 文档字符串是静态的：如果写成 f"""...""" (f-string)，它就不再是文档字符串，help() 打印不出来。
+# 需要缓存、取模、批量计算的版本见 fast_power.py
 help(power)
 print(f"\n2的3次方是: {power(2, 3)}")
 
@@ -0,0 +1,45 @@
+# bench_power.py
+# 对比 A05_function.py 中原始的 power (每次 base ** exponent) 与 fast_power 的缓存 / 批量版本。
+#
+# 用法：python bench_power.py [调用次数]
+
+import random
+import sys
+import time
+
+import fast_power
+
+def plain_power(base, exponent):
+    # 与 A05_function.py 里的 power 相同
+    return base ** exponent
+
+def timed(label, func):
+    start = time.perf_counter()
+    func()
+    print(f"  {label:<24} {time.perf_counter() - start:>8.4f} 秒")
+
+if __name__ == "__main__":
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    # 工作负载：少量 (base, exponent) 组合被反复调用，其中包含大整数
+    pairs = [(2, 10000), (3, 5000), (7, 2024), (12345, 800), (1.0001, 5000)]
+    workload = [random.choice(pairs) for _ in range(calls)]
+
+    print(f"--- 1. 重复调用 {calls} 次 ---")
+    timed("原始 power", lambda: [plain_power(b, e) for b, e in workload])
+    fast_power.cache_clear()
+    timed("fast_power.power (缓存)", lambda: [fast_power.power(b, e) for b, e in workload])
+    print(f"  缓存统计: {fast_power.cache_info()}")
+    print("-" * 30)
+
+    print("--- 2. 模幂运算：3 ** (10**18) % (10**9 + 7) ---")
+    timed("fast_power.power(mod=...)", lambda: fast_power.power(3, 10 ** 18, 10 ** 9 + 7))
+    print("  (不取模的话这个结果有约 4.8 * 10**17 位，根本算不出来)")
+    print("-" * 30)
+
+    print("--- 3. 批量：base=3，指数 0..1999 ---")
+    exponents = list(range(2000))
+    timed("逐个 plain_power", lambda: [plain_power(3, e) for e in exponents])
+    timed("fast_power.power_batch", lambda: fast_power.power_batch(3, exponents))
+    timed("power_batch(mod=...)", lambda: fast_power.power_batch(3, exponents, mod=10 ** 9 + 7))
+    print("-" * 30)
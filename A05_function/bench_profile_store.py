@@ -0,0 +1,55 @@
+# bench_profile_store.py
+# 对比“每个用户一个字典 (build_profile)”和 ProfileStore 按列存储的内存占用。
+#
+# 用法：python bench_profile_store.py [用户数量]
+
+import random
+import sys
+import time
+import tracemalloc
+
+from profile_store import ProfileStore
+
+CITIES = ["New York", "Beijing", "London", "Tokyo", "Paris"]
+JOBS = ["Developer", "Designer", "Teacher", "Doctor"]
+
+def build_profile(name, **user_info):
+    # 与 A05_function.py 里的 build_profile 相同 (去掉了打印)
+    profile = {'name': name}
+    for key, value in user_info.items():
+        profile[key] = value
+    return profile
+
+def make_rows(n):
+    for i in range(n):
+        yield {
+            'name': f"user{i}",
+            'age': random.randint(18, 80),
+            'city': random.choice(CITIES),
+            'occupation': random.choice(JOBS),
+            'score': random.random(),
+        }
+
+def measure(label, build):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<16} {current / 1024 / 1024:>8.1f} MB  {elapsed:>7.2f} 秒")
+    return result
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    random.seed(0)
+    rows = list(make_rows(n))
+
+    print(f"--- {n} 个用户的内存占用 (不含输入数据本身) ---")
+    dicts = measure("list of dicts", lambda: [build_profile(**row) for row in rows])
+    store = ProfileStore()
+    measure("ProfileStore", lambda: store.extend(rows))
+
+    # 读取结果应该一致
+    assert dict(store[n // 2]) == dicts[n // 2]
+    print("-" * 30)
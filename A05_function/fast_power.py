@@ -0,0 +1,113 @@
+# ============================================
+#   fast_power.py：带缓存、取模和批量计算的 power
+# ============================================
+# A05_function.py 里的 power(base, exponent) 每次都从头计算 base ** exponent。
+# 如果反复用同一小批 (base, exponent) 调用它，尤其是大整数，就会重复做大量相同的工作。
+#
+# 这里提供：
+# * power(base, exponent, mod=None)：结果放进一个有上限的 LRU 缓存 (functools.lru_cache)，
+#   cache_info() 可以看到命中 (hits) / 未命中 (misses) 次数；
+#   缓存只按条数限制，所以超过 CACHE_MAX_RESULT_BITS 位的整数结果不进缓存，缓存最多约占 CACHE_SIZE * 8KB；
+# * mod 参数：模幂运算，直接交给内置的 pow(base, exponent, mod)，它在 C 里用“平方求幂”实现，
+#   中间结果始终小于 mod，指数再大也不会产生巨大的整数；
+# * 溢出检查：浮点结果溢出时抛出 OverflowError，整数结果估计位数过大时也提前拒绝；
+# * power_batch(base, exponents, mod=None)：一次计算一整组指数。
+
+import math
+from functools import lru_cache
+
+try:
+    import numpy as np # 可选依赖
+except ImportError:
+    np = None
+
+CACHE_SIZE = 1024                # LRU 缓存最多保存多少个结果
+CACHE_MAX_RESULT_BITS = 1 << 16  # 估计超过这么多位 (8KB) 的结果不缓存
+MAX_RESULT_BITS = 1 << 24        # 不取模时，整数结果最多允许多少位 (约 2MB)
+
+def _check_int_size(base, exponent):
+    # |base| 的位数 * 指数 ≈ 结果的位数，先估算，避免算出一个巨大的整数
+    if exponent > 0 and abs(base) > 1 and base.bit_length() * exponent > MAX_RESULT_BITS:
+        raise OverflowError(f"{base} ** {exponent} 的结果太大，请使用 mod 参数做模幂运算")
+
+def _check_float(result, base, exponent):
+    if isinstance(result, float) and math.isinf(result) and not math.isinf(base):
+        raise OverflowError(f"{base} ** {exponent} 超出了浮点数的表示范围")
+
+def _compute_power(base, exponent, mod):
+    if mod is not None:
+        return pow(base, exponent, mod) # 平方求幂，C 实现
+    if isinstance(base, int) and isinstance(exponent, int):
+        _check_int_size(base, exponent)
+        return base ** exponent
+    try:
+        result = base ** exponent
+    except OverflowError:
+        raise OverflowError(f"{base} ** {exponent} 超出了浮点数的表示范围") from None
+    _check_float(result, base, exponent)
+    return result
+
+# typed=True：2 和 2.0、True 和 1 分开缓存，否则 power(2.0, 3) 会拿到之前 power(2, 3) 缓存的整数 8
+_cached_power = lru_cache(maxsize=CACHE_SIZE, typed=True)(_compute_power)
+
+def _too_big_to_cache(base, exponent, mod):
+    # 结果的位数上限：取模时不超过 mod 的位数，否则约为 base 的位数 * 指数；浮点数只有 8 字节
+    if mod is not None:
+        return isinstance(mod, int) and mod.bit_length() > CACHE_MAX_RESULT_BITS
+    return (isinstance(base, int) and isinstance(exponent, int)
+            and base.bit_length() * exponent > CACHE_MAX_RESULT_BITS)
+
+def power(base, exponent, mod=None):
+    """
+    计算 base 的 exponent 次幂，结果会被缓存 (估计超过 CACHE_MAX_RESULT_BITS 位的不缓存，也不计入 cache_info)。
+
+    Args:
+        base (int or float): 基数。
+        exponent (int or float): 指数。
+        mod (int or None): 给出时计算 (base ** exponent) % mod。
+
+    Returns:
+        int or float: 幂运算的结果。
+    """
+    if _too_big_to_cache(base, exponent, mod):
+        return _compute_power(base, exponent, mod)
+    return _cached_power(base, exponent, mod)
+
+def cache_info():
+    """返回缓存统计 (hits, misses, maxsize, currsize)"""
+    return _cached_power.cache_info()
+
+def cache_clear():
+    """清空缓存并把计数器归零"""
+    _cached_power.cache_clear()
+
+def power_batch(base, exponents, mod=None):
+    """
+    对同一个 base 计算一组指数的幂，按输入顺序返回列表。
+
+    整数 base (或给出 mod) 且指数都是非负整数时，先去重、排序，再从上一个结果“接着乘”：
+    base**e2 = base**e1 * base**(e2 - e1)，每个结果只需要一次小的幂运算。
+    浮点 base 连乘会累积舍入误差，所以逐个直接计算。
+    numpy 数组 (且不取模) 时直接交给 np.power。
+    """
+    if np is not None and isinstance(exponents, np.ndarray) and mod is None:
+        return np.power(base, exponents)
+
+    exponents = list(exponents)
+    incremental = (mod is not None or isinstance(base, int)) and all(isinstance(e, int) and e >= 0 for e in exponents)
+    if not incremental:
+        # 浮点 base、负数或小数指数都不适合“接着乘”，逐个计算
+        return [_compute_power(base, e, mod) for e in exponents]
+
+    results = {}
+    prev_exp, prev_value = 0, 1
+    for e in sorted(set(exponents)):
+        if mod is None and isinstance(base, int):
+            _check_int_size(base, e)
+        value = prev_value * _compute_power(base, e - prev_exp, mod)
+        if mod is not None:
+            value %= mod
+        _check_float(value, base, e)
+        results[e] = value
+        prev_exp, prev_value = e, value
+    return [results[e] for e in exponents]
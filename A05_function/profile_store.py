@@ -0,0 +1,197 @@
+# ============================================
+#   profile_store.py：按列存储的用户资料库
+# ============================================
+# A05_function.py 里的 build_profile(name, **user_info) 每个用户都新建一个字典。
+# 一个小字典本身就要占一两百字节，几百万个用户时，大部分内存都花在了“字典的壳”上，
+# 而且每个字典都重复保存同样的键 ('age'、'city'...)。
+#
+# ProfileStore 换一种思路——按列存储 (columnar)：
+# * 每个属性 (键) 只保存一次 (用 sys.intern 驻留)，对应一整列数据；
+# * 整数列用 array('q')、浮点列用 array('d')，每个值只占 8 字节；
+# * 字符串列做“字典编码”：相同的字符串只存一份，列里只存一个整数编号；
+# * 其他类型 (或类型混杂) 的列退化成普通 list；
+# * store[i] 返回第 i 行的只读视图，用起来和字典一样：row['age']、row.get('city')、dict(row)。
+
+import sys
+from array import array
+from collections.abc import Mapping
+
+_MISSING = object() # 某一行没有这个属性时的占位符
+_MAX_DISTINCT = 1024 # 字符串列超过这么多个不同的值后，检查字典编码是否还划算
+
+class _Column:
+    """一列数据，根据第一个值选择存储方式，遇到放不下的值时退化为 list"""
+
+    __slots__ = ("kind", "data", "missing", "values", "lookup")
+
+    def __init__(self, sample, length):
+        if isinstance(sample, bool):
+            self.kind = "object" # bool 是 int 的子类，单独处理以免读出来变成 0/1
+        elif isinstance(sample, int):
+            self.kind = "int"
+        elif isinstance(sample, float):
+            self.kind = "float"
+        elif isinstance(sample, str):
+            self.kind = "str"
+        else:
+            self.kind = "object"
+
+        if self.kind == "int":
+            self.data = array('q', [0]) * length
+        elif self.kind == "float":
+            self.data = array('d', [0.0]) * length
+        elif self.kind == "str":
+            self.data = array('i', [-1]) * length # -1 表示缺失
+            self.values = []
+            self.lookup = {}
+        else:
+            self.data = [_MISSING] * length
+        # 数值列每行一个字节的缺失标记 (1 = 缺失)；字符串列用 -1、list 列用 _MISSING 表示缺失
+        self.missing = bytearray(b"\x01") * length if self.kind in ("int", "float") else None
+
+    def append(self, value):
+        if self.kind == "int":
+            if isinstance(value, int) and not isinstance(value, bool):
+                try:
+                    self.data.append(value)
+                    self.missing.append(0)
+                    return
+                except OverflowError: # 超出 64 位的大整数
+                    pass
+        elif self.kind == "float":
+            if isinstance(value, float):
+                self.data.append(value)
+                self.missing.append(0)
+                return
+        elif self.kind == "str":
+            if isinstance(value, str):
+                code = self.lookup.get(value)
+                if code is None:
+                    if len(self.values) > _MAX_DISTINCT and len(self.values) * 2 > len(self.data):
+                        # 几乎每个值都不同 (比如 name)：字典编码反而更费内存，改用 list
+                        self._to_object()
+                        self.data.append(value)
+                        return
+                    code = self.lookup[value] = len(self.values)
+                    self.values.append(sys.intern(value))
+                self.data.append(code)
+                return
+        else:
+            self.data.append(value)
+            return
+        self._to_object()
+        self.data.append(value)
+
+    def append_missing(self):
+        if self.kind in ("int", "float"):
+            self.missing.append(1)
+            self.data.append(0)
+        elif self.kind == "str":
+            self.data.append(-1)
+        else:
+            self.data.append(_MISSING)
+
+    def get(self, row):
+        if self.kind == "str":
+            code = self.data[row]
+            return _MISSING if code < 0 else self.values[code]
+        if self.kind in ("int", "float") and self.missing[row]:
+            return _MISSING
+        return self.data[row]
+
+    def _to_object(self):
+        # 类型混杂：把整列转换成普通 list
+        self.data = [self.get(row) for row in range(len(self.data))]
+        self.kind = "object"
+        self.missing = None
+        self.values = self.lookup = None
+
+    def __len__(self):
+        return len(self.data)
+
+
+class ProfileView(Mapping):
+    """ProfileStore 中一行的只读、类似字典的视图"""
+
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store, row):
+        self._store = store
+        self._row = row
+
+    def __getitem__(self, key):
+        column = self._store._columns.get(key)
+        if column is None:
+            raise KeyError(key)
+        value = column.get(self._row)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self):
+        for key, column in self._store._columns.items():
+            if column.get(self._row) is not _MISSING:
+                yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"ProfileView({dict(self)})"
+
+
+class ProfileStore:
+    """按列存储大量用户资料，接口与 build_profile 对应"""
+
+    def __init__(self):
+        self._columns = {} # 键 -> _Column
+        self._size = 0
+
+    def add(self, name, **user_info):
+        """添加一个用户 (参数与 build_profile 相同)，返回行号"""
+        return self._append_row({'name': name, **user_info})
+
+    def extend(self, profiles):
+        """批量添加：profiles 是一组字典 (每个都要有 'name' 键)"""
+        for profile in profiles:
+            if 'name' not in profile:
+                raise KeyError("每条资料都必须包含 'name'")
+            self._append_row(profile)
+
+    def _append_row(self, fields):
+        columns = self._columns
+        for key, value in fields.items():
+            column = columns.get(key)
+            if column is None:
+                # 新的属性：之前的所有行都记为缺失
+                column = columns[sys.intern(key)] = _Column(value, self._size)
+            column.append(value)
+        if len(fields) < len(columns):
+            for key, column in columns.items():
+                if key not in fields:
+                    column.append_missing()
+        self._size += 1
+        return self._size - 1
+
+    def column(self, key):
+        """按行号顺序返回某个属性的所有值 (缺失的是 None)"""
+        column = self._columns[key]
+        return [None if v is _MISSING else v for v in map(column.get, range(self._size))]
+
+    def keys(self):
+        """所有出现过的属性名"""
+        return list(self._columns)
+
+    def __getitem__(self, row):
+        if row < 0:
+            row += self._size
+        if not 0 <= row < self._size:
+            raise IndexError("ProfileStore 行号超出范围")
+        return ProfileView(self, row)
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        for row in range(self._size):
+            yield ProfileView(self, row)
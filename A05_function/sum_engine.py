@@ -0,0 +1,136 @@
+# ============================================
+#   sum_engine.py：sum_all 的“大数据版”求和引擎
+# ============================================
+# A05_function.py 里的 sum_all(*numbers) 适合教学：把参数打包成元组、打印出来、再用 for 循环累加。
+# 但数据一大就有三个问题：
+# 1. *numbers 会把所有数据先复制成一个元组；
+# 2. 打印整个元组本身就是 O(n) 的字符串拼接；
+# 3. 浮点数一个一个往上加，误差会越积越多。
+#
+# 这里的做法：
+# * 接收任意可迭代对象或缓冲区 (list、array.array、numpy 数组、生成器...)，按块 (chunk) 切开；
+# * 每一块交给一个“核函数”求部分和：numpy 用 np.sum，浮点 array 用 math.fsum，其他用 Neumaier 求和；
+# * 可以选择用进程池 (ProcessPoolExecutor) 并行地算要在 Python 里逐个累加的块 (列表、生成器)；
+# * 最后用 Neumaier 补偿求和把所有部分和合并起来，保证浮点总和的精度。
+
+import math
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+try:
+    import numpy as np # 可选依赖
+except ImportError:
+    np = None
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+def _neumaier(values):
+    """Neumaier 补偿求和，返回 (和, 补偿项) 两部分"""
+    total = 0 # 从整数 0 开始：如果全是整数，结果仍然是精确的整数
+    compensation = 0 # 记录每一步加法中“丢掉”的低位
+    for x in values:
+        t = total + x
+        if abs(total) >= abs(x):
+            compensation += (total - t) + x
+        else:
+            compensation += (x - t) + total
+        total = t
+    if not -math.inf < total < math.inf:
+        # 出现了 inf / nan：补偿项里会有 inf - inf = nan，丢掉它，和 sum() 的结果保持一致
+        return total, 0
+    return total, compensation
+
+def neumaier_sum(values):
+    """Neumaier 补偿求和 (Kahan 求和的改进版)"""
+    total, compensation = _neumaier(values)
+    return total + compensation
+
+def iter_chunks(data, chunk_size=DEFAULT_CHUNK_SIZE):
+    """把数据切成每块最多 chunk_size 个元素"""
+    if chunk_size <= 0:
+        raise ValueError("chunk_size 必须大于0！")
+    if hasattr(data, "__len__") and hasattr(data, "__getitem__"):
+        # 支持切片的序列/缓冲区：直接按下标切
+        for start in range(0, len(data), chunk_size):
+            yield data[start:start + chunk_size]
+    else:
+        # 生成器等一次性的可迭代对象：用 islice 一块一块地取
+        iterator = iter(data)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+def _as_array(chunk):
+    """memoryview 按它的格式复制成 array：既能 pickle，又能走 C 实现的核函数 (格式不支持时转成列表)"""
+    if isinstance(chunk, memoryview):
+        if chunk.format in "bBhHiIlLqQfd" and len(chunk.format) == 1:
+            return array(chunk.format, chunk)
+        return chunk.tolist()
+    return chunk
+
+def _in_c(chunk):
+    """这一块能否在 C 里求和 (numpy 数组、array)：这样的块直接在本进程算，比 pickle 给子进程还快"""
+    return isinstance(chunk, array) or (np is not None and isinstance(chunk, np.ndarray))
+
+def _chunk_sum(chunk):
+    """
+    单个块的求和核函数 (必须在模块顶层，进程池才能 pickle 它)。
+    返回 (部分和, 补偿项)，补偿项留到合并时再加，避免在块的边界上丢精度。
+    """
+    if np is not None and isinstance(chunk, np.ndarray):
+        return chunk.sum().item(), 0
+    if isinstance(chunk, array):
+        if chunk.typecode in "fd":
+            try:
+                return math.fsum(chunk), 0 # C 实现，结果是正确舍入的
+            except (OverflowError, ValueError):
+                # fsum 遇到溢出或 inf - inf 会报错，sum() 则返回 inf / nan：改用 Neumaier 求和得到同样的结果
+                return _neumaier(chunk)
+        return sum(chunk), 0 # 整数求和本身就是精确的
+    return _neumaier(chunk)
+
+def _parallel_partials(chunks, workers):
+    """
+    用进程池计算各块的部分和，按块的顺序逐个产出。
+    同时在途的块最多 2 * workers 个，数据来自生成器时内存占用也有上限。
+    """
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            if _in_c(chunk):
+                pending.append(_chunk_sum(chunk))
+            else:
+                pending.append(pool.submit(_chunk_sum, chunk))
+            if len(pending) >= 2 * workers:
+                partial = pending.popleft()
+                yield partial if isinstance(partial, tuple) else partial.result()
+        for partial in pending:
+            yield partial if isinstance(partial, tuple) else partial.result()
+
+def reduce_sum(data, chunk_size=DEFAULT_CHUNK_SIZE, workers=None):
+    """
+    分块求和。
+
+    Args:
+        data: 任意可迭代对象或缓冲区。
+        chunk_size (int): 每块的元素个数。
+        workers (int or None): 大于1时用这么多个进程并行计算各块。
+            只有列表、生成器这类要在 Python 里逐个累加的块才交给子进程；
+            array / numpy 的块在 C 里求和，比 pickle 给子进程还快，仍在本进程计算。
+
+    Returns:
+        int or float: 所有元素的和。
+    """
+    chunks = map(_as_array, iter_chunks(data, chunk_size))
+    if workers is not None and workers > 1:
+        partials = list(_parallel_partials(chunks, workers))
+    else:
+        partials = [_chunk_sum(chunk) for chunk in chunks]
+
+    # 先合并各块的部分和，再合并各块的补偿项
+    terms = [total for total, _ in partials] + [comp for _, comp in partials]
+    return neumaier_sum(terms)
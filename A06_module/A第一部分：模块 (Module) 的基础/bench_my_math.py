@@ -0,0 +1,50 @@
+# bench_my_math.py
+# 对比“循环里逐个调用 add”和“一次调用 add_batch”的耗时。
+#
+# 用法：python bench_my_math.py [最大数量级]
+#   默认跑 10^3 到 10^6；传入 8 就会一直跑到 10^8 (需要好几 GB 内存)。
+#
+# 没有安装 numpy 时，array 批量版本只省掉了 Python 层的函数调用，每个结果仍然要创建一个 float 对象，
+# 测试机上只快 1.0~1.2 倍；out= 省下的是和数据一样大的结果序列 (内存)，而不是时间。
+# 真正的向量化加速需要 numpy (最后一列)。
+
+import sys
+import time
+from array import array
+
+import my_math
+
+def timeit(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+def per_call_loop(a, b):
+    return [my_math.add(x, y) for x, y in zip(a, b)]
+
+if __name__ == "__main__":
+    max_exp = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+
+    print("--- add: 逐个调用 vs 批量调用 ---")
+    print(f"{'n':>12} {'逐个调用':>10} {'array批量':>10} {'加速比':>8} {'numpy':>10}")
+    for exp in range(3, max_exp + 1):
+        n = 10 ** exp
+        a = array('d', range(n))
+        b = array('d', range(n))
+        out = array('d', bytes(8 * n))
+
+        loop_time = timeit(per_call_loop, a, b)
+        batch_time = timeit(my_math.add_batch, a, b, out)
+        line = f"{n:>12} {loop_time:>10.4f} {batch_time:>10.4f} {loop_time / batch_time:>7.1f}x"
+
+        if my_math.np is not None:
+            na = my_math.np.arange(n, dtype=float)
+            nout = my_math.np.empty(n)
+            line += f" {timeit(my_math.add_batch, na, na, nout):>10.4f}"
+        else:
+            line += f" {'未安装':>10}"
+        print(line)
+    if my_math.np is None:
+        print("没有安装 numpy：array 批量版本和逐个调用差不多快 (上面的“加速比”约 1 倍)，省下的是结果序列的内存；")
+        print("要真正的向量化加速请安装 numpy。")
+    print("-" * 30)
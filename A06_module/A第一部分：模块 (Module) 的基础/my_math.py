@@ -1,5 +1,16 @@
 # my_math.py
 
+import numbers
+import operator
+from array import array
+from functools import partial
+from itertools import islice, repeat
+
+try:
+    import numpy as np # 可选依赖：安装了 numpy 就走向量化的 ufunc
+except ImportError:
+    np = None
+
 PI = 3.14159
 
 def add(a, b):
@@ -9,3 +20,61 @@ def add(a, b):
 def subtract(a, b):
     """返回两个数的差"""
     return a - b
+
+
+# ============================================
+#     批量版本：一次调用处理整段序列
+# ============================================
+# 在 Python 循环里逐个调用 add(a, b)，每个元素都要付出一次函数调用的开销。
+# 下面的批量函数把整段数据一次性交给 C 层去做：
+# * numpy 数组 -> 直接用 np.add / np.subtract (ufunc)，真正的向量化。
+# * array.array / list / tuple -> 用 map(operator.add, a, b)，循环在 C 里完成。
+# * out= 参数：把结果分块写进调用者提供的缓冲区，不再分配和数据一样大的结果序列。
+# * b 也可以是一个单独的数字 (int、float、Decimal、Fraction、complex……)，相当于把它“广播”到每个元素上。
+# 注意：没有 numpy 时，批量版本只是省掉了 Python 层的函数调用，每个结果仍然要创建一个数字对象，
+# 速度和逐个调用差不多 (约 1 倍)；它省下的主要是 out= 带来的内存，真正的加速要靠 numpy。
+
+_OUT_CHUNK = 4096 # 写入 out 时每块的元素个数
+
+def _is_numpy(obj):
+    return np is not None and isinstance(obj, np.ndarray)
+
+def _batch(op, ufunc_name, a, b, out):
+    if _is_numpy(a) or _is_numpy(b) or _is_numpy(out):
+        return getattr(np, ufunc_name)(a, b, out=out)
+
+    if isinstance(b, numbers.Number):
+        b = repeat(b, len(a))
+    elif len(a) != len(b):
+        raise ValueError("两个序列的长度必须相同")
+
+    values = map(op, a, b)
+
+    if out is None:
+        # 结果类型跟随输入：array.array 进，array.array 出
+        if isinstance(a, array):
+            return array(a.typecode, values)
+        return list(values)
+
+    if len(out) < len(a):
+        raise ValueError("out 缓冲区的长度不够")
+    if isinstance(out, (array, list)):
+        # 分块写入：每次只在一个小的临时缓冲区里算 _OUT_CHUNK 个结果，再用切片赋值拷进 out，
+        # 循环和拷贝都在 C 里完成，临时内存与数据总量无关
+        n = len(a)
+        make_chunk = partial(array, out.typecode) if isinstance(out, array) else list
+        for start in range(0, n, _OUT_CHUNK):
+            stop = min(start + _OUT_CHUNK, n)
+            out[start:stop] = make_chunk(islice(values, stop - start))
+    else:
+        for i, value in enumerate(values):
+            out[i] = value
+    return out
+
+def add_batch(a, b, out=None):
+    """逐元素返回两个序列的和 (支持 list、array.array 和 numpy 数组；没有 numpy 时不比逐个调用 add 快)"""
+    return _batch(operator.add, "add", a, b, out)
+
+def subtract_batch(a, b, out=None):
+    """逐元素返回两个序列的差 (支持 list、array.array 和 numpy 数组；没有 numpy 时不比逐个调用 subtract 快)"""
+    return _batch(operator.sub, "subtract", a, b, out)
@@ -0,0 +1,61 @@
+# bench_import_time.py
+# 导入时间检查：用 python -X importtime 导入 my_app，解析输出，超出预算就失败 (退出码 1)。
+# 可以放进 CI 里，防止有人在 my_app/__init__.py 里加入很慢的导入。
+#
+# 用法：python bench_import_time.py [预算微秒数] [导入语句]
+#   python bench_import_time.py 20000
+#   python bench_import_time.py 20000 "from my_app import add"
+
+import os
+import subprocess
+import sys
+
+DEFAULT_BUDGET_US = 20_000
+DEFAULT_STATEMENT = "import my_app"
+RUNS = 5 # 取多次运行中的最小值，减少偶然波动
+
+def parse_importtime(stderr):
+    """
+    解析 -X importtime 的输出，返回 {模块名: (自身耗时us, 累计耗时us)}。
+    每行格式：import time:       self [us] |  cumulative | imported package
+    """
+    timings = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue # 表头行
+        self_us, cumulative_us = int(fields[0]), int(fields[1])
+        timings[fields[2].strip()] = (self_us, cumulative_us)
+    return timings
+
+def measure(statement):
+    # 在本目录下运行，保证导入的是这里的 my_app；-X importtime 的结果输出到 stderr
+    here = os.path.dirname(os.path.abspath(__file__))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=here, capture_output=True, text=True, check=True,
+    )
+    timings = parse_importtime(result.stderr)
+    my_app_modules = {name: t for name, t in timings.items() if name.split(".")[0] == "my_app"}
+    total_us = sum(self_us for self_us, _ in my_app_modules.values())
+    return total_us, my_app_modules
+
+if __name__ == "__main__":
+    budget_us = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BUDGET_US
+    statement = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_STATEMENT
+
+    runs = [measure(statement) for _ in range(RUNS)]
+    total_us, modules = min(runs, key=lambda run: run[0])
+
+    print(f"--- {statement!r} 的导入时间 (最好的 {RUNS} 次之一) ---")
+    for name, (self_us, cumulative_us) in modules.items():
+        print(f"  {name:<30} 自身 {self_us:>7} us  累计 {cumulative_us:>7} us")
+    print(f"  合计 {total_us} us，预算 {budget_us} us")
+    print("-" * 30)
+
+    if total_us > budget_us:
+        print(f"导入时间超出预算 {total_us - budget_us} us！")
+        sys.exit(1)
+    print("导入时间在预算之内。")
@@ -9,4 +9,8 @@ print(add(100, 200))
 
 # 方式二：导入模块
 from my_app.math import calculators
-print(calculators.add(5, 5))
\ No newline at end of file
+print(calculators.add(5, 5))
+
+# 方式三：直接从包导入 (my_app/__init__.py 会在第一次使用时才加载对应的子模块)
+from my_app import add, to_upper_case
+print(to_upper_case("lazy"), add(1, 2))
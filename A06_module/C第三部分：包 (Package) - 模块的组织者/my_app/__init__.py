@@ -0,0 +1,30 @@
+# my_app/__init__.py
+#
+# 懒加载 (PEP 562)：包被导入时不会立刻导入任何子模块。
+# 当有人第一次访问 my_app.add 或执行 from my_app import add 时，
+# Python 找不到这个名字，就会调用下面的模块级 __getattr__，此时才真正导入子模块。
+# 这样命令行工具启动时只为真正用到的功能付出导入时间。
+
+# 对外提供的名字 -> 它所在的子模块
+_LAZY_ATTRS = {
+    "add": "math.calculators",
+    "to_upper_case": "utils.string_helper",
+    "upper_case_stream": "utils.string_helper",
+    "upper_case_file": "utils.string_helper",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # 用内置的 __import__ 做相对导入 (level=1)：不需要额外导入 importlib，
+    # 而且和 import 语句走同一条路径，-X importtime 也能统计到它
+    module = __import__(module_name, globals(), None, [name], 1)
+    value = getattr(module, name)
+    globals()[name] = value # 缓存起来，下次访问不再经过 __getattr__
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,2 +1,73 @@
+import codecs
+import mmap
+import string
+
 def to_upper_case(text):
-    return text.upper()
\ No newline at end of file
+    return text.upper()
+
+
+# 流式大写转换：按固定大小的块处理文件 / 字节流，内存占用与文件大小无关。
+# * 纯 ASCII 的块：直接在原始字节上用 bytes.translate 查表转换 (C 实现，不解码成 str)；
+# * 含非 ASCII 字符的块：才解码成 str，用完整的 Unicode 规则 upper() 后再编码回去。
+#   用增量解码器 (incremental decoder)，所以被块边界切开的多字节字符也能正确处理。
+# ASCII 快速路径只对“兼容 ASCII”的编码有效 (0x00~0x7F 的字节就是 ASCII 字符本身)；
+# UTF-16 / UTF-32 等编码里这些字节只是某个字符的一半，必须始终走解码路径。
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+_ASCII_UPPER = bytes.maketrans(string.ascii_lowercase.encode(), string.ascii_uppercase.encode())
+
+# codecs.lookup(encoding).name 的规范名称
+_ASCII_COMPATIBLE = frozenset({
+    "utf-8", "ascii", "iso8859-1", "cp1252", "gbk", "gb2312", "gb18030", "big5", "shift_jis", "euc_jp", "euc_kr",
+})
+
+def _iter_chunks(source, chunk_size):
+    if hasattr(source, "readinto"):
+        # 文件 / 字节流：反复读进同一个 bytearray，不为每块新建缓冲区
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+        while True:
+            n = source.readinto(buffer)
+            if not n:
+                return
+            yield view[:n]
+    else:
+        # bytes / bytearray / mmap 等支持缓冲区协议的对象：按块切出零拷贝的视图
+        view = memoryview(source)
+        for start in range(0, len(view), chunk_size):
+            yield view[start:start + chunk_size]
+
+def iter_upper_chunks(source, chunk_size=DEFAULT_CHUNK_SIZE, encoding='utf-8'):
+    """逐块产出大写后的字节 (source 可以是二进制文件、字节流、bytes 或 mmap)"""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    encoder = codecs.getincrementalencoder(encoding)() # 带 BOM 的编码 (utf-16 / utf-32) 只在开头写一次 BOM
+    ascii_fast_path = codecs.lookup(encoding).name in _ASCII_COMPATIBLE
+    for view in _iter_chunks(source, chunk_size):
+        chunk = bytes(view) # translate / isascii 需要 bytes；这是块级别的拷贝，不是 str
+        pending = decoder.getstate()[0] # 上一块末尾被切开的半个字符
+        if ascii_fast_path and not pending and chunk.isascii():
+            yield chunk.translate(_ASCII_UPPER)
+        else:
+            yield encoder.encode(decoder.decode(chunk).upper())
+    tail = decoder.decode(b"", final=True) # 文件以不完整的字符结尾时会抛出 UnicodeDecodeError
+    tail = encoder.encode(tail.upper(), final=True)
+    if tail:
+        yield tail
+
+def upper_case_stream(source, destination, chunk_size=DEFAULT_CHUNK_SIZE, encoding='utf-8'):
+    """把 source 中的文本转换为大写后写入 destination (二进制模式)，返回写入的字节数"""
+    written = 0
+    for chunk in iter_upper_chunks(source, chunk_size, encoding):
+        written += destination.write(chunk)
+    return written
+
+def upper_case_file(src_path, dst_path, chunk_size=DEFAULT_CHUNK_SIZE, encoding='utf-8'):
+    """用内存映射 (mmap) 读取 src_path，把大写结果写到 dst_path，返回写入的字节数"""
+    with open(src_path, 'rb') as src, open(dst_path, 'wb') as dst:
+        try:
+            mapped = mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError: # 空文件无法映射
+            return 0
+        with mapped:
+            return upper_case_stream(mapped, dst, chunk_size, encoding)
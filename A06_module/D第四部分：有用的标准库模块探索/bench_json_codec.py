@@ -0,0 +1,55 @@
+# bench_json_codec.py
+# JSON 编码 / 解码吞吐量 (MB/s，按编码后的 JSON 文本大小计算)。
+#
+# 用法：python bench_json_codec.py [记录数]
+# 安装了 orjson 时两种后端各跑一遍。RecordCodec 要检查每条记录的字段：
+# 标准库后端下它只拼接值，比 json_codec.dumps 快；orjson 后端下编码和解码都交给 orjson，
+# 只多了检查字段这一步，所以比直接 dumps / loads 慢 (参考：编码 28 vs 50 MB/s，解码 25 vs 41 MB/s)。
+# 不需要检查字段时，直接用 dumps / loads / write_ndjson / iter_ndjson。
+
+import io
+import json
+import sys
+import time
+
+import json_codec
+from json_codec import RecordCodec
+
+def throughput(label, func, size_bytes):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<32} {size_bytes / 1024 / 1024 / elapsed:>8.1f} MB/s")
+
+def run(records, codec):
+    n = len(records)
+    print(f"--- {n} 条记录，后端: {json_codec.BACKEND} ---")
+
+    pretty = [json.dumps(r, indent=4) for r in records]
+    pretty_size = sum(len(s.encode()) for s in pretty)
+    compact = "".join(json_codec.dumps(r) + "\n" for r in records)
+    compact_size = len(compact.encode())
+    assert codec.encode_many(records) == compact, "RecordCodec 的输出与 dumps 不一致"
+    print(f"  输出大小：indent=4 {pretty_size / 1024 / 1024:.1f} MB，紧凑 {compact_size / 1024 / 1024:.1f} MB")
+
+    print("编码:")
+    throughput("json.dumps(indent=4)", lambda: [json.dumps(r, indent=4) for r in records], pretty_size)
+    throughput("json_codec.dumps (紧凑)", lambda: [json_codec.dumps(r) for r in records], compact_size)
+    throughput("RecordCodec.encode_many", lambda: codec.encode_many(records), compact_size)
+    throughput("write_ndjson (流式)", lambda: json_codec.write_ndjson(records, io.StringIO()), compact_size)
+
+    print("解码:")
+    throughput("json.loads (indent=4 文本)", lambda: [json.loads(s) for s in pretty], pretty_size)
+    lines = compact.splitlines()
+    throughput("json_codec.loads (逐行)", lambda: [json_codec.loads(s) for s in lines], compact_size)
+    throughput("RecordCodec.decode_many", lambda: codec.decode_many(compact), compact_size)
+    throughput("iter_ndjson (流式)", lambda: list(json_codec.iter_ndjson(io.StringIO(compact))), compact_size)
+    print("-" * 30)
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    records = [{"name": f"user{i}", "age": 20 + i % 60} for i in range(n)]
+    codec = RecordCodec(["name", "age"])
+    for backend in ("json", "orjson") if json_codec.orjson is not None else ("json",):
+        json_codec.set_backend(backend)
+        run(records, codec)
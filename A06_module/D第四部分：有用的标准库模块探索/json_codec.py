@@ -0,0 +1,177 @@
+# json_codec.py
+# 高吞吐的 JSON 编解码层。
+#
+# mian.py 里用 json.dumps(data, indent=4) 来演示 JSON，indent 让输出好看，
+# 但缩进和换行会让输出体积和序列化时间都差不多翻倍——机器之间传数据时根本不需要好看。
+#
+# 这里提供：
+# * dumps / loads：默认紧凑模式 (separators=(',', ':'))，pretty=True 才缩进；
+# * 可选的更快后端：安装了 orjson 就默认使用它，否则用标准库 json；set_backend() 可以切换；
+#   orjson 不支持的输入 (超过 64 位的整数等) 自动退回标准库；
+# * NDJSON (每行一个 JSON) 的流式编码 / 解码：一次只在内存里保留一小批记录；
+# * RecordCodec：对 {"name": ..., "age": ...} 这种固定结构的记录检查字段、按固定顺序输出；
+#   标准库后端下预先生成键的片段，编码时只拼接值 (比 json.dumps 快)。
+#
+# 两种后端尽量保持一致：
+# * 都只读写标准 JSON：loads 拒绝 NaN / Infinity；datetime、date 等非 JSON 类型都报 TypeError
+#   (orjson 本来会把 datetime 写成字符串，这里关掉了)；
+# 仍然不同的地方：
+# * NaN / inf：orjson 写成 null，标准库后端报 ValueError；
+# * 浮点数的写法：1e16 在 orjson 里是 1e16，标准库是 1e+16 (读回来是同一个数)；
+# * 枚举 (Enum)、UUID 只有 orjson 能编码，标准库后端报 TypeError。
+
+import json
+from json.encoder import encode_basestring # C 实现的字符串转义 (不转义非 ASCII)
+
+try:
+    import orjson # 可选依赖：pip install orjson
+except ImportError:
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+_backend = orjson # 当前使用的 orjson 模块，None 表示用标准库
+
+_COMPACT = (',', ':')
+if orjson is not None:
+    # OPT_NON_STR_KEYS：和标准库一样把 {1: 2} 的键转成字符串 "1"；
+    # PASSTHROUGH：datetime、dataclass、str/int 的子类交给标准库处理 (和标准库后端一样报错或按基类编码)
+    _ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+                       | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_SUBCLASS)
+
+def set_backend(name):
+    """
+    切换后端 ("orjson" 或 "json")，例如在测试里分别检查两种后端。
+
+    Returns:
+        str: 切换之前的后端名字。
+    """
+    global BACKEND, _backend
+    if name not in ("orjson", "json"):
+        raise ValueError(f"未知的后端: {name}")
+    if name == "orjson" and orjson is None:
+        raise ValueError("没有安装 orjson")
+    previous = BACKEND
+    BACKEND = name
+    _backend = orjson if name == "orjson" else None
+    return previous
+
+def _reject_constant(name):
+    raise ValueError(f"不是标准 JSON: {name}")
+
+# 带非默认参数调用 json.dumps / json.loads 每次都会新建编码器 / 解码器，这里各建一个重复使用
+_ENCODER = json.JSONEncoder(separators=_COMPACT, ensure_ascii=False, allow_nan=False)
+_PRETTY_ENCODER = json.JSONEncoder(indent=4, ensure_ascii=False, allow_nan=False)
+_DECODER = json.JSONDecoder(parse_constant=_reject_constant)
+
+def dumps(obj, pretty=False):
+    """把对象编码为 JSON 字符串，默认紧凑输出"""
+    if pretty:
+        return _PRETTY_ENCODER.encode(obj)
+    if _backend is not None:
+        try:
+            return _backend.dumps(obj, option=_ORJSON_OPTIONS).decode('utf-8')
+        except TypeError: # orjson 不支持的类型或超大整数，交给标准库
+            pass
+    return _ENCODER.encode(obj)
+
+def loads(text):
+    """把 JSON 字符串 (或 bytes) 解码为对象"""
+    if _backend is not None:
+        return _backend.loads(text)
+    if not isinstance(text, str):
+        text = bytes(text).decode(json.detect_encoding(text))
+    return _DECODER.decode(text)
+
+
+# ---------- NDJSON 流式编解码 ----------
+
+def write_ndjson(records, fp, batch_size=1000):
+    """
+    把记录逐行写入文本文件 fp，每攒够 batch_size 行写一次。
+
+    Returns:
+        int: 写入的记录数。
+    """
+    batch = []
+    count = 0
+    for record in records:
+        batch.append(dumps(record))
+        if len(batch) >= batch_size:
+            fp.write("\n".join(batch) + "\n")
+            count += len(batch)
+            batch.clear()
+    if batch:
+        fp.write("\n".join(batch) + "\n")
+        count += len(batch)
+    return count
+
+def iter_ndjson(fp):
+    """从文本文件 fp 中逐行读出记录 (生成器，内存占用只有一行)，空行会被跳过"""
+    for line in fp:
+        if line.strip():
+            yield loads(line)
+
+
+# ---------- 固定结构记录的快速路径 ----------
+
+def _encode_value(value):
+    # 常见类型直接拼接，其他类型交给通用编码器
+    if type(value) is str:
+        return encode_basestring(value)
+    if type(value) is int:
+        return int.__repr__(value)
+    return dumps(value)
+
+class RecordCodec:
+    """
+    固定字段的记录编解码器。
+
+    Args:
+        fields (list of str): 每条记录的字段名，按输出顺序排列。
+    """
+
+    def __init__(self, fields):
+        self.fields = tuple(fields)
+        self._field_set = frozenset(self.fields)
+        # 预先生成 '{"name":'、',"age":' 这样的片段，编码时不再处理键
+        self._prefixes = [
+            ('{' if i == 0 else ',') + encode_basestring(name) + ':'
+            for i, name in enumerate(self.fields)
+        ]
+
+    def _check(self, record):
+        if record.keys() != self._field_set:
+            raise ValueError(f"记录的字段应为 {self.fields}，实际为 {tuple(record)}")
+
+    def encode(self, record):
+        """编码一条记录，字段必须与 fields 完全一致，输出按 fields 的顺序"""
+        if _backend is not None:
+            # orjson 自己编码整个字典更快；键和顺序都对时 (最常见) 一次比较就完成了检查
+            if tuple(record) != self.fields:
+                self._check(record)
+                record = {name: record[name] for name in self.fields}
+            return dumps(record)
+        self._check(record)
+        parts = []
+        for prefix, name in zip(self._prefixes, self.fields):
+            parts.append(prefix)
+            parts.append(_encode_value(record[name]))
+        parts.append('}')
+        return ''.join(parts)
+
+    def decode(self, text):
+        """解码一条记录，并检查字段"""
+        record = loads(text)
+        self._check(record)
+        return record
+
+    def encode_many(self, records):
+        """编码多条记录，返回 NDJSON 文本"""
+        return "\n".join(map(self.encode, records)) + "\n"
+
+    def decode_many(self, text):
+        """解码 NDJSON 文本，每一行单独解析 (一行里只能有一条记录)，空行会被跳过"""
+        records = [loads(line) for line in text.splitlines() if line.strip()]
+        for record in records:
+            self._check(record)
+        return records
@@ -31,3 +31,5 @@ print(json_string)
 # JSON 字符串 -> 字典
 parsed_data = json.loads(json_string)
 print(parsed_data['name'])
+
+# 提示：indent 只适合给人看。程序之间传输或大批量保存数据时，请使用 json_codec.py 里的紧凑模式和 NDJSON 流式读写。
@@ -0,0 +1,105 @@
+# bench_fetcher.py
+# 在本机启动一个替身 HTTP 服务器，测量 Fetcher 在并发数 1 到 256 下的吞吐量，
+# 并对比 main.py 的写法 (每个 URL 单独 requests.get，读取完整的 response.text)。
+#
+# 用法：python bench_fetcher.py [请求数]
+# 替身服务器与客户端在同一个进程里，会互相争抢 GIL，所以测得的是相对值。
+# 每一轮都会检查结果：没有失败、前缀等于页面的前 150 个字符、顺序与输入一致，否则 assert 失败。
+
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from fetcher import Fetcher
+
+LATENCY = 0.01 # 模拟网络延迟 (秒)：真实请求大部分时间都在等待，并发的价值正在于此
+BODY = ("<html>" + "Python " * 20000 + "</html>").encode("utf-8") # 约 140KB 的页面
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1" # 支持 keep-alive，连接池才有意义
+    flaky_counter = 0
+
+    def do_GET(self):
+        time.sleep(LATENCY)
+        if self.path == "/flaky":
+            # 每两次请求失败一次，用来验证重试
+            StandInHandler.flaky_counter += 1
+            if StandInHandler.flaky_counter % 2:
+                self.send_response(503)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+        charset = "no-such-charset" if self.path == "/bad-charset" else "utf-8"
+        self.send_response(200)
+        self.send_header("Content-Type", f"text/html; charset={charset}")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        try:
+            self.wfile.write(BODY)
+        except (BrokenPipeError, ConnectionResetError):
+            pass # 客户端只读了前缀就断开了
+
+    def log_message(self, format, *args):
+        pass # 不打印访问日志
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Fetcher 只读前缀就丢弃连接，每个请求都要新建连接；默认的 listen 队列只有 5，
+    # 并发一高就会丢 SYN、等待重传，测到的就成了内核的重传超时而不是 Fetcher 的吞吐量
+    request_queue_size = 1024
+
+    def handle_error(self, request, client_address):
+        pass # 客户端提前断开连接时不打印异常
+
+def naive_fetch(url):
+    # 与 main.py 相同的写法
+    response = requests.get(url)
+    response.raise_for_status()
+    return response.text[:150]
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    server = StandInServer(("127.0.0.1", 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    urls = [f"{base}/page/{i}" for i in range(n)]
+
+    print(f"--- {n} 个请求，替身服务器 {base} ---")
+    expected_prefix = BODY[:150].decode("utf-8")
+    naive_urls = urls[:200]
+    start = time.perf_counter()
+    for url in naive_urls:
+        assert naive_fetch(url) == expected_prefix
+    print(f"  main.py 写法 (串行, {len(naive_urls)} 个)   "
+          f"{len(naive_urls) / (time.perf_counter() - start):>10,.0f} 请求/秒")
+
+    for workers in (1, 4, 16, 64, 256):
+        with Fetcher(max_workers=workers) as fetcher:
+            start = time.perf_counter()
+            results = fetcher.fetch_all(urls)
+            elapsed = time.perf_counter() - start
+        failed = sum(1 for r in results if r.error is not None)
+        print(f"  Fetcher 并发 {workers:<3}             {n / elapsed:>10,.0f} 请求/秒  失败 {failed}")
+        assert failed == 0, [r.error for r in results if r.error is not None][:3]
+        assert all(r.status_code == 200 and r.prefix == expected_prefix for r in results)
+        assert [r.url for r in results] == urls # 结果按输入顺序返回
+    print("-" * 30)
+
+    print("--- 重试：/flaky 每两次请求失败一次 ---")
+    with Fetcher(max_workers=1, backoff=0.01) as fetcher:
+        result = fetcher.fetch_all([f"{base}/flaky"] * 5)
+    succeeded = sum(1 for r in result if r.error is None)
+    print(f"  成功 {succeeded} / 5")
+    assert succeeded == 5
+    print("-" * 30)
+
+    print("--- 未知的 charset：按 utf-8 解码，不影响其他 URL ---")
+    with Fetcher(max_workers=2) as fetcher:
+        result = fetcher.fetch_all([f"{base}/bad-charset", urls[0]])
+    assert all(r.error is None and r.prefix == expected_prefix for r in result), result
+    print("  通过")
+    print("-" * 30)
+    server.shutdown()
@@ -9,4 +9,6 @@ try:
     print("成功获取 Python 官网内容！")
     print(f"内容的前150个字符: {response.text[:150]}")
 except requests.exceptions.RequestException as e:
-    print(f"请求失败: {e}")
\ No newline at end of file
+    print(f"请求失败: {e}")
+
+# 需要批量抓取很多 URL、只读取前缀时，请使用 fetcher.py 里的 Fetcher (连接池 + 并发 + 流式读取 + 重试)
@@ -0,0 +1,13 @@
+# ============================================
+#   app_errors.py：应用程序的自定义异常
+# ============================================
+# 和 A07_Exception.py 第四部分演示的两个类相同。A07_Exception.py 是一个演示脚本，
+# 导入它就会执行 input() 等演示代码，所以 validation.py 等模块从这里导入异常类。
+
+class MyAppError(Exception):
+    """应用程序的基准错误类"""
+    pass
+
+class ValidationError(MyAppError):
+    """数据验证相关的错误"""
+    pass
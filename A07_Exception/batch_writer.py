@@ -0,0 +1,178 @@
+# ============================================
+#   batch_writer.py：批量缓冲、保证清理的文件写入器
+# ============================================
+# A07_Exception.py 第 4 节用 try...finally 手动关闭文件，还要用 'f' in locals() 判断文件是否打开过。
+# 如果要写几百万条小记录，每条都 open / write / close 一次，时间几乎都花在系统调用上。
+#
+# BatchWriter 是一个上下文管理器 (with 语句)：
+# * 记录先攒在内存里，攒够 buffer_size 字节才拼接成一大块，一次 write 写出去；
+# * with 块结束时一定会写出剩余数据并关闭文件——即使块里抛出了异常，也不需要手写 finally；
+# * 可选的 fsync 策略：每写出 fsync_bytes 字节，或者距离上次 fsync 超过 fsync_interval 秒，就 fsync 一次；
+#   (计时在写入时检查，没有后台线程，所以写入路径上不需要加锁；空闲期间不会自动 fsync，close 时一定会)
+# * atomic=True 时先写到同目录的临时文件，成功结束后 fsync 再 os.replace 成目标文件：
+#   读者要么看到旧文件，要么看到完整的新文件；with 块里出错时删除临时文件，原文件保持不变。
+
+import os
+import stat
+import tempfile
+import time
+from itertools import islice
+
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+_MANY_CHUNK = 4096 # write_many 每次从可迭代对象中取出的记录数
+
+def _fsync_dir(directory):
+    # rename 之后目录本身也要 fsync，新的文件名才算落盘 (Windows 上不支持，跳过)
+    if hasattr(os, "O_DIRECTORY"):
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+class BatchWriter:
+    """
+    批量写入文本记录的上下文管理器。
+
+    Args:
+        path (str): 目标文件。
+        mode (str): 'w' 覆盖或 'a' 追加；atomic=True 时只能用 'w'。
+        buffer_size (int): 攒够这么多字节 (按字符数估算) 就写出一次。
+        fsync_bytes (int or None): 每写出这么多字节 fsync 一次。
+        fsync_interval (float or None): 距离上次 fsync 超过这么多秒，下一次写入时 fsync。
+        atomic (bool): 先写临时文件，成功后再原子地替换目标文件。
+        newline (str): 追加在每条记录后面的分隔符。
+    """
+
+    def __init__(self, path, mode='w', *, encoding='utf-8', buffer_size=DEFAULT_BUFFER_SIZE,
+                 fsync_bytes=None, fsync_interval=None, atomic=False, newline="\n"):
+        if mode not in ('w', 'a'):
+            raise ValueError("mode 只能是 'w' 或 'a'")
+        if atomic and mode != 'w':
+            raise ValueError("atomic 模式会替换整个文件，只能用 'w'")
+        self.path = os.path.abspath(path)
+        self._encoding = encoding
+        self._buffer_size = buffer_size
+        self._fsync_bytes = fsync_bytes
+        self._fsync_interval = fsync_interval
+        self._atomic = atomic
+        self._newline = newline
+        self._batch = []
+        self._batch_chars = 0
+        self._unsynced = 0 # 已写出但还没 fsync 的字节数
+        self._last_sync = time.monotonic()
+        self.stats = {"records": 0, "bytes": 0, "writes": 0, "fsyncs": 0}
+        if atomic:
+            fd, self._temp_path = tempfile.mkstemp(dir=os.path.dirname(self.path), prefix=".tmp-")
+            self._file = os.fdopen(fd, 'wb', buffering=0)
+        else:
+            self._temp_path = None
+            self._file = open(self.path, mode + 'b', buffering=0) # 自己做缓冲，不需要再套一层
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False # 不吞掉异常
+
+    # ---------- 写入 ----------
+
+    def write(self, record):
+        """写入一条记录 (自动加上 newline)"""
+        self._batch.append(record)
+        self._batch_chars += len(record) + len(self._newline)
+        if self._batch_chars >= self._buffer_size:
+            self.flush()
+        elif self._fsync_interval is not None and time.monotonic() - self._last_sync >= self._fsync_interval:
+            self.flush()
+
+    def write_many(self, records):
+        """写入多条记录：每次取出一批，用 extend 和 sum(map(len, ...)) 在 C 里处理，没有逐条的方法调用"""
+        iterator = iter(records)
+        newline_size = len(self._newline)
+        while True:
+            chunk = list(islice(iterator, _MANY_CHUNK))
+            if not chunk:
+                return
+            self._batch.extend(chunk)
+            self._batch_chars += sum(map(len, chunk)) + newline_size * len(chunk)
+            if self._batch_chars >= self._buffer_size:
+                self.flush()
+            elif self._fsync_interval is not None and time.monotonic() - self._last_sync >= self._fsync_interval:
+                self.flush()
+
+    def flush(self):
+        """把攒下的记录写给操作系统，并按 fsync 策略决定是否 fsync"""
+        if self._batch:
+            self._batch.append("") # 让 join 在最后一条记录后面也加上 newline
+            data = self._newline.join(self._batch).encode(self._encoding)
+            self.stats["records"] += len(self._batch) - 1
+            self._batch.clear()
+            self._batch_chars = 0
+            view = memoryview(data)
+            while view: # 原始文件的 write 可能只写出一部分
+                written = self._file.write(view)
+                view = view[written:]
+            self.stats["bytes"] += len(data)
+            self.stats["writes"] += 1
+            self._unsynced += len(data)
+        if self._unsynced and (
+            (self._fsync_bytes is not None and self._unsynced >= self._fsync_bytes)
+            or (self._fsync_interval is not None and time.monotonic() - self._last_sync >= self._fsync_interval)
+        ):
+            self.sync()
+
+    def sync(self):
+        """立即把已写出的数据 fsync 到磁盘"""
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self.stats["fsyncs"] += 1
+
+    # ---------- 结束 ----------
+
+    @property
+    def closed(self):
+        return self._file.closed
+
+    def close(self):
+        """写出剩余记录并关闭文件；atomic 模式下在这里替换目标文件"""
+        if self._file.closed:
+            return
+        try:
+            self.flush()
+            if self._atomic or self._fsync_bytes is not None or self._fsync_interval is not None:
+                self.sync()
+        except BaseException:
+            self.abort()
+            raise
+        self._file.close()
+        if self._atomic:
+            # mkstemp 创建的文件只有本人可读写：沿用原文件的权限，没有原文件就用 0o644
+            try:
+                file_mode = stat.S_IMODE(os.stat(self.path).st_mode)
+            except FileNotFoundError:
+                file_mode = 0o644
+            os.chmod(self._temp_path, file_mode)
+            os.replace(self._temp_path, self.path)
+            _fsync_dir(os.path.dirname(self.path))
+
+    def abort(self):
+        """
+        出错时的清理：atomic 模式丢弃临时文件 (目标文件保持原样)；
+        普通模式尽量写出已经攒下的记录，再关闭文件。
+        """
+        if self._file.closed:
+            return
+        try:
+            if not self._atomic:
+                self.flush()
+        finally:
+            self._file.close()
+            if self._atomic:
+                os.unlink(self._temp_path)
@@ -0,0 +1,72 @@
+# bench_validation.py
+# 对比“逐行调用单值校验 + try...except”与整列校验 validate_users 在不同无效比例下的耗时。
+#
+# 用法：python bench_validation.py [行数]
+#   默认 10**6 行；无效比例 0%、10%、50%，无效行一半是用户名太短，一半是年龄不合法
+#   (年龄里再分一半类型错误、一半超出范围)。
+
+import random
+import sys
+import time
+
+from app_errors import ValidationError
+from validation import validate_users
+
+# ---------- 与 A07_Exception.py 相同的单值校验 (去掉了 print；导入 A07_Exception.py 会运行整个演示) ----------
+def set_age(age):
+    if not isinstance(age, int):
+        raise TypeError("年龄必须是整数。")
+    if age < 0 or age > 120:
+        raise ValueError("年龄必须在 0 到 120 之间。")
+
+def register_user(username):
+    if len(username) < 3:
+        raise ValidationError("用户名长度不能少于3个字符！")
+
+def make_rows(n, invalid_rate, rng):
+    usernames = [f"user{i}" for i in range(n)]
+    ages = [rng.randint(0, 120) for _ in range(n)]
+    for row in rng.sample(range(n), int(n * invalid_rate)):
+        choice = rng.random()
+        if choice < 0.5:
+            usernames[row] = "Al"
+        elif choice < 0.75:
+            ages[row] = "abc"
+        else:
+            ages[row] = 200
+    return usernames, ages
+
+def per_row(usernames, ages):
+    # A07_Exception.py 的方式：每行调用一次，出错靠异常
+    errors = []
+    for row, (username, age) in enumerate(zip(usernames, ages)):
+        try:
+            register_user(username)
+        except ValidationError as e:
+            errors.append((row, "username", e))
+        try:
+            set_age(age)
+        except (TypeError, ValueError) as e:
+            errors.append((row, "age", e))
+    return errors
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    rng = random.Random(42)
+    print(f"{n} 行\n")
+    print(f"{'无效比例':<8}{'逐行 + 异常':>14}{'整列校验':>14}{'加速':>8}   错误数")
+    for rate in (0.0, 0.1, 0.5):
+        usernames, ages = make_rows(n, rate, rng)
+        errors, t_row = timed(per_row, usernames, ages)
+        report, t_bulk = timed(validate_users, usernames, ages)
+        assert len(errors) == report.error_count
+        print(f"{rate:<12.0%}{t_row * 1000:>11.0f} ms{t_bulk * 1000:>11.0f} ms{t_row / t_bulk:>7.1f}x"
+              f"   {report.error_count}")
+
+if __name__ == "__main__":
+    main()
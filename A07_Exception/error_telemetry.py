@@ -0,0 +1,180 @@
+# ============================================
+#   error_telemetry.py：自定义异常的低开销统计
+# ============================================
+# A07_Exception.py 里的 MyAppError / ValidationError 只是普通的异常类，
+# 没有任何地方记录它们被抛出了多少次、是在哪里抛出的。
+#
+# ErrorTelemetry.instrument(MyAppError) 会包装这个类 (及其子类) 的 __init__：
+# * 每创建一个异常对象，就按 (异常类, 调用位置) 计数——调用位置就是写 raise XxxError(...) 的那一行；
+#   (Python 3.11 没有“抛出”事件的低开销钩子，所以在创建时计数：raise 的几乎总是刚创建的异常)
+# * 计数器是“每个线程一份”的字典 (threading.local)，计数时不需要加锁；
+#   读取时 (snapshot) 再把所有线程的字典合并起来；
+# * 只有按 sample_rate 抽中的那一次才会保存完整的调用栈，sample_rate=0 时完全不做这件事；
+# * snapshot() 返回字典，prometheus_text() 返回 Prometheus 文本格式，方便接入监控系统。
+
+import os
+import random
+import sys
+import threading
+import traceback
+from collections import deque
+
+class ErrorTelemetry:
+    """
+    异常计数器。
+
+    Args:
+        sample_rate (float): 0~1，保存调用栈的抽样比例；0 表示不抽样。
+        max_samples (int): 最多保留的调用栈样本个数 (只保留最新的)。
+        metric_name (str): prometheus_text() 中使用的指标名。
+    """
+
+    def __init__(self, sample_rate=0.0, max_samples=100, metric_name="app_exceptions_total"):
+        self.sample_rate = sample_rate
+        self.metric_name = metric_name
+        self._local = threading.local()
+        self._thread_counts = [] # 所有线程的计数字典 (线程结束后仍然保留，计数不会丢失)
+        self._samples = deque(maxlen=max_samples)
+        self._lock = threading.Lock() # 只在线程第一次计数、抽样和读取时使用
+        self._instrumented = {} # 类 -> 原来的 __init__
+
+    def _new_thread_counts(self):
+        counts = self._local.counts = {}
+        with self._lock:
+            self._thread_counts.append(counts)
+        return counts
+
+    # ---------- 安装 / 卸载 ----------
+
+    def instrument(self, cls):
+        """包装 cls.__init__ (子类继承后同样会被统计)，返回 cls，因此也可以当作类装饰器使用"""
+        if cls in self._instrumented:
+            return cls
+        original = cls.__init__
+        # 内置的 BaseException.__init__ 只是再保存一次 args，而 __new__ 已经保存过了，可以不调用
+        call_original = original not in _BUILTIN_INITS
+        local = self._local
+        getframe = sys._getframe
+        new_thread_counts = self._new_thread_counts
+        telemetry = self
+
+        def __init__(exc, *args, **kwargs):
+            # 热路径：不加锁、不格式化字符串，行号等到读取时才由 f_lasti (字节码偏移) 换算
+            frame = getframe(1) # 创建异常的那一帧，即 raise 所在的位置
+            code = frame.f_code
+            if code.co_name == "__init__":
+                frame = _skip_init_frames(frame, exc) # 子类自己的 __init__ 调用了 super().__init__()
+                code = frame.f_code
+            key = (exc.__class__, code, frame.f_lasti)
+            try:
+                counts = local.counts
+            except AttributeError:
+                counts = new_thread_counts()
+            counts[key] = counts.get(key, 0) + 1
+            if telemetry.sample_rate and random.random() < telemetry.sample_rate:
+                telemetry._sample(exc, args, frame)
+            if call_original:
+                original(exc, *args, **kwargs)
+            elif kwargs:
+                raise TypeError(f"{type(exc).__name__}() 不接受关键字参数")
+
+        self._instrumented[cls] = original
+        cls.__init__ = __init__
+        return cls
+
+    def uninstrument(self, cls):
+        """恢复 cls 原来的 __init__"""
+        original = self._instrumented.pop(cls, None)
+        if original is not None:
+            cls.__init__ = original
+
+    def _sample(self, exc, args, frame):
+        sample = {
+            "class": type(exc).__name__,
+            "message": str(args[0]) if args else "",
+            "thread": threading.current_thread().name,
+            "stack": "".join(traceback.format_stack(frame)),
+        }
+        with self._lock:
+            self._samples.append(sample)
+
+    # ---------- 读取 ----------
+
+    def _merged_counts(self):
+        with self._lock:
+            thread_counts = list(self._thread_counts)
+        merged = {}
+        for counts in thread_counts:
+            # dict.copy() 在 C 里一次完成，别的线程同时计数也不会导致“迭代时字典大小改变”的错误
+            for key, n in counts.copy().items():
+                merged[key] = merged.get(key, 0) + n
+        return merged
+
+    def snapshot(self):
+        """
+        当前的统计快照。
+
+        Returns:
+            dict: {"counts": [{"class", "site", "function", "count"}, ...] (按次数从多到少),
+                   "total": 总次数, "samples": [调用栈样本, ...]}
+        """
+        by_site = {}
+        for (cls, code, lasti), n in self._merged_counts().items():
+            key = (cls.__name__, f"{os.path.basename(code.co_filename)}:{_line_of(code, lasti)}", code.co_name)
+            by_site[key] = by_site.get(key, 0) + n
+        counts = [
+            {"class": name, "site": site, "function": function, "count": n}
+            for (name, site, function), n in by_site.items()
+        ]
+        counts.sort(key=lambda item: item["count"], reverse=True)
+        with self._lock:
+            samples = list(self._samples)
+        return {"counts": counts, "total": sum(item["count"] for item in counts), "samples": samples}
+
+    def prometheus_text(self):
+        """Prometheus 文本格式 (exposition format) 的计数器"""
+        lines = [
+            f"# HELP {self.metric_name} Number of application exceptions created, by class and call site.",
+            f"# TYPE {self.metric_name} counter",
+        ]
+        for item in self.snapshot()["counts"]:
+            labels = ",".join(
+                f'{label}="{_escape_label(item[label])}"' for label in ("class", "site", "function")
+            )
+            lines.append(f"{self.metric_name}{{{labels}}} {item['count']}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        """清空所有线程的计数和样本"""
+        with self._lock:
+            for counts in self._thread_counts:
+                counts.clear()
+            self._samples.clear()
+
+
+_BUILTIN_INITS = (BaseException.__init__, Exception.__init__)
+
+def _line_of(code, lasti):
+    # 字节码偏移 -> 行号 (每条指令 2 字节，co_positions() 按指令顺序给出位置)
+    for index, (line, *_) in enumerate(code.co_positions()):
+        if index == lasti // 2:
+            return line
+    return code.co_firstlineno
+
+def _skip_init_frames(frame, exc):
+    while frame.f_code.co_name == "__init__" and frame.f_back is not None and frame.f_locals.get("self") is exc:
+        frame = frame.f_back
+    return frame
+
+def _escape_label(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+telemetry = ErrorTelemetry()
+
+def install(sample_rate=0.0):
+    """统计 app_errors.MyAppError 及其所有子类，返回全局的 telemetry 对象"""
+    from app_errors import MyAppError
+    telemetry.sample_rate = sample_rate
+    telemetry.instrument(MyAppError)
+    return telemetry
@@ -0,0 +1,172 @@
+# ============================================
+#   validation.py：单值校验与整列批量校验
+# ============================================
+# A07_Exception.py 里的 set_age / register_user 一次只检查一个值，出错就 raise。
+# 批量导入时如果逐行调用，再用 try...except 接住，每个无效行都要付出“创建异常对象 + 展开调用栈”的代价，
+# 无效数据占比一高就非常慢。
+#
+# 单个值仍然用 A07_Exception.py 里的 set_age / register_user 校验 (这里不再复制一份)；
+# 这里提供的是整列校验，错误代码和提示信息与它们一致：
+# * 成功路径几乎零成本：先用 all(map(isinstance, ...))、min()、max() 这些 C 实现的函数检查整列，
+#   全部合法就直接返回，不做任何逐行处理；
+# * 只有发现问题时才逐类找出出错的行号，同样借助 map / compress 在 C 里完成，整个过程不抛出任何异常；
+# * 出错的行号按 (列名, 错误代码) 存进 array('I')，组成紧凑的 ValidationReport，
+#   需要时再把某一行的错误还原成原来的异常对象 (TypeError / ValueError / ValidationError)。
+
+import operator
+from array import array
+from itertools import compress, count, repeat
+
+from app_errors import ValidationError
+
+AGE_MIN, AGE_MAX = 0, 120
+USERNAME_MIN_LENGTH = 3
+
+# 错误代码 -> (异常类型, 提示信息)，与 set_age / register_user 抛出的异常保持一致
+ERRORS = {
+    "age_type": (TypeError, "年龄必须是整数。"),
+    "age_range": (ValueError, f"年龄必须在 {AGE_MIN} 到 {AGE_MAX} 之间。"),
+    "username_type": (ValidationError, "用户名必须是字符串！"), # register_user 没有这项检查 (会在 len() 处报 TypeError)
+    "username_short": (ValidationError, f"用户名长度不能少于{USERNAME_MIN_LENGTH}个字符！"),
+}
+
+# ---------- 整列校验：收集错误，不抛出异常 ----------
+
+class ValidationReport:
+    """
+    整列校验的结果：只记录出错的行号，按 (列名, 错误代码) 分组存放。
+
+    Args:
+        rows (int): 参与校验的总行数。
+    """
+
+    def __init__(self, rows):
+        self.rows = rows
+        self._errors = {} # (列名, 错误代码) -> array('I') 行号
+
+    def add(self, column, code, row_numbers):
+        if len(row_numbers):
+            self._errors.setdefault((column, code), array('I')).extend(row_numbers)
+
+    @property
+    def ok(self):
+        return not self._errors
+
+    @property
+    def error_count(self):
+        return sum(map(len, self._errors.values()))
+
+    def counts(self):
+        """每种错误的个数，如 {("age", "age_range"): 12}"""
+        return {key: len(rows) for key, rows in self._errors.items()}
+
+    def invalid_rows(self):
+        """所有出错的行号 (去重、升序)"""
+        rows = set()
+        for row_numbers in self._errors.values():
+            rows.update(row_numbers)
+        return sorted(rows)
+
+    def valid_mask(self):
+        """每行是否合法的 bytearray (1 合法 / 0 出错)，可以配合 itertools.compress 过滤数据"""
+        mask = bytearray(b"\x01") * self.rows
+        for row_numbers in self._errors.values():
+            for row in row_numbers:
+                mask[row] = 0
+        return mask
+
+    def errors(self, limit=None):
+        """
+        逐个产出 (行号, 列名, 异常对象)，按行号排序。
+        异常对象只是被创建出来、并没有被 raise，类型与 set_age / register_user 相同。
+        """
+        items = sorted(
+            (row, column, code)
+            for (column, code), row_numbers in self._errors.items()
+            for row in row_numbers
+        )
+        for row, column, code in items[:limit]:
+            exc_type, message = ERRORS[code]
+            yield row, column, exc_type(message)
+
+    def raise_first(self):
+        """有错误时，按原来的异常类型抛出行号最小的那个错误"""
+        for row, column, exc in self.errors(limit=1):
+            raise exc
+
+    def __str__(self):
+        if self.ok:
+            return f"{self.rows} 行全部通过校验"
+        details = "，".join(f"{column}/{code}: {n}" for (column, code), n in self.counts().items())
+        return f"{self.rows} 行中有 {self.error_count} 个错误 ({details})"
+
+    def __repr__(self):
+        return f"<ValidationReport {self}>"
+
+
+def _rows_where(flags, value=1):
+    # 取值等于 value 的行号：bytes(flags) 在 C 里一次性转换，再用 bytes.find 跳着找，只在出错的行上循环
+    data = bytes(flags)
+    target = bytes([value])
+    rows = array('I')
+    find = data.find
+    pos = find(target)
+    while pos != -1:
+        rows.append(pos)
+        pos = find(target, pos + 1)
+    return rows
+
+def _out_of_range(ages):
+    # int.__gt__ 遇到非整数会返回 NotImplemented 而不是抛出异常，所以只把结果恰好为 True 的算作越界；
+    # 这样即使列里混有字符串、浮点数，也能在一次 C 层的遍历里完成
+    too_small = map(operator.is_, map(AGE_MIN.__gt__, ages), repeat(True))
+    too_large = map(operator.is_, map(AGE_MAX.__lt__, ages), repeat(True))
+    return map(operator.or_, too_small, too_large)
+
+def validate_ages(ages, report=None, column="age"):
+    """
+    整列校验年龄。
+
+    Returns:
+        ValidationReport
+    """
+    report = report if report is not None else ValidationReport(len(ages))
+    if (isinstance(ages, array) and ages.typecode in "bBhHiIlLqQ") or all(map(isinstance, ages, repeat(int))):
+        # 快速路径：类型全部合法 (整数数组不用检查)，只看最小值和最大值
+        if not len(ages) or (min(ages) >= AGE_MIN and max(ages) <= AGE_MAX):
+            return report
+    else:
+        report.add(column, "age_type", _rows_where(map(isinstance, ages, repeat(int)), 0))
+    report.add(column, "age_range", _rows_where(_out_of_range(ages)))
+    return report
+
+def validate_usernames(usernames, report=None, column="username"):
+    """
+    整列校验用户名。
+
+    Returns:
+        ValidationReport
+    """
+    report = report if report is not None else ValidationReport(len(usernames))
+    if all(map(isinstance, usernames, repeat(str))):
+        if not len(usernames) or min(map(len, usernames)) >= USERNAME_MIN_LENGTH:
+            return report # 快速路径
+        report.add(column, "username_short", _rows_where(map(USERNAME_MIN_LENGTH.__gt__, map(len, usernames))))
+        return report
+    type_ok = list(map(isinstance, usernames, repeat(str)))
+    report.add(column, "username_type", _rows_where(type_ok, 0))
+    rows = array('I', compress(count(), type_ok))
+    short = _rows_where(map(USERNAME_MIN_LENGTH.__gt__, map(len, compress(usernames, type_ok))))
+    report.add(column, "username_short", array('I', map(rows.__getitem__, short)))
+    return report
+
+def validate_users(usernames, ages):
+    """
+    同时校验用户名列和年龄列 (两列长度必须相同)，返回一份合并的 ValidationReport。
+    """
+    if len(usernames) != len(ages):
+        raise ValueError("用户名列和年龄列的长度必须相同")
+    report = ValidationReport(len(ages))
+    validate_usernames(usernames, report)
+    validate_ages(ages, report)
+    return report
@@ -0,0 +1,71 @@
+# ============================================
+#   animal_dispatch.py：批量版 make_animal_speak
+# ============================================
+# A08_class.py 里的 make_animal_speak(animal_object) 一次只处理一个对象：
+# 每次调用都要按 MRO 查找一遍 .speak，再单独 print 一次。
+# 对一大堆不同类型的动物来说，真正不同的类型只有寥寥几种，重复查找方法和逐行 print 都是浪费。
+#
+# 这里的做法：
+# 1. 按具体类型 (type(obj)) 把对象分组；
+# 2. 每种类型只解析一次方法 (在类的 MRO 里找到那个函数)，再用 map() 在 C 层对整组调用；
+# 3. 按原来的顺序把结果拼成一个字符串，只写一次输出。
+# 多态并没有丢：方法仍然是按每个对象的实际类型解析的，只是同一类型共用一次解析结果。
+# 只有“类里定义的普通函数、并且没有被实例属性覆盖”时才能这样共用；staticmethod、classmethod、
+# property、自定义 __getattribute__ 或实例上另外赋值的同名属性，都退回逐个 getattr(obj, name)() 的写法。
+
+import operator
+import sys
+from itertools import repeat
+from operator import methodcaller
+from types import FunctionType
+
+def group_by_type(objects):
+    """按具体类型分组，返回 {类型: (下标列表, 对象列表)}"""
+    groups = {}
+    for index, obj in enumerate(objects):
+        group = groups.get(type(obj))
+        if group is None:
+            group = groups[type(obj)] = ([], [])
+        group[0].append(index)
+        group[1].append(obj)
+    return groups
+
+def _shared_function(cls, members, method_name):
+    """
+    这一组对象能共用的普通函数 (调用时把对象作为 self 传入)；不能安全共用时返回 None。
+    """
+    if cls.__getattribute__ is not object.__getattribute__:
+        return None
+    for klass in cls.__mro__:
+        if method_name in klass.__dict__:
+            function = klass.__dict__[method_name]
+            break
+    else:
+        return None
+    if type(function) is not FunctionType: # staticmethod、classmethod、property 等描述符
+        return None
+    if cls.__dictoffset__ and any(map(operator.contains, map(vars, members), repeat(method_name))):
+        return None # 有实例在自己的 __dict__ 里覆盖了这个方法
+    return function
+
+def call_all(objects, method_name):
+    """对每个对象调用同名方法，每种类型只解析一次方法，结果按输入顺序返回"""
+    objects = list(objects)
+    results = [None] * len(objects)
+    for cls, (indices, members) in group_by_type(objects).items():
+        method = _shared_function(cls, members, method_name) or methodcaller(method_name)
+        for index, value in zip(indices, map(method, members)):
+            results[index] = value
+    return results
+
+def speak_all(animals):
+    """返回所有动物 speak() 的结果列表"""
+    return call_all(animals, "speak")
+
+def make_animals_speak(animals, file=None):
+    """make_animal_speak 的批量版：所有输出拼好后一次性写出"""
+    lines = speak_all(animals)
+    if not lines:
+        return
+    out = sys.stdout if file is None else file
+    out.write("\n".join(map(str, lines)) + "\n") # 和 print() 一样，speak() 返回的不是字符串时也能输出
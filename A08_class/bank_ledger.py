@@ -0,0 +1,125 @@
+# ============================================
+#   bank_ledger.py：线程安全的批量记账引擎
+# ============================================
+# A08_class.py 里的 BankAccount 用来讲“封装”：余额藏在 __balance 里，deposit() 每次都 print。
+# 但它没有任何并发控制——多个线程同时执行 self.__balance += amount 时，
+# “读出余额 -> 加上金额 -> 写回”这三步可能交错，导致存款丢失。
+#
+# Ledger 的做法：
+# * 锁分段 (lock striping)：账户按编号分到 N 个分段 (shard)，每个分段一把锁、一个余额字典。
+#   只有落在同一个分段的操作才会互相等待，而不是所有线程抢一把全局锁；
+# * deposit_batch()：一批存款要么全部成功，要么一个都不生效 (原子性)。
+#   按分段编号从小到大加锁，保证多个批次之间不会死锁；
+# * 不再 print：传入 on_event 回调，就会收到结构化的事件字典，由调用者决定记日志还是统计。
+
+import threading
+from itertools import count
+
+DEFAULT_STRIPES = 64
+
+class _Shard:
+    __slots__ = ("lock", "balances", "owners")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.balances = {} # 账户编号 -> 余额
+        self.owners = {}   # 账户编号 -> 户主
+
+
+class Ledger:
+    """管理大量账户的线程安全账本"""
+
+    def __init__(self, stripes=DEFAULT_STRIPES, on_event=None):
+        if stripes < 1:
+            raise ValueError("stripes 必须大于0！")
+        self._shards = [_Shard() for _ in range(stripes)]
+        self._ids = count() # itertools.count 的 next() 在 CPython 中是原子的
+        self.on_event = on_event
+
+    def _shard_index(self, account_id):
+        return account_id % len(self._shards)
+
+    def _emit(self, event, **fields):
+        if self.on_event is not None:
+            self.on_event({"event": event, **fields})
+
+    def open_account(self, owner, balance=0):
+        """开户，返回账户编号"""
+        account_id = next(self._ids)
+        shard = self._shards[self._shard_index(account_id)]
+        with shard.lock:
+            shard.balances[account_id] = balance
+            shard.owners[account_id] = owner
+        self._emit("open", account=account_id, owner=owner, balance=balance)
+        return account_id
+
+    def deposit(self, account_id, amount):
+        """给一个账户存款，返回新的余额"""
+        if amount <= 0:
+            raise ValueError("存款金额必须大于0！")
+        shard = self._shards[self._shard_index(account_id)]
+        with shard.lock:
+            if account_id not in shard.balances:
+                raise KeyError(f"账户 {account_id} 不存在")
+            balance = shard.balances[account_id] + amount
+            shard.balances[account_id] = balance
+        self._emit("deposit", account=account_id, amount=amount, balance=balance)
+        return balance
+
+    def deposit_batch(self, deposits):
+        """
+        原子地执行一批存款。
+
+        Args:
+            deposits: (账户编号, 金额) 的可迭代对象。
+
+        Returns:
+            int: 成功执行的存款笔数。
+        """
+        # 1. 先在锁外做参数检查，并按分段分组
+        by_shard = {}
+        for account_id, amount in deposits:
+            if amount <= 0:
+                raise ValueError(f"存款金额必须大于0！(账户 {account_id}: {amount})")
+            by_shard.setdefault(self._shard_index(account_id), []).append((account_id, amount))
+        if not by_shard:
+            return 0
+
+        # 2. 按分段编号从小到大加锁，避免两个批次互相等待造成死锁
+        locked = [self._shards[i] for i in sorted(by_shard)]
+        for shard in locked:
+            shard.lock.acquire()
+        try:
+            # 3. 先检查所有账户都存在，再统一修改，保证“全有或全无”
+            for index, items in by_shard.items():
+                balances = self._shards[index].balances
+                for account_id, _ in items:
+                    if account_id not in balances:
+                        raise KeyError(f"账户 {account_id} 不存在")
+            total = 0
+            applied = 0
+            for index, items in by_shard.items():
+                balances = self._shards[index].balances
+                for account_id, amount in items:
+                    balances[account_id] += amount
+                    total += amount
+                    applied += 1
+        finally:
+            for shard in reversed(locked):
+                shard.lock.release()
+
+        self._emit("deposit_batch", count=applied, total=total)
+        return applied
+
+    def get_balance(self, account_id):
+        """获取账户余额"""
+        shard = self._shards[self._shard_index(account_id)]
+        with shard.lock:
+            return shard.balances[account_id]
+
+    def get_owner(self, account_id):
+        """获取户主"""
+        return self._shards[self._shard_index(account_id)].owners[account_id]
+
+    def __len__(self):
+        return sum(len(shard.balances) for shard in self._shards)
@@ -0,0 +1,284 @@
+# ============================================
+#   bank_wal.py：预写日志 (WAL) + 快照，让账户状态可以持久化
+# ============================================
+# A08_class.py 里的 BankAccount 只存在于内存中，程序一退出余额就没了；_timestamp 也从来没用上。
+#
+# DurableBank 用数据库里常见的两件工具把状态保存到磁盘：
+# * 预写日志 (Write-Ahead Log)：每一笔开户 / 存款先以二进制记录追加写入日志文件，再修改内存中的余额。
+#   每条记录都带有时间戳和 CRC32 校验码，写到一半断电的“残缺记录”在恢复时能被识别出来并丢弃。
+# * 组提交 (group commit)：os.fsync 很慢 (要等磁盘真正落盘)，所以攒够 group_size 条记录才 fsync 一次。
+#   group_size=1 最安全；group_size 越大吞吐越高，但断电时最多可能丢失最后一组尚未 fsync 的记录。
+# * 快照 (snapshot)：定期把所有账户的当前状态“压缩”写成一个快照文件，并切换到新的日志段，旧日志段随即删除。
+#   恢复时先加载快照，再只重放快照之后的日志尾部，而不是从第一笔交易开始重放。
+#
+# 目录结构：
+#   snapshot.bin          最近一次快照
+#   wal-00000001.log      日志段 (编号递增)
+
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+
+_RECORD = struct.Struct('<BdQqH')     # 类型、时间戳、账户编号、金额、户主名长度
+_CRC = struct.Struct('<I')
+_SNAP_HEADER = struct.Struct('<4sQQQ') # 魔数、日志段编号、下一个账户编号、账户数量
+_SNAP_ACCOUNT = struct.Struct('<QqdH') # 账户编号、余额、时间戳、户主名长度
+_SNAP_MAGIC = b'SNAP'
+
+OPEN = 1
+DEPOSIT = 2
+
+SNAPSHOT_FILE = "snapshot.bin"
+
+def _segment_name(gen):
+    return f"wal-{gen:08d}.log"
+
+def _fsync_dir(directory):
+    # rename / 新建文件之后，目录本身也要 fsync，才能保证文件名落盘 (Windows 上不支持，跳过)
+    if hasattr(os, "O_DIRECTORY"):
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+class WriteAheadLog:
+    """只追加的二进制日志段，支持组提交"""
+
+    def __init__(self, path, group_size=64):
+        if group_size < 1:
+            raise ValueError("group_size 必须大于0！")
+        self.path = path
+        self.group_size = group_size
+        self._file = open(path, 'ab', buffering=1024 * 1024)
+        self._pending = 0 # 已写入但还没 fsync 的记录数
+
+    def append(self, kind, timestamp, account_id, amount, owner=""):
+        owner_bytes = owner.encode('utf-8')
+        body = _RECORD.pack(kind, timestamp, account_id, amount, len(owner_bytes)) + owner_bytes
+        self._file.write(body + _CRC.pack(zlib.crc32(body)))
+        self._pending += 1
+        if self._pending >= self.group_size:
+            self.sync()
+
+    def sync(self):
+        """把缓冲区写到操作系统，并 fsync 到磁盘"""
+        if self._pending:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._pending = 0
+
+    def close(self):
+        self.sync()
+        self._file.close()
+
+    @staticmethod
+    def replay(path):
+        """
+        逐条读出日志中的记录。
+
+        Yields:
+            tuple: (类型, 时间戳, 账户编号, 金额, 户主)。
+        遇到残缺或校验失败的记录就停止，并把文件截断到最后一条完整记录之后。
+        """
+        if os.path.getsize(path) == 0:
+            return
+        # 用 mmap 按需读取，千万条记录的日志也不必一次性读进内存
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            offset = 0
+            end = len(data)
+            while offset < end:
+                body_end = offset + _RECORD.size
+                if body_end > end:
+                    break
+                kind, timestamp, account_id, amount, owner_len = _RECORD.unpack_from(data, offset)
+                body_end += owner_len
+                if body_end + _CRC.size > end:
+                    break
+                (crc,) = _CRC.unpack_from(data, body_end)
+                if crc != zlib.crc32(data[offset:body_end]):
+                    break
+                owner = data[body_end - owner_len:body_end].decode('utf-8') if owner_len else ""
+                yield kind, timestamp, account_id, amount, owner
+                offset = body_end + _CRC.size
+        if offset < end:
+            with open(path, 'r+b') as f:
+                f.truncate(offset)
+
+
+class DurableBank:
+    """
+    带持久化的账户集合：每次 deposit() 都先写日志，再改内存。
+
+    Args:
+        directory (str): 保存日志和快照的目录，不存在时自动创建。
+        group_size (int): 每多少条记录 fsync 一次 (组提交窗口)。
+        snapshot_every (int or None): 每写入这么多条记录自动做一次快照。
+    """
+
+    def __init__(self, directory, group_size=64, snapshot_every=None):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.group_size = group_size
+        self.snapshot_every = snapshot_every
+        self._lock = threading.Lock()
+        self._balances = {}
+        self._owners = {}
+        self._timestamps = {} # 每个账户最后一次变动的时间
+        self._next_id = 0
+        self._since_snapshot = 0
+        self._gen = self._recover()
+        self._wal = WriteAheadLog(self._segment_path(self._gen), group_size)
+
+    def _segment_path(self, gen):
+        return os.path.join(self.directory, _segment_name(gen))
+
+    def _segments(self):
+        gens = []
+        for name in os.listdir(self.directory):
+            if name.startswith("wal-") and name.endswith(".log"):
+                gens.append(int(name[4:-4]))
+        return sorted(gens)
+
+    # ---------- 恢复 ----------
+
+    def _recover(self):
+        gen = self._load_snapshot()
+        for seg in self._segments():
+            if seg < gen:
+                os.remove(self._segment_path(seg)) # 已被快照覆盖的旧日志段
+                continue
+            for record in WriteAheadLog.replay(self._segment_path(seg)):
+                self._apply(*record)
+            gen = seg
+        return max(gen, 1)
+
+    def _load_snapshot(self):
+        path = os.path.join(self.directory, SNAPSHOT_FILE)
+        if not os.path.exists(path):
+            return 1
+        with open(path, 'rb') as f:
+            data = f.read()
+        (crc,) = _CRC.unpack_from(data, len(data) - _CRC.size)
+        if crc != zlib.crc32(data[:-_CRC.size]):
+            raise ValueError(f"快照文件已损坏: {path}")
+        magic, gen, next_id, count = _SNAP_HEADER.unpack_from(data, 0)
+        if magic != _SNAP_MAGIC:
+            raise ValueError(f"不是快照文件: {path}")
+        offset = _SNAP_HEADER.size
+        for _ in range(count):
+            account_id, balance, timestamp, owner_len = _SNAP_ACCOUNT.unpack_from(data, offset)
+            offset += _SNAP_ACCOUNT.size
+            self._owners[account_id] = data[offset:offset + owner_len].decode('utf-8')
+            self._balances[account_id] = balance
+            self._timestamps[account_id] = timestamp
+            offset += owner_len
+        self._next_id = next_id
+        return gen
+
+    def _apply(self, kind, timestamp, account_id, amount, owner):
+        if kind == OPEN:
+            self._balances[account_id] = amount
+            self._owners[account_id] = owner
+            self._next_id = max(self._next_id, account_id + 1)
+        elif kind == DEPOSIT:
+            self._balances[account_id] += amount
+        self._timestamps[account_id] = timestamp
+
+    # ---------- 写操作 ----------
+
+    def _log(self, kind, account_id, amount, owner=""):
+        # 调用者已持有 self._lock：先写日志，再改内存
+        timestamp = time.time()
+        self._wal.append(kind, timestamp, account_id, amount, owner)
+        self._apply(kind, timestamp, account_id, amount, owner)
+        self._since_snapshot += 1
+        if self.snapshot_every and self._since_snapshot >= self.snapshot_every:
+            self._snapshot_locked()
+
+    def open_account(self, owner, balance=0):
+        """开户，返回账户编号"""
+        if not isinstance(balance, int):
+            raise TypeError("余额必须是整数 (以分为单位)。")
+        with self._lock:
+            account_id = self._next_id
+            self._log(OPEN, account_id, balance, owner)
+            return account_id
+
+    def deposit(self, account_id, amount):
+        """存款，返回新的余额"""
+        if not isinstance(amount, int):
+            raise TypeError("存款金额必须是整数 (以分为单位)。")
+        if amount <= 0:
+            raise ValueError("存款金额必须大于0！")
+        with self._lock:
+            if account_id not in self._balances:
+                raise KeyError(f"账户 {account_id} 不存在")
+            self._log(DEPOSIT, account_id, amount)
+            return self._balances[account_id]
+
+    def get_balance(self, account_id):
+        """获取余额"""
+        return self._balances[account_id]
+
+    def get_timestamp(self, account_id):
+        """获取账户最后一次变动的时间戳 (time.time() 的返回值)"""
+        return self._timestamps[account_id]
+
+    def __len__(self):
+        return len(self._balances)
+
+    # ---------- 快照与关闭 ----------
+
+    def snapshot(self):
+        """立即做一次快照，并删除已经被快照覆盖的日志段"""
+        with self._lock:
+            self._snapshot_locked()
+
+    def _snapshot_locked(self):
+        # 1. 结束当前日志段，后续记录写入新的日志段
+        self._wal.close()
+        old_gen = self._gen
+        self._gen += 1
+        self._wal = WriteAheadLog(self._segment_path(self._gen), self.group_size)
+
+        # 2. 把当前状态写到临时文件，fsync 后再原子地 rename 成 snapshot.bin
+        parts = [_SNAP_HEADER.pack(_SNAP_MAGIC, self._gen, self._next_id, len(self._balances))]
+        for account_id, balance in self._balances.items():
+            owner_bytes = self._owners[account_id].encode('utf-8')
+            parts.append(_SNAP_ACCOUNT.pack(account_id, balance, self._timestamps[account_id], len(owner_bytes)))
+            parts.append(owner_bytes)
+        data = b''.join(parts)
+        path = os.path.join(self.directory, SNAPSHOT_FILE)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data + _CRC.pack(zlib.crc32(data)))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        _fsync_dir(self.directory)
+
+        # 3. 快照已经安全落盘，旧日志段不再需要
+        for seg in self._segments():
+            if seg <= old_gen:
+                os.remove(self._segment_path(seg))
+        self._since_snapshot = 0
+
+    def sync(self):
+        """强制把尚未 fsync 的记录落盘"""
+        with self._lock:
+            self._wal.sync()
+
+    def close(self):
+        with self._lock:
+            self._wal.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
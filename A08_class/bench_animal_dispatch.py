@@ -0,0 +1,73 @@
+# bench_animal_dispatch.py
+# 在 Dog / Cat / GoldenRetriever 混合的动物列表上，
+# 对比“逐个 make_animal_speak (每个对象 print 一次)”与“make_animals_speak 批量输出”。
+#
+# 用法：python bench_animal_dispatch.py [动物数量]
+
+import contextlib
+import os
+import random
+import sys
+import time
+
+from animal_dispatch import call_all, make_animals_speak
+from compact_animals import Cat, Dog, GoldenRetriever
+
+def make_animal_speak(animal_object):
+    # 与 A08_class.py 里的写法相同
+    print(animal_object.speak())
+
+def population(n, weights):
+    kinds = random.choices(["dog", "cat", "golden"], weights=weights, k=n)
+    return [
+        Dog("旺财") if kind == "dog" else
+        Cat("咪咪") if kind == "cat" else
+        GoldenRetriever("金宝", "网球")
+        for kind in kinds
+    ]
+
+def check_call_all_semantics():
+    # call_all 的结果必须和逐个 obj.speak() 相同：staticmethod、classmethod、实例上覆盖的方法都不能例外
+    class Robot:
+        @staticmethod
+        def speak():
+            return "哔哔"
+
+    class Parrot:
+        @classmethod
+        def speak(cls):
+            return cls.__name__
+
+    class Duck:
+        def speak(self):
+            return "嘎嘎"
+
+    quiet = Duck()
+    quiet.speak = lambda: "..."
+    objects = [Robot(), Parrot(), Duck(), quiet, Dog("旺财")]
+    assert call_all(objects, "speak") == [obj.speak() for obj in objects]
+
+if __name__ == "__main__":
+    check_call_all_semantics()
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    random.seed(0)
+
+    print(f"--- {n} 只动物，输出写到 {os.devnull} ---")
+    print(f"{'Dog:Cat:金毛':<14} {'逐个 print':>10} {'批量写出':>10} {'加速比':>8}")
+    with open(os.devnull, "w", encoding="utf-8") as devnull:
+        for weights in ((1, 1, 1), (8, 1, 1), (1, 1, 8)):
+            animals = population(n, weights)
+
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(devnull):
+                for animal in animals:
+                    make_animal_speak(animal)
+            loop_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            make_animals_speak(animals, file=devnull)
+            batch_time = time.perf_counter() - start
+
+            label = ":".join(map(str, weights))
+            print(f"{label:<14} {loop_time:>10.3f} {batch_time:>10.3f} {loop_time / batch_time:>7.1f}x")
+    print("-" * 30)
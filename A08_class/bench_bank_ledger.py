@@ -0,0 +1,55 @@
+# bench_bank_ledger.py
+# 锁竞争测试：线程数从 1 到 64，对比“一把全局锁 (stripes=1)”与“锁分段 (stripes=64)”。
+#
+# 用法：python bench_bank_ledger.py [账户数量] [每个线程的存款笔数]
+#
+# 注意：在有 GIL 的 CPython 上，同一时刻只有一个线程在执行字节码，锁分段能减少的只是“排队等锁”的时间；
+# 另外一批 100 笔随机账户的存款几乎会落到所有 64 个分段上，所以批量模式下两者差距不大。
+# 结果里最重要的是最后的断言：无论多少线程，都不会丢失任何一笔存款。
+
+import random
+import sys
+import threading
+import time
+
+from bank_ledger import Ledger
+
+BATCH_SIZE = 100
+
+def worker(ledger, accounts, deposits, seed):
+    rng = random.Random(seed)
+    for _ in range(deposits // BATCH_SIZE):
+        batch = [(rng.choice(accounts), 1) for _ in range(BATCH_SIZE)]
+        ledger.deposit_batch(batch)
+
+def run(stripes, threads, num_accounts, deposits):
+    ledger = Ledger(stripes=stripes)
+    accounts = [ledger.open_account(f"user{i}") for i in range(num_accounts)]
+    workers = [
+        threading.Thread(target=worker, args=(ledger, accounts, deposits, seed))
+        for seed in range(threads)
+    ]
+    start = time.perf_counter()
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    # 每笔存 1 元，总余额必须等于总笔数，否则说明有存款丢失
+    expected = threads * (deposits // BATCH_SIZE) * BATCH_SIZE
+    total = sum(ledger.get_balance(a) for a in accounts)
+    assert total == expected, f"余额不一致: {total} != {expected}"
+    return expected / elapsed
+
+if __name__ == "__main__":
+    num_accounts = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    deposits = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+
+    print(f"--- {num_accounts} 个账户，每个线程 {deposits} 笔存款 (每批 {BATCH_SIZE} 笔) ---")
+    print(f"{'线程数':>6} {'全局锁 笔/秒':>14} {'分段锁 笔/秒':>14}")
+    for threads in (1, 2, 4, 8, 16, 32, 64):
+        single = run(1, threads, num_accounts, deposits)
+        striped = run(64, threads, num_accounts, deposits)
+        print(f"{threads:>6} {single:>14,.0f} {striped:>14,.0f}")
+    print("-" * 30)
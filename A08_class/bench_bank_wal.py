@@ -0,0 +1,63 @@
+# bench_bank_wal.py
+# 1. 不同组提交窗口 (group_size) 下的存款吞吐量；
+# 2. 恢复时间：从头重放全部日志 vs 加载快照后只重放日志尾部。
+#
+# 用法：python bench_bank_wal.py [恢复测试的交易笔数]
+#   需求里的规模是 10^7 笔：python bench_bank_wal.py 10000000 (日志约 400MB)
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from bank_wal import DurableBank
+
+NUM_ACCOUNTS = 1000
+
+def fill(directory, transactions, group_size, snapshot_at=None):
+    bank = DurableBank(directory, group_size=group_size)
+    accounts = [bank.open_account(f"user{i}") for i in range(NUM_ACCOUNTS)]
+    start = time.perf_counter()
+    for i in range(transactions):
+        bank.deposit(accounts[i % NUM_ACCOUNTS], 1)
+        if snapshot_at is not None and i == snapshot_at:
+            bank.snapshot()
+    elapsed = time.perf_counter() - start
+    bank.close()
+    return transactions / elapsed
+
+def recover(directory):
+    start = time.perf_counter()
+    bank = DurableBank(directory)
+    elapsed = time.perf_counter() - start
+    total = sum(bank.get_balance(a) for a in range(NUM_ACCOUNTS))
+    bank.close()
+    return elapsed, total
+
+if __name__ == "__main__":
+    transactions = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    root = tempfile.mkdtemp(prefix="bank_wal_")
+    try:
+        print("--- 1. 组提交窗口与吞吐量 ---")
+        for group_size in (1, 8, 64, 512, 4096):
+            # group_size=1 时每笔都 fsync，非常慢，所以笔数按窗口大小缩放
+            n = min(transactions, 2000 * group_size)
+            directory = os.path.join(root, f"group{group_size}")
+            rate = fill(directory, n, group_size)
+            print(f"  group_size={group_size:<5} {n:>9} 笔  {rate:>12,.0f} 笔/秒")
+        print("-" * 30)
+
+        print(f"--- 2. {transactions} 笔交易的恢复时间 ---")
+        full_dir = os.path.join(root, "full")
+        fill(full_dir, transactions, 4096)
+        elapsed, total = recover(full_dir)
+        print(f"  重放全部日志        {elapsed:>8.2f} 秒  (总余额 {total})")
+
+        snap_dir = os.path.join(root, "snap")
+        fill(snap_dir, transactions, 4096, snapshot_at=transactions * 9 // 10)
+        elapsed, total = recover(snap_dir)
+        print(f"  快照 + 10% 日志尾部 {elapsed:>8.2f} 秒  (总余额 {total})")
+        print("-" * 30)
+    finally:
+        shutil.rmtree(root)
@@ -0,0 +1,102 @@
+# bench_book_catalog.py
+# 对比 Book 对象列表 (与 A08_class.py 相同) 和 BookCatalog：
+#   构建耗时、进程峰值 RSS 增量、总页数、页数直方图、按作者查书、str() 全部书 (两遍)、修改页数后重新求总页数。
+#   BookCatalog 的 str() 用 catalog.strings() 批量取；逐个 str(catalog[i]) 要创建行代理，比 Book 慢。
+#
+# 用法：python bench_book_catalog.py [书的数量]
+# 两种方式各在一个子进程里运行，峰值 RSS 互不干扰 (resource 模块仅在 Unix 上可用)。
+# 生成数据时每本书的作者名都是新字符串：Book 列表每本书各存一份，BookCatalog 同名作者只留一份。
+# BookCatalog 的总页数 / 直方图是增量维护的，所以查询几乎不花时间；代价摊在了构建和修改上。
+# str() 第一遍两者都要拼接字符串，第二遍 BookCatalog 直接用缓存——缓存本身也要占内存，
+# 所以表格里 BookCatalog 的 RSS 是在渲染之前测的。
+
+import multiprocessing
+import random
+import resource
+import sys
+import time
+from collections import Counter
+
+from book_catalog import BookCatalog
+
+# ---------- 与 A08_class.py 相同的 Book ----------
+class Book:
+    def __init__(self, title, author, pages):
+        self.title = title
+        self.author = author
+        self.pages = pages
+
+    def __str__(self):
+        return f"《{self.title}》 by {self.author}"
+
+    def __repr__(self):
+        return f"Book(title='{self.title}', author='{self.author}')"
+
+    def __len__(self):
+        return self.pages
+
+AUTHORS = 50000
+
+def generate(n):
+    rng = random.Random(1)
+    for i in range(n):
+        yield f"书名{i}", f"作者{rng.randrange(AUTHORS)}", rng.randrange(50, 1500)
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, (time.perf_counter() - start) * 1000
+
+def run(kind, n, queue):
+    base_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    data = generate(n)
+    if kind == "Book 列表":
+        books, t_build = timed(lambda: [Book(*item) for item in data])
+        rss_mb = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - base_rss) / 1024
+        total, t_total = timed(lambda: sum(map(len, books)))
+        histogram, t_hist = timed(lambda: Counter(len(book) // 100 for book in books))
+        found, t_author = timed(lambda: [book for book in books if book.author == "作者42"])
+        _, t_str1 = timed(lambda: list(map(str, books)))
+        _, t_str2 = timed(lambda: list(map(str, books)))
+
+        def update():
+            for i in range(0, n, 100):
+                books[i].pages += 1
+            return sum(map(len, books))
+    else:
+        catalog, t_build = timed(lambda: BookCatalog(data))
+        rss_mb = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - base_rss) / 1024
+        total, t_total = timed(lambda: catalog.total_pages)
+        histogram, t_hist = timed(catalog.page_histogram)
+        found, t_author = timed(lambda: catalog.by_author("作者42"))
+        _, t_str1 = timed(catalog.strings)
+        _, t_str2 = timed(catalog.strings)
+
+        def update():
+            pages = catalog._pages
+            for i in range(0, n, 100):
+                catalog.set_pages(i, pages[i] + 1)
+            return catalog.total_pages
+    new_total, t_update = timed(update)
+    queue.put({
+        "results": (total, sum(histogram.values()), sorted(map(str, found)), new_total),
+        "row": (t_build, rss_mb, t_total, t_hist, t_author, t_str1, t_str2, t_update),
+    })
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    print(f"--- {n} 本书，{AUTHORS} 位作者；时间单位 ms ---")
+    print(f"{'方式':<12}{'构建':>9}{'RSS MB':>9}{'总页数':>10}{'直方图':>10}{'按作者':>10}"
+          f"{'str 第1遍':>11}{'str 第2遍':>11}{'改页数+总页数':>14}")
+    results = []
+    for kind in ("Book 列表", "BookCatalog"):
+        queue = multiprocessing.Queue()
+        proc = multiprocessing.Process(target=run, args=(kind, n, queue))
+        proc.start()
+        item = queue.get()
+        proc.join()
+        results.append(item["results"])
+        print(f"{kind:<12}" + "".join(f"{value:>10.3f}" for value in item["row"]))
+    assert results[0] == results[1], "两种方式的结果不一致"
+    print("-" * 30)
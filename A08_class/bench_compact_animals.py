@@ -0,0 +1,97 @@
+# bench_compact_animals.py
+# 对比三种表示方式的内存 (进程峰值 RSS) 和属性访问耗时：
+#   1. 普通类 (与 A08_class.py 相同，每个实例带 __dict__)
+#   2. __slots__ 类
+#   3. AnimalTable 结构数组
+#
+# 用法：python bench_compact_animals.py [动物数量]
+# AnimalTable 用时间换空间：每次访问都要临时创建一个行代理，所以单次访问会慢一个数量级；
+# 它适合“存得多、按列批量处理”的场景，频繁逐个访问的热点代码更适合 __slots__ 类。
+#
+# 每种方式都在单独的子进程里构建，这样测到的峰值 RSS 互不干扰 (resource 模块仅在 Unix 上可用)。
+
+import multiprocessing
+import resource
+import sys
+import time
+
+import compact_animals
+
+# ---------- 与 A08_class.py 相同的普通类 ----------
+class Animal:
+    def __init__(self, name):
+        self.name = name
+
+    def speak(self):
+        raise NotImplementedError("子类必须实现这个方法")
+
+class Dog(Animal):
+    def speak(self):
+        return f"{self.name} 说: 汪汪！"
+
+class Cat(Animal):
+    def speak(self):
+        return f"{self.name} 说: 喵喵！"
+
+class GoldenRetriever(Dog):
+    def __init__(self, name, favorite_toy):
+        super().__init__(name)
+        self.favorite_toy = favorite_toy
+
+    def fetch(self):
+        return f"{self.name} 叼回了它的 {self.favorite_toy}！"
+
+def build_objects(module, n):
+    return [
+        module.Dog("旺财") if i % 3 == 0 else
+        module.Cat("咪咪") if i % 3 == 1 else
+        module.GoldenRetriever("金宝", "网球")
+        for i in range(n)
+    ]
+
+def build_table(n):
+    table = compact_animals.AnimalTable()
+    for i in range(n):
+        if i % 3 == 0:
+            table.append(compact_animals.Dog, "旺财")
+        elif i % 3 == 1:
+            table.append(compact_animals.Cat, "咪咪")
+        else:
+            table.append(compact_animals.GoldenRetriever, "金宝", "网球")
+    return table
+
+def measure(kind, n, queue):
+    base_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if kind == "普通类":
+        animals = build_objects(sys.modules[__name__], n)
+    elif kind == "__slots__":
+        animals = build_objects(compact_animals, n)
+    else:
+        animals = build_table(n)
+    rss_mb = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - base_rss) / 1024 # Linux 上单位是 KB
+
+    # 属性访问：读取 name；AnimalTable 每次 table[i] 都要创建一个行代理
+    start = time.perf_counter()
+    for animal in animals:
+        animal.name
+    per_access_ns = (time.perf_counter() - start) / n * 1e9
+
+    start = time.perf_counter()
+    for animal in animals:
+        animal.speak()
+    per_speak_ns = (time.perf_counter() - start) / n * 1e9
+    queue.put((rss_mb, per_access_ns, per_speak_ns))
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 3_000_000
+
+    print(f"--- {n} 只动物 (Dog / Cat / GoldenRetriever 各占三分之一) ---")
+    print(f"{'方式':<12} {'RSS 增量 MB':>12} {'name ns':>10} {'speak() ns':>12}")
+    for kind in ("普通类", "__slots__", "AnimalTable"):
+        queue = multiprocessing.Queue()
+        proc = multiprocessing.Process(target=measure, args=(kind, n, queue))
+        proc.start()
+        rss_mb, access_ns, speak_ns = queue.get()
+        proc.join()
+        print(f"{kind:<12} {rss_mb:>12.1f} {access_ns:>10.1f} {speak_ns:>12.1f}")
+    print("-" * 30)
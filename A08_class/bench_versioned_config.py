@@ -0,0 +1,114 @@
+# bench_versioned_config.py
+# 读取共享配置的开销对比 (每次读取的纳秒数，已减去空循环的耗时)：
+#   普通类变量     —— A08_class.py 的 Car.wheels 写法，通过实例读取
+#   加锁的属性     —— 每次读取都 with lock: 的 property
+#   Setting 描述符 —— versioned_config 的写法，通过实例读取 (不加锁)
+#   固定的快照     —— 请求开始时 Car.snapshot() 取一次，之后读 snapshot.wheels
+# 然后开一个写者线程不停地同时修改 wheels 和 doors (两者始终相等)，
+# 读者在每个“请求”里读两次，统计读到两者不相等 (看到“改了一半”的配置) 的次数。
+#
+# 用法：python bench_versioned_config.py [读取次数]
+# Setting 的读取要调用一次 Python 层的 __get__，比普通类变量慢；热路径上应该固定快照，
+# 读快照的字段是 C 实现的 namedtuple 属性，和普通类变量差不多快，并且整个请求内版本一致。
+
+import sys
+import threading
+import time
+from itertools import repeat
+
+from versioned_config import Configurable, Setting
+
+class PlainCar:
+    wheels = 4
+    doors = 4
+
+class LockedCar:
+    _lock = threading.Lock()
+    _wheels = 4
+
+    @property
+    def wheels(self):
+        with self._lock:
+            return self._wheels
+
+class Car(Configurable):
+    wheels = Setting(4)
+    doors = Setting(4)
+
+def per_read_ns(get_object, n):
+    obj = get_object()
+    start = time.perf_counter()
+    for _ in repeat(None, n):
+        pass
+    empty = time.perf_counter() - start
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in repeat(None, n):
+            obj.wheels
+        best = min(best, time.perf_counter() - start)
+    return (best - empty) / n * 1e9
+
+def torn_reads(cls, requests, publish):
+    """写者线程不停发布新配置时，读者在 requests 个请求里看到 wheels != doors 的次数"""
+    stop = threading.Event()
+
+    def writer():
+        value = 4
+        while not stop.is_set():
+            value += 1
+            publish(value)
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    torn = 0
+    try:
+        for _ in range(requests):
+            if cls is Car:
+                config = Car.snapshot() # 固定这个请求使用的版本
+                wheels, doors = config.wheels, config.doors
+            else:
+                wheels, doors = cls.wheels, cls.doors
+            torn += wheels != doors
+    finally:
+        stop.set()
+        thread.join()
+    return torn
+
+def publish_plain(value):
+    # 逐项 setattr，和从配置文件读出一个字典再一项项赋值一样；两项之间可能切换到读者线程
+    for name, new_value in {"wheels": value, "doors": value}.items():
+        setattr(PlainCar, name, new_value)
+
+def check_subclass_is_separate():
+    # 子类有自己的一份配置：修改子类不影响父类，反之亦然
+    class Truck(Car):
+        pass
+    Truck.wheels = 8
+    assert (Car.wheels, Truck.wheels, Truck().wheels) == (4, 8, 8)
+    Car.doors = 2
+    assert (Car.doors, Truck.doors) == (2, 4)
+    Car.doors = 4
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    check_subclass_is_separate()
+    sys.setswitchinterval(1e-5) # 让线程切换更频繁，更容易撞上“改了一半”的时刻
+
+    print(f"每次读取的耗时 (取 5 轮中最快的一轮)，共 {n} 次\n")
+    for label, get_object in (
+        ("普通类变量", PlainCar),
+        ("加锁的属性", LockedCar),
+        ("Setting 描述符", lambda: Car()),
+        ("固定的快照", Car.snapshot),
+    ):
+        print(f"{label:<16}{per_read_ns(get_object, n):>8.1f} ns")
+
+    requests = 200_000
+    print(f"\n写者线程不停修改时，{requests} 个请求中读到不一致配置的次数：")
+    print(f"  普通类变量 (逐项赋值)      {torn_reads(PlainCar, requests, publish_plain):>8}")
+    print(f"  固定快照 (configure 发布)  {torn_reads(Car, requests, lambda v: Car.configure(wheels=v, doors=v)):>8}")
+    print(f"  最终版本号: {Car.snapshot().version}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+# ============================================
+#   book_catalog.py：按列存储的大型图书目录
+# ============================================
+# A08_class.py 里的 Book 每本书是一个带 __dict__ 的对象，len(book) 返回页数，
+# __str__ / __repr__ 每次调用都用 f-string 重新拼一遍字符串。
+# 几百万本书时，“总页数”“页数分布”“某位作者的书”这些问题都要把所有对象遍历一遍。
+#
+# BookCatalog 换一种存法：
+# * 按列存储：书名一列 (list)、作者一列 (array('I') 里存作者编号，同一位作者的名字只存一份)、
+#   页数一列 (array('I'))；catalog[i] 返回一个轻量的“行代理”，用法和 Book 一样 (title / author / len())；
+# * 作者哈希索引：作者名 -> 行号列表，按作者查书不用扫描整列；
+# * 增量维护的聚合值：总页数、按 bucket_size 分组的页数直方图，在 append / set_pages / remove 时顺手更新，
+#   查询时直接返回，不用遍历；
+# * str / repr 只在第一次用到时拼接，之后从缓存里取 (书名和作者不可修改，缓存不会失效)；
+#   strings() 一次取出所有书的 str()，省掉逐个创建行代理的开销。
+# 删除用“墓碑”标记：行号保持不变，被删除的行不再出现在索引、聚合和遍历里。
+
+from array import array
+from itertools import compress
+
+DEFAULT_BUCKET_SIZE = 100 # 直方图每组的页数跨度
+
+
+class _BookRow:
+    """catalog[i] 返回的行代理，和 Book 一样有 title / author / pages，len() 是页数"""
+    __slots__ = ("_catalog", "_row")
+
+    def __init__(self, catalog, row):
+        self._catalog = catalog
+        self._row = row
+
+    @property
+    def title(self):
+        return self._catalog._titles[self._row]
+
+    @property
+    def author(self):
+        catalog = self._catalog
+        return catalog._author_names[catalog._author_ids[self._row]]
+
+    @property
+    def pages(self):
+        return self._catalog._pages[self._row]
+
+    def __len__(self):
+        return self._catalog._pages[self._row]
+
+    def __str__(self):
+        return self._catalog.render(self._row)
+
+    def __repr__(self):
+        return self._catalog.render_repr(self._row)
+
+
+class BookCatalog:
+    """
+    按列存储的图书目录。
+
+    Args:
+        books (iterable or None): 初始的 (title, author, pages) 序列。
+        bucket_size (int): 页数直方图每组的跨度。
+    """
+
+    def __init__(self, books=None, bucket_size=DEFAULT_BUCKET_SIZE):
+        self._titles = []
+        self._author_ids = array('I')
+        self._pages = array('I')
+        self._alive = bytearray()  # 1 = 正常，0 = 已删除
+        self._author_names = []    # 作者编号 -> 作者名
+        self._author_codes = {}    # 作者名 -> 作者编号
+        self._by_author = {}       # 作者编号 -> [行号, ...]
+        self._str_cache = []       # 行号 -> str 或 None (还没拼接过)
+        self._repr_cache = []
+        self._bucket_size = bucket_size
+        self._histogram = {}       # 组号 -> 本数
+        self._count = 0
+        self._total_pages = 0
+        if books is not None:
+            self.extend(books)
+
+    # ---------- 添加 / 修改 / 删除 ----------
+
+    def _author_code(self, author):
+        code = self._author_codes.get(author)
+        if code is None:
+            code = self._author_codes[author] = len(self._author_names)
+            self._author_names.append(author)
+            self._by_author[code] = []
+        return code
+
+    def append(self, title, author, pages):
+        """添加一本书，返回行号"""
+        if pages < 0:
+            raise ValueError("页数不能为负数")
+        row = len(self._titles)
+        code = self._author_code(author)
+        self._pages.append(pages) # 页数超出 array('I') 的范围时在这里报错，此时还没有修改任何一列
+        self._titles.append(title)
+        self._author_ids.append(code)
+        self._alive.append(1)
+        self._str_cache.append(None)
+        self._repr_cache.append(None)
+        self._by_author[code].append(row)
+        bucket = pages // self._bucket_size
+        self._histogram[bucket] = self._histogram.get(bucket, 0) + 1
+        self._count += 1
+        self._total_pages += pages
+        return row
+
+    def extend(self, books):
+        """批量添加 (title, author, pages)：作者名边读边换成编号，各列一次性 extend，聚合值按整批更新"""
+        titles, codes, pages = [], array('I'), array('I')
+        author_code = self._author_code
+        for title, author, page_count in books:
+            if page_count < 0:
+                raise ValueError("页数不能为负数")
+            titles.append(title)
+            codes.append(author_code(author))
+            pages.append(page_count)
+        if not titles:
+            return
+        by_author = self._by_author
+        for row, code in enumerate(codes, len(self._titles)):
+            by_author[code].append(row)
+        bucket_size = self._bucket_size
+        histogram = self._histogram
+        for page_count in pages:
+            bucket = page_count // bucket_size
+            histogram[bucket] = histogram.get(bucket, 0) + 1
+        self._titles += titles
+        self._author_ids += codes
+        self._pages += pages
+        self._alive += b"\x01" * len(titles)
+        self._str_cache += [None] * len(titles)
+        self._repr_cache += [None] * len(titles)
+        self._count += len(titles)
+        self._total_pages += sum(pages)
+
+    def _check_row(self, row):
+        if not 0 <= row < len(self._titles) or not self._alive[row]:
+            raise IndexError(f"没有第 {row} 行 (超出范围或已删除)")
+
+    def set_pages(self, row, pages):
+        """修改某本书的页数，同时更新总页数和直方图"""
+        self._check_row(row)
+        if pages < 0:
+            raise ValueError("页数不能为负数")
+        old = self._pages[row]
+        self._pages[row] = pages
+        self._move_bucket(old, -1)
+        self._move_bucket(pages, 1)
+        self._total_pages += pages - old
+
+    def remove(self, row):
+        """删除某本书 (行号不会复用，其他书的行号不变)"""
+        self._check_row(row)
+        pages = self._pages[row]
+        self._alive[row] = 0
+        self._by_author[self._author_ids[row]].remove(row)
+        self._move_bucket(pages, -1)
+        self._count -= 1
+        self._total_pages -= pages
+        self._str_cache[row] = self._repr_cache[row] = None
+
+    def _move_bucket(self, pages, delta):
+        bucket = pages // self._bucket_size
+        count = self._histogram.get(bucket, 0) + delta
+        if count:
+            self._histogram[bucket] = count
+        else:
+            del self._histogram[bucket]
+
+    # ---------- 访问 ----------
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, row):
+        self._check_row(row)
+        return _BookRow(self, row)
+
+    def __iter__(self):
+        """按行号顺序遍历所有未删除的书"""
+        find = self._alive.find
+        row = find(1)
+        while row != -1:
+            yield _BookRow(self, row)
+            row = find(1, row + 1)
+
+    def rows(self):
+        """所有未删除的行号"""
+        return list(compress(range(len(self._alive)), self._alive))
+
+    def render(self, row):
+        """第 row 本书的 str()，与 Book.__str__ 相同，拼接一次后缓存"""
+        text = self._str_cache[row]
+        if text is None:
+            self._check_row(row)
+            text = self._str_cache[row] = f"《{self._titles[row]}》 by {self._author_names[self._author_ids[row]]}"
+        return text
+
+    def render_repr(self, row):
+        """第 row 本书的 repr()，与 Book.__repr__ 相同，拼接一次后缓存"""
+        text = self._repr_cache[row]
+        if text is None:
+            self._check_row(row)
+            text = self._repr_cache[row] = (
+                f"Book(title='{self._titles[row]}', author='{self._author_names[self._author_ids[row]]}')")
+        return text
+
+    def strings(self):
+        """所有未删除的书的 str()，按行号顺序；还没拼接过的先一次性补齐，之后直接从缓存取"""
+        cache, alive = self._str_cache, self._alive
+        if None in compress(cache, alive):
+            names, author_ids, titles = self._author_names, self._author_ids, self._titles
+            for row in compress(range(len(cache)), alive):
+                if cache[row] is None:
+                    cache[row] = f"《{titles[row]}》 by {names[author_ids[row]]}"
+        return list(compress(cache, alive))
+
+    # ---------- 查询 ----------
+
+    @property
+    def total_pages(self):
+        return self._total_pages
+
+    def mean_pages(self):
+        return self._total_pages / self._count if self._count else 0.0
+
+    def page_histogram(self):
+        """
+        页数分布。
+
+        Returns:
+            dict: {(下限, 上限): 本数}，按页数从小到大排列，上限不含在内。
+        """
+        size = self._bucket_size
+        return {(bucket * size, (bucket + 1) * size): self._histogram[bucket] for bucket in sorted(self._histogram)}
+
+    def authors(self):
+        """所有 (还有书的) 作者"""
+        return [self._author_names[code] for code, rows in self._by_author.items() if rows]
+
+    def author_rows(self, author):
+        """某位作者所有书的行号 (没有这位作者时返回空列表)"""
+        code = self._author_codes.get(author)
+        return [] if code is None else list(self._by_author[code])
+
+    def by_author(self, author):
+        """某位作者的所有书 (行代理)"""
+        return [_BookRow(self, row) for row in self.author_rows(author)]
+
+    def author_pages(self, author):
+        """某位作者所有书的总页数"""
+        code = self._author_codes.get(author)
+        if code is None:
+            return 0
+        return sum(map(self._pages.__getitem__, self._by_author[code]))
@@ -0,0 +1,123 @@
+# ============================================
+#   compact_animals.py：省内存的 Animal / Dog / Cat / GoldenRetriever
+# ============================================
+# A08_class.py 里的动物类每个实例都带着一个 __dict__ (实例字典)，用来存 name、favorite_toy 等属性。
+# 字典很灵活，但一个实例光是“壳”就要一百多字节。几千万个对象时，这部分开销非常可观。
+#
+# 这里提供两种紧凑的表示：
+# 1. __slots__ 版本的类：在类里声明 __slots__ = ("name",)，实例就不再有 __dict__，
+#    属性直接存放在对象内部固定的位置上，更省内存、访问也更快。代价是不能再随意添加新属性。
+# 2. AnimalTable：“结构数组” (struct of arrays)。不再为每只动物创建对象，
+#    而是把所有动物的类型、名字、玩具分别存成几列；table[i] 返回一个轻量的“行代理”，
+#    它同样有 speak() / fetch()，并且 isinstance(table[i], Dog) 依然成立——多态保持不变。
+
+from array import array
+
+# ---------- 1. __slots__ 版本 ----------
+
+class Animal:
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+    def speak(self):
+        raise NotImplementedError("子类必须实现这个方法")
+
+class Dog(Animal):
+    __slots__ = () # 子类也要声明 __slots__ (可以为空)，否则又会带上 __dict__
+
+    def speak(self):
+        return f"{self.name} 说: 汪汪！"
+
+class Cat(Animal):
+    __slots__ = ()
+
+    def speak(self):
+        return f"{self.name} 说: 喵喵！"
+
+class GoldenRetriever(Dog):
+    __slots__ = ("favorite_toy",)
+
+    def __init__(self, name, favorite_toy):
+        super().__init__(name)
+        self.favorite_toy = favorite_toy
+
+    def fetch(self):
+        return f"{self.name} 叼回了它的 {self.favorite_toy}！"
+
+
+# ---------- 2. AnimalTable：结构数组 + 行代理 ----------
+# 行代理继承自上面的类，所以 speak() / fetch() 直接复用，不用再写一遍；
+# 它们只是把 name / favorite_toy 改成从表格的列里读取。
+
+class _RowMixin:
+    __slots__ = ()
+
+    def __init__(self, table, row):
+        self._table = table
+        self._row = row
+
+    @property
+    def name(self):
+        return self._table._names[self._row]
+
+    def __repr__(self):
+        return f"<{type(self).__mro__[2].__name__} 行 {self._row}: {self.name}>"
+
+class _DogRow(_RowMixin, Dog):
+    __slots__ = ("_table", "_row")
+
+class _CatRow(_RowMixin, Cat):
+    __slots__ = ("_table", "_row")
+
+class _GoldenRetrieverRow(_RowMixin, GoldenRetriever):
+    __slots__ = ("_table", "_row")
+
+    @property
+    def favorite_toy(self):
+        return self._table._toys[self._row]
+
+# 类型编号 -> (类, 行代理类)
+_KINDS = [(Dog, _DogRow), (Cat, _CatRow), (GoldenRetriever, _GoldenRetrieverRow)]
+_KIND_CODES = {cls: code for code, (cls, _) in enumerate(_KINDS)}
+
+
+class AnimalTable:
+    """按列存储大量动物：每只动物只占一个类型字节 + 一个名字引用"""
+
+    def __init__(self):
+        self._kinds = array('B') # 每只动物 1 字节的类型编号
+        self._names = []
+        self._toys = {}          # 只有金毛才有玩具，所以用 行号 -> 玩具 的稀疏字典
+
+    def append(self, cls, name, favorite_toy=None):
+        """添加一只动物，cls 是 Dog、Cat 或 GoldenRetriever，返回行号"""
+        code = _KIND_CODES.get(cls)
+        if code is None:
+            raise TypeError(f"不支持的动物类型: {cls}")
+        row = len(self._names)
+        if cls is GoldenRetriever:
+            self._toys[row] = favorite_toy
+        self._kinds.append(code)
+        self._names.append(name)
+        return row
+
+    def __getitem__(self, row):
+        if row < 0:
+            row += len(self._names)
+        if not 0 <= row < len(self._names):
+            raise IndexError("AnimalTable 行号超出范围")
+        return _KINDS[self._kinds[row]][1](self, row)
+
+    def __len__(self):
+        return len(self._names)
+
+    def __iter__(self):
+        row_classes = [row_cls for _, row_cls in _KINDS]
+        for row, code in enumerate(self._kinds):
+            yield row_classes[code](self, row)
+
+    def count(self, cls):
+        """统计某个具体类型的动物数量 (不含子类；直接数类型列，不创建任何对象)"""
+        return self._kinds.count(_KIND_CODES[cls])
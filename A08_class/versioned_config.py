@@ -0,0 +1,158 @@
+# ============================================
+#   versioned_config.py：带版本号的共享配置 (写时复制)
+# ============================================
+# A08_class.py 第四部分里，Car.wheels = 3 会立刻、悄无声息地影响所有 Car 实例：
+# 正在处理中的请求可能前半段读到 4、后半段读到 3；car1.wheels = 5 又会悄悄地只改这一个实例。
+#
+# 这里把这类“读得很多、偶尔修改”的类级配置改成 Setting 描述符：
+# * 所有配置项存在一个不可变的快照里 (namedtuple，带版本号)，修改时不改旧快照，
+#   而是复制出一个新快照，再用一次赋值把“当前快照”换掉 (写时复制，copy-on-write)；
+# * 读取 Car.wheels / car.wheels 只是读出当前快照里的一个字段，不加锁——
+#   换快照是一次原子的引用赋值，读者要么看到旧快照，要么看到新快照，不会看到“改了一半”的状态；
+#   只有写者之间用一把锁排队，保证版本号连续、configure() 一次改多项时不会互相覆盖；
+# * Car.wheels = 3 (或 Car.configure(wheels=3, doors=2)) 发布新版本；car.wheels = 5 直接报错；
+# * 一个请求开始时调用 Car.snapshot() 并一直使用这个快照 (“固定”住它)，
+#   整个请求期间读到的配置都来自同一个版本，即使中途有人发布了新配置。
+# 列表、字典、集合类型的值会被转换成 tuple / 只读字典 / frozenset (tuple 里面的也一样)，防止有人原地修改快照。
+# 子类有自己的一份配置：创建子类时复制父类当前的快照，之后 Sub.wheels = 8 只影响子类，Car.wheels 不变。
+
+import threading
+from collections import namedtuple
+from types import MappingProxyType
+
+def _freeze(value):
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, tuple):
+        items = [_freeze(item) for item in value]
+        return type(value)._make(items) if hasattr(value, "_fields") else tuple(items) # namedtuple 保留类型
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+class Setting:
+    """
+    类级配置项描述符，只能用在 metaclass=ConfigMeta 的类里 (或继承 Configurable)。
+
+    Args:
+        default: 初始值。
+        validate (callable or None): validate(value) 不合法时抛出异常，发布新值之前调用。
+    """
+
+    def __init__(self, default, validate=None):
+        self.default = default
+        self.validate = validate
+        self.name = None
+        self._index = 0 # 在快照 namedtuple 里的位置 (ConfigMeta 创建类时填入，子类的快照里位置相同)
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        # 热路径：几次属性读取 + 一次下标，不加锁；owner 是实际的类，子类读到的是自己的那份配置
+        return owner._config_state.current[self._index]
+
+    def __set__(self, instance, value):
+        raise AttributeError(
+            f"{self.name} 是共享配置，不能在实例上修改；请用 {type(instance).__name__}.{self.name} = ... 发布新版本")
+
+    def __delete__(self, instance):
+        raise AttributeError(f"{self.name} 是共享配置，不能删除")
+
+
+class _ConfigState:
+    """一个类的全部配置项：当前快照 + 写者锁"""
+
+    def __init__(self, owner, settings, parent=None):
+        """parent 不为 None 时，复制父类的配置项和当前快照 (子类自己的一份配置)"""
+        self.owner = owner
+        self.lock = threading.Lock()
+        if parent is not None:
+            self.settings = parent.settings
+            self.snapshot_type = namedtuple(f"{owner.__name__}Config", parent.snapshot_type._fields)
+            self.current = self.snapshot_type._make(parent.current)
+            return
+        for setting in settings:
+            if setting.name == "version" or setting.name.startswith("_"):
+                raise TypeError(f"{owner.__name__}.{setting.name}: 配置项不能叫 version，也不能以下划线开头")
+        self.settings = {setting.name: setting for setting in settings}
+        self.snapshot_type = namedtuple(f"{owner.__name__}Config", ["version", *self.settings])
+        for index, setting in enumerate(settings, 1):
+            if setting.validate is not None:
+                setting.validate(setting.default)
+            setting._index = index
+        self.current = self.snapshot_type(0, *(_freeze(setting.default) for setting in settings))
+
+    def publish(self, changes):
+        unknown = changes.keys() - self.settings.keys()
+        if unknown:
+            raise AttributeError(f"{self.owner.__name__} 没有配置项: {', '.join(sorted(unknown))}")
+        frozen = {}
+        for name, value in changes.items():
+            validate = self.settings[name].validate
+            if validate is not None:
+                validate(value)
+            frozen[name] = _freeze(value)
+        with self.lock:
+            current = self.current
+            # 先把新快照完整地构造出来，最后一步才替换 current
+            self.current = current._replace(version=current.version + 1, **frozen)
+            return self.current
+
+
+class ConfigMeta(type):
+    """
+    让类里的 Setting 成为带版本号的共享配置：
+    Cls.name = value 发布新版本，Cls.configure(...) 一次修改多项，Cls.snapshot() 取出当前快照。
+    """
+
+    def __new__(mcls, name, bases, namespace, **kwargs):
+        cls = super().__new__(mcls, name, bases, namespace, **kwargs)
+        settings = [value for value in namespace.values() if isinstance(value, Setting)]
+        parent = getattr(cls, "_config_state", None) # 来自父类 (MRO 上第一个有配置的类)
+        if settings:
+            if parent is not None:
+                raise TypeError(f"{name}: 配置项只能定义在同一个类里，子类直接继承父类的配置")
+            type.__setattr__(cls, "_config_state", _ConfigState(cls, settings))
+        elif parent is not None:
+            # 子类复制父类当前的快照，之后两边各自发布，互不影响
+            type.__setattr__(cls, "_config_state", _ConfigState(cls, (), parent))
+        else:
+            type.__setattr__(cls, "_config_state", None)
+        return cls
+
+    def __setattr__(cls, name, value):
+        state = cls._config_state
+        if state is not None and name in state.settings:
+            state.publish({name: value})
+        else:
+            super().__setattr__(name, value)
+
+    def __delattr__(cls, name):
+        state = cls._config_state
+        if state is not None and name in state.settings:
+            raise AttributeError(f"{name} 是共享配置，不能删除")
+        super().__delattr__(name)
+
+    def configure(cls, **changes):
+        """一次发布多项修改 (只产生一个新版本)，返回新的快照"""
+        return cls._require_state().publish(changes)
+
+    def snapshot(cls):
+        """
+        当前配置的不可变快照，字段是 version 和各配置项。
+        在请求开始时取一次并一直使用它，请求期间读到的配置就不会变。
+        """
+        return cls._require_state().current
+
+    def _require_state(cls):
+        if cls._config_state is None:
+            raise TypeError(f"{cls.__name__} 没有定义任何 Setting")
+        return cls._config_state
+
+
+class Configurable(metaclass=ConfigMeta):
+    """方便继承的基类：class Car(Configurable): wheels = Setting(4)"""